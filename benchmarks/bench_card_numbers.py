@@ -0,0 +1,41 @@
+"""
+Пропускная способность генераторов номеров карт, номеров в секунду.
+
+Запуск:
+    python -m benchmarks.bench_card_numbers [количество_номеров]
+"""
+import sys
+import time
+from collections import deque
+
+from src.pythonproject.generators import card_number_chunks, card_number_generator, write_card_numbers
+
+START = 4000_0000_0000_0000
+
+
+def legacy_generator(start: int, end: int):
+    for num in range(start, end + 1):
+        yield f"{num:016d}"[:4] + " " + f"{num:016d}"[4:8] + " " + \
+            f"{num:016d}"[8:12] + " " + f"{num:016d}"[12:16]
+
+
+def timed(label: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {count / elapsed / 1e6:8.2f} млн номеров/с")
+
+
+def main(count: int) -> None:
+    end = START + count - 1
+    timed("исходный генератор", count, lambda: deque(legacy_generator(START, end), maxlen=0))
+    timed("card_number_generator", count, lambda: deque(card_number_generator(START, end), maxlen=0))
+    timed("card_number_chunks", count, lambda: deque(card_number_chunks(START, end), maxlen=0))
+    body = START // 10
+    timed("card_number_chunks(luhn=True)", count,
+          lambda: deque(card_number_chunks(body, body + count - 1, luhn=True), maxlen=0))
+    timed("write_card_numbers -> bytearray", count, lambda: write_card_numbers(START, end, bytearray()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,65 @@
+"""
+Сортировка и форматирование дат: datetime.fromisoformat/strftime на каждый
+вызов против dates.date_keys/format_date и заранее вычисленных ключей.
+
+Замеры идут дважды: на повторяющихся датах (различных_дат штук) и на
+уникальных датах, как в реальной выгрузке; ускорение считается
+относительно sorted(key=datetime.fromisoformat) и fromisoformat + strftime.
+
+Запуск:
+    python -m benchmarks.bench_dates [количество_операций] [различных_дат]
+"""
+import sys
+import time
+from datetime import datetime
+
+from src.pythonproject.dates import date_keys, format_date
+from src.pythonproject.processing import sort_by_date
+
+
+def make_operations(count: int, distinct: int):
+    dates = [f"20{i % 20 + 10:02d}-{i % 12 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:{i % 59:02d}.{i:06d}"
+             for i in range(distinct)]
+    return [{"id": i, "date": dates[(i * 7919) % distinct]} for i in range(count)]
+
+
+def timed(label: str, func, repeat: int = 3, baseline: float = 0.0) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    speedup = f"  ускорение {baseline / best:5.2f}x" if baseline else ""
+    print(f"{label:<36} {best:8.3f} c{speedup}")
+    return best
+
+
+def run(count: int, distinct: int) -> None:
+    operations = make_operations(count, distinct)
+    kind = "повторяющиеся" if distinct < count else "уникальные"
+    print(f"Операций: {count}, различных дат: {distinct} ({kind})")
+
+    def baseline_sort():
+        sorted(operations, key=lambda op: datetime.fromisoformat(op["date"]), reverse=True)
+
+    def baseline_render():
+        for op in operations:
+            datetime.fromisoformat(op["date"]).strftime("%d.%m.%Y")
+
+    keys = date_keys(operations)
+
+    sort_baseline = timed("sorted(fromisoformat)", baseline_sort)
+    timed("sort_by_date", lambda: sort_by_date(operations), baseline=sort_baseline)
+    timed("sort_by_date(keys=...)", lambda: sort_by_date(operations, keys=keys), baseline=sort_baseline)
+    render_baseline = timed("fromisoformat + strftime", baseline_render)
+    timed("format_date", lambda: [format_date(op["date"]) for op in operations], baseline=render_baseline)
+
+
+def main(count: int, distinct: int) -> None:
+    run(count, distinct)
+    run(count, count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10_000)
@@ -0,0 +1,56 @@
+"""
+Время импорта пакета: только маскировка против загрузки кода обработки.
+
+Каждый сценарий запускается в отдельном интерпретаторе; из медианного
+времени вычитается время пустого запуска Python. Байткод кэшируется во
+временном каталоге, поэтому замеры не включают компиляцию.
+
+Запуск:
+    python -m benchmarks.bench_import [количество_запусков]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "пустой запуск": "pass",
+    "маскировка (pythonproject)": "import src.pythonproject as p; p.get_mask_account('73654108430135874305')",
+    "pythonproject.processing": "import src.pythonproject.processing",
+    "pythonproject.widget": "import src.pythonproject.widget",
+}
+HEAVY_MODULES = ("typing", "datetime", "json", "decimal", "src.pythonproject.processing")
+
+_REPORT_MODULES = "import sys; print(','.join(m for m in {modules!r} if m in sys.modules))"
+
+
+def run_once(code: str, env: dict) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
+    return time.perf_counter() - started
+
+
+def main(runs: int) -> None:
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        timings = {}
+        for label, code in SCENARIOS.items():
+            run_once(code, env)  # прогрев: компиляция и запись байткода
+            timings[label] = statistics.median(run_once(code, env) for _ in range(runs))
+
+        empty = timings.pop("пустой запуск")
+        for label, seconds in timings.items():
+            code = SCENARIOS[label] + "; " + _REPORT_MODULES.format(modules=HEAVY_MODULES)
+            loaded = subprocess.run(
+                [sys.executable, "-c", code], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+            ).stdout.strip()
+            print(f"{label:<28} {(seconds - empty) * 1000:7.1f} мс  загружены: {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,74 @@
+"""
+Сравнение потоковой загрузки операций с json.load по памяти и скорости.
+
+Запуск:
+    python -m benchmarks.bench_loader [количество_операций]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.pythonproject.generators import filter_by_currency
+from src.pythonproject.loader import iter_operations
+
+CURRENCIES = ("USD", "EUR", "RUB")
+STATES = ("EXECUTED", "CANCELED", "PENDING")
+
+
+def write_operations(path: str, count: int) -> None:
+    """Пишет синтетический JSON-массив операций, не держа его в памяти."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(count):
+            if i:
+                f.write(",")
+            json.dump({
+                "id": i,
+                "state": STATES[i % 3],
+                "date": f"2019-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:50:58.294041",
+                "operationAmount": {
+                    "amount": f"{i % 100000}.{i % 100:02d}",
+                    "currency": {"name": CURRENCIES[i % 3], "code": CURRENCIES[i % 3]}
+                },
+                "description": "Перевод организации",
+                "from": f"Visa Platinum {i:016d}",
+                "to": f"Счет {i:020d}"
+            }, f, ensure_ascii=False)
+        f.write("]")
+
+
+def measure(label: str, func) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {count:>10} USD  {elapsed:8.2f} c  пик {peak / 2 ** 20:10.1f} МБ")
+
+
+def main(count: int) -> None:
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        write_operations(path, count)
+        print(f"Файл: {os.path.getsize(path) / 2 ** 20:.1f} МБ, операций: {count}")
+
+        def load_all() -> int:
+            with open(path, encoding="utf-8") as f:
+                return sum(1 for _ in filter_by_currency(json.load(f), "USD"))
+
+        def stream() -> int:
+            return sum(1 for _ in filter_by_currency(iter_operations(path), "USD"))
+
+        measure("json.load", load_all)
+        measure("iter_ops", stream)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,48 @@
+"""
+MaskingCache против поштучного mask_account_card на повторяющихся описаниях.
+
+Запуск:
+    python -m benchmarks.bench_masking_cache [количество_вызовов] [различных_описаний]
+"""
+import sys
+import time
+
+from benchmarks.dataset import operations_list
+from src.pythonproject.masking_cache import MaskingCache
+from src.pythonproject.widget import mask_account_card
+
+
+def best_time(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(count: int, distinct: int) -> None:
+    unique = [op["description"] for op in operations_list(distinct)]
+    descriptions = [unique[i % distinct] for i in range(count)]
+
+    def run(mask) -> None:
+        for description in descriptions:
+            mask(description)
+
+    baseline = best_time(lambda: run(mask_account_card))
+    print(f"{count} вызовов, {distinct} различных описаний")
+    print(f"{'без кэша':<28} {baseline:8.3f} c")
+    for label, cache in [
+        ("MaskingCache (hash)", MaskingCache()),
+        ("MaskingCache (строки)", MaskingCache(hash_keys=False)),
+        ("MaskingCache (BLAKE2b)", MaskingCache(digest_keys=True)),
+    ]:
+        elapsed = best_time(lambda: run(cache))
+        print(f"{label:<28} {elapsed:8.3f} c  ускорение {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2_000,
+    )
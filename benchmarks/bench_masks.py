@@ -0,0 +1,43 @@
+"""
+Пакетная маскировка против поштучных get_mask_card_number/get_mask_account.
+
+Запуск:
+    python -m benchmarks.bench_masks [количество_номеров]
+"""
+import sys
+import time
+
+from src.pythonproject.masks import get_mask_account, get_mask_card_number, mask_accounts_bulk, mask_cards_bulk
+
+
+def timed(label: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed:8.3f} c  {count / elapsed / 1e6:6.2f} млн/с")
+
+
+def scalar(mask, numbers):
+    result = []
+    for number in numbers:
+        try:
+            result.append(mask(number))
+        except ValueError:
+            result.append("")
+    return result
+
+
+def main(count: int) -> None:
+    cards = [f"{i * 7919 % 10 ** 16:016d}" if i % 100 else "bad" for i in range(count)]
+    accounts = [f"{i * 7919:020d}" for i in range(count)]
+    buffer = "".join(c if len(c) == 16 else "x" * 16 for c in cards).encode("ascii")
+
+    timed("get_mask_card_number (цикл)", count, lambda: scalar(get_mask_card_number, cards))
+    timed("mask_cards_bulk (список)", count, lambda: mask_cards_bulk(cards))
+    timed("mask_cards_bulk (буфер bytes)", count, lambda: mask_cards_bulk(buffer))
+    timed("get_mask_account (цикл)", count, lambda: scalar(get_mask_account, accounts))
+    timed("mask_accounts_bulk (список)", count, lambda: mask_accounts_bulk(accounts))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,57 @@
+"""
+Память и скорость: словари операций против записей Operation.
+
+Память считается через tracemalloc: словари -- как после json.loads
+выгрузки, записи -- после перевода из словарей и удаления словарей.
+
+Запуск:
+    python -m benchmarks.bench_operation [количество_операций]
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.dataset import operations_list
+from src.pythonproject.generators import filter_by_currency
+from src.pythonproject.operation import operations_from_dicts
+from src.pythonproject.processing import filter_by_state, sort_by_date
+
+
+def timed(label: str, func) -> None:
+    started = time.perf_counter()
+    func()
+    print(f"{label:<40} {time.perf_counter() - started:8.3f} c")
+
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used
+
+
+def main(count: int) -> None:
+    text = json.dumps(operations_list(count), ensure_ascii=False)
+
+    dicts, dict_bytes = measure(lambda: json.loads(text))
+    del dicts
+    records, record_bytes = measure(lambda: operations_from_dicts(json.loads(text)))
+    print(f"{'словари':<40} {dict_bytes / count:8.0f} байт/операция")
+    print(f"{'Operation':<40} {record_bytes / count:8.0f} байт/операция")
+
+    dicts = json.loads(text)
+    timed("filter_by_currency (словари)", lambda: list(filter_by_currency(dicts, "USD")))
+    timed("filter_by_currency (Operation)", lambda: list(filter_by_currency(records, "USD")))
+    timed("filter_by_state (словари)", lambda: filter_by_state(dicts))
+    timed("filter_by_state (Operation)", lambda: filter_by_state(records))
+    timed("sort_by_date (словари)", lambda: sort_by_date(dicts))
+    timed("sort_by_date (Operation)", lambda: sort_by_date(records))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
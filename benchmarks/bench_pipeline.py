@@ -0,0 +1,48 @@
+"""
+Масштабирование параллельного отчета по числу процессов.
+
+Запуск:
+    python -m benchmarks.bench_pipeline [количество_операций] [размер_порции]
+"""
+import sys
+import time
+
+from src.pythonproject.pipeline import render_operations_parallel
+from src.pythonproject.widget import get_date, mask_account_card
+from src.pythonproject.processing import sort_by_date
+
+DESCRIPTIONS = ("Visa Platinum {:016d}", "Счет {:020d}", "Maestro {:016d}")
+
+
+def make_operations(count: int):
+    return [
+        {
+            "id": i,
+            "state": "EXECUTED" if i % 3 else "CANCELED",
+            "date": f"20{i % 20 + 10:02d}-{i % 12 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:00.{i:06d}"[:26],
+            "description": DESCRIPTIONS[i % 3].format(i * 7919),
+        }
+        for i in range(count)
+    ]
+
+
+def main(count: int, chunk_size: int) -> None:
+    operations = make_operations(count)
+    print(f"Операций: {count}, порция: {chunk_size}")
+
+    started = time.perf_counter()
+    expected = [f"{get_date(op['date'])} {mask_account_card(op['description'])}" for op in sort_by_date(operations)]
+    serial = time.perf_counter() - started
+    print(f"{'последовательно':<16} {serial:8.2f} c")
+
+    for workers in (1, 2, 4, 8):
+        started = time.perf_counter()
+        lines = list(render_operations_parallel(operations, workers=workers, chunk_size=chunk_size))
+        elapsed = time.perf_counter() - started
+        assert lines == expected
+        print(f"{workers:>2} процесс(ов)    {elapsed:8.2f} c  ускорение {serial / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50_000)
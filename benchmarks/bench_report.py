@@ -0,0 +1,40 @@
+"""
+Сравнение построчного print() с буферизованным report.render_operations.
+
+Запуск:
+    python -m benchmarks.bench_report [количество_операций]
+"""
+import os
+import sys
+import time
+
+from benchmarks.dataset import operations_list
+from src.pythonproject.report import render_operations
+from src.pythonproject.widget import get_date, mask_account_card
+
+
+def per_line_print(operations, out) -> None:
+    for op in operations:
+        try:
+            print(f"{get_date(op['date'])} {mask_account_card(op['description'])}", file=out)
+        except (KeyError, ValueError):
+            continue
+
+
+def main(count: int) -> None:
+    operations = operations_list(count)
+    # Построчная буферизация -- как у sys.stdout, подключенного к терминалу
+    with open(os.devnull, "w", encoding="utf-8", buffering=1) as text_out, open(os.devnull, "wb") as binary_out:
+        for label, func in (
+                ("print() на каждую строку", lambda: per_line_print(operations, text_out)),
+                ("render_operations text", lambda: render_operations(operations, binary_out)),
+                ("render_operations csv", lambda: render_operations(operations, binary_out, "csv")),
+                ("render_operations jsonl", lambda: render_operations(operations, binary_out, "jsonl")),
+        ):
+            started = time.perf_counter()
+            func()
+            print(f"{label:<28} {time.perf_counter() - started:8.3f} c", flush=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
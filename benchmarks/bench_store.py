@@ -0,0 +1,57 @@
+"""
+Сравнение загрузки операций из JSON и из бинарного хранилища (store).
+
+Запуск:
+    python -m benchmarks.bench_store [количество_операций]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_loader import write_operations
+from src.pythonproject.loader import iter_operations
+from src.pythonproject.processing import filter_by_state, sort_by_date
+from src.pythonproject.store import OperationStore, write_store
+
+
+def timed(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {time.perf_counter() - started:10.4f} c", flush=True)
+    return result
+
+
+def main(count: int) -> None:
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, "operations.json")
+    store_path = os.path.join(directory, "operations.bin")
+    try:
+        write_operations(json_path, count)
+        timed("write_store из JSON", lambda: write_store(iter_operations(json_path), store_path))
+        print(f"JSON: {os.path.getsize(json_path) / 2 ** 20:.1f} МБ, "
+              f"хранилище: {os.path.getsize(store_path) / 2 ** 20:.1f} МБ, операций: {count}")
+
+        def from_json():
+            with open(json_path, encoding="utf-8") as f:
+                operations = json.load(f)
+            return sort_by_date(filter_by_state(operations))
+
+        timed("json.load + filter + sort", from_json)
+
+        store = timed("OperationStore (открытие)", lambda: OperationStore(store_path))
+        try:
+            timed("store: filter_by_state", lambda: filter_by_state(store))
+            timed("store: sort_by_date", lambda: sort_by_date(store))
+        finally:
+            store.close()
+    finally:
+        for path in (json_path, store_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
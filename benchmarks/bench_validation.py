@@ -0,0 +1,59 @@
+"""
+Пакетная проверка описаний против поштучного mask_account_card с исключениями.
+
+Запуск:
+    python -m benchmarks.bench_validation [количество_описаний]
+"""
+import sys
+import time
+
+from src.pythonproject.masks import mask_account_card
+from src.pythonproject.validation import mask_descriptions_bulk, validate_descriptions
+
+PREFIXES = ("Visa Platinum", "Maestro", "MasterCard", "Счет", "МИР")
+
+
+def timed(label: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {elapsed:8.3f} c  {count / elapsed / 1e6:6.2f} млн/с")
+
+
+def luhn_ok(number: str) -> bool:
+    total = 0
+    for position, digit in enumerate(reversed(number)):
+        value = int(digit) * (2 if position % 2 else 1)
+        total += value - 9 if value > 9 else value
+    return total % 10 == 0
+
+
+def scalar(descriptions, luhn: bool):
+    masked = []
+    for description in descriptions:
+        try:
+            result = mask_account_card(description)
+            if luhn and "**" in result and not result.startswith("Счет") and not luhn_ok(description[-16:]):
+                result = ""
+        except (ValueError, TypeError):
+            result = ""
+        masked.append(result)
+    return masked
+
+
+def main(count: int) -> None:
+    descriptions = []
+    for i in range(count):
+        prefix = PREFIXES[i % len(PREFIXES)]
+        number = f"{i * 7919:020d}" if prefix == "Счет" else f"{i * 7919 % 10 ** 16:016d}"
+        descriptions.append(f"{prefix} {number}" if i % 100 else "Перевод организации")
+
+    timed("mask_account_card (цикл)", count, lambda: scalar(descriptions, luhn=False))
+    timed("mask_descriptions_bulk", count, lambda: mask_descriptions_bulk(descriptions))
+    timed("mask_account_card + Луна (цикл)", count, lambda: scalar(descriptions, luhn=True))
+    timed("validate_descriptions + mask", count, lambda: validate_descriptions(descriptions).mask())
+    print(validate_descriptions(descriptions).counts())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
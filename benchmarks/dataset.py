@@ -0,0 +1,60 @@
+"""
+Детерминированный генератор реалистичных синтетических операций.
+
+Состав близок к реальной выгрузке: разные статусы и валюты, описания
+с картами и счетами ("Счет ..."), операции без поля "from" и небольшая
+доля испорченных дат вроде "invalid-date".
+"""
+import random
+from typing import Any, Dict, Iterator, List
+
+STATES = ("EXECUTED", "CANCELED", "PENDING")
+STATE_WEIGHTS = (60, 25, 15)
+CURRENCIES = (("руб.", "RUB"), ("USD", "USD"), ("EUR", "EUR"))
+CURRENCY_WEIGHTS = (70, 20, 10)
+CARD_TYPES = ("Visa Classic", "Visa Platinum", "Visa Gold", "Maestro", "MasterCard", "МИР")
+MALFORMED_DATES = ("invalid-date", "", "2019-13-45T25:61:61.000000")
+
+
+def _account_string(rng: random.Random) -> str:
+    if rng.random() < 0.4:
+        return f"Счет {rng.randrange(10 ** 19, 10 ** 20)}"
+    return f"{rng.choice(CARD_TYPES)} {rng.randrange(10 ** 15, 10 ** 16)}"
+
+
+def generate_operations(count: int, seed: int = 42, malformed_date_rate: float = 0.01) -> Iterator[Dict[str, Any]]:
+    """
+    Генерирует count операций; одинаковые count и seed дают одинаковый результат.
+
+    Examples:
+        >>> list(generate_operations(2)) == list(generate_operations(2))
+        True
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        if rng.random() < malformed_date_rate:
+            date = rng.choice(MALFORMED_DATES)
+        else:
+            date = (f"{rng.randrange(2015, 2025)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+                    f"T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}"
+                    f".{rng.randrange(10 ** 6):06d}")
+        name, code = rng.choices(CURRENCIES, CURRENCY_WEIGHTS)[0]
+        operation: Dict[str, Any] = {
+            "id": 100_000_000 + i,
+            "state": rng.choices(STATES, STATE_WEIGHTS)[0],
+            "date": date,
+            "operationAmount": {
+                "amount": f"{rng.randrange(1, 10 ** 7) / 100:.2f}",
+                "currency": {"name": name, "code": code},
+            },
+            "description": _account_string(rng),
+            "to": _account_string(rng),
+        }
+        if rng.random() < 0.9:
+            operation["from"] = _account_string(rng)
+        yield operation
+
+
+def operations_list(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """То же, что generate_operations, но списком."""
+    return list(generate_operations(count, seed))
@@ -0,0 +1,249 @@
+"""
+Набор регрессионных бенчмарков для публичных функций masks, processing,
+generators и widget.
+
+Время одного вызова -- лучшее из нескольких замеров, каждый замер длится
+не меньше MIN_DURATION (число вызовов подбирается, как в timeit.Timer.autorange),
+поэтому быстрые функции на 10K не упираются в разрешение таймера и помехи. Результаты
+сравниваются с базовыми из JSON-файла; замедление больше порога приводит
+к коду выхода 1.
+
+Запуск:
+    python -m benchmarks.regression                       # 10K, сравнение с baselines.json
+    python -m benchmarks.regression --sizes 10000,1000000,10000000 --save
+    python -m benchmarks.regression --threshold 0.3
+
+Наборы больше LIST_LIMIT целиком в память не помещаются (10M операций --
+около 11 ГБ), поэтому для них замеряются только STREAM_CASES: их входные
+данные (номера, описания, количество) собираются потоково из генератора.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import timeit
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from benchmarks.dataset import generate_operations, operations_list
+from src.pythonproject import generators, masks, processing, widget
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_THRESHOLD = 0.25
+# Эталонная нагрузка, по которой результаты приводятся к скорости текущей машины
+CALIBRATION = "_calibration"
+
+# Минимальная длительность одного замера в секундах
+MIN_DURATION = 0.2
+# Наибольший набор, который держится в памяти списком
+LIST_LIMIT = 1_000_000
+
+# Бенчмарк: подготовка данных из набора операций (вне замера) и замеряемая функция
+Case = Tuple[Callable[[List[Dict[str, Any]]], Any], Callable[[Any], Any]]
+
+
+class _OperationStream:
+    """Набор без хранения операций: длина известна, каждый обход заново генерирует операции."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return generate_operations(self.size)
+
+
+def _exhaust(iterator) -> None:
+    deque(iterator, maxlen=0)
+
+
+def _same(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return ops
+
+
+def _card_numbers(ops: Iterable[Dict[str, Any]]) -> List[str]:
+    return [op["description"].rsplit(" ", 1)[1] for op in ops if not op["description"].startswith("Счет")]
+
+
+def _account_numbers(ops: Iterable[Dict[str, Any]]) -> List[str]:
+    return [op["description"].rsplit(" ", 1)[1] for op in ops if op["description"].startswith("Счет")]
+
+
+def _safe(func: Callable[[Any], Any], values: List[Any]) -> None:
+    for value in values:
+        try:
+            func(value)
+        except ValueError:
+            pass
+
+
+def _valid_operations(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    valid = []
+    for op in ops:
+        try:
+            widget.get_date(op["date"])
+        except ValueError:
+            continue
+        valid.append(op)
+    return valid
+
+
+def _print(ops: List[Dict[str, Any]]) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        widget.print_operations(ops)
+
+
+CASES: Dict[str, Case] = {
+    "masks.get_mask_card_number": (_card_numbers, lambda cards: _safe(masks.get_mask_card_number, cards)),
+    "masks.get_mask_account": (_account_numbers, lambda accounts: _safe(masks.get_mask_account, accounts)),
+    "masks.mask_cards_bulk": (_card_numbers, masks.mask_cards_bulk),
+    "masks.mask_accounts_bulk": (_account_numbers, masks.mask_accounts_bulk),
+    "processing.filter_by_state": (_same, processing.filter_by_state),
+    "processing.sort_by_date": (_same, processing.sort_by_date),
+    "processing.latest_operations": (_same, lambda ops: processing.latest_operations(ops, 20, "EXECUTED")),
+    "processing.latest_operations_page": (
+        _same, lambda ops: processing.latest_operations_page(ops, 100, 20, "EXECUTED")),
+    "generators.filter_by_currency": (_same, lambda ops: _exhaust(generators.filter_by_currency(ops, "USD"))),
+    "generators.transaction_descriptions": (_same, lambda ops: _exhaust(generators.transaction_descriptions(ops))),
+    "generators.card_number_generator": (len, lambda count: _exhaust(generators.card_number_generator(1, count))),
+    "generators.card_number_chunks": (len, lambda count: _exhaust(generators.card_number_chunks(1, count))),
+    "generators.write_card_numbers": (len, lambda count: generators.write_card_numbers(1, count, bytearray())),
+    "widget.mask_account_card": (
+        lambda ops: [op["description"] for op in ops], lambda items: _safe(widget.mask_account_card, items)),
+    "widget.get_date": (lambda ops: [op["date"] for op in ops], lambda dates: _safe(widget.get_date, dates)),
+    "widget.print_operations": (_valid_operations, _print),
+}
+
+
+# Бенчмарки для наборов больше LIST_LIMIT; бенчмарки с общей подготовкой идут подряд,
+# чтобы входные данные собирались один раз
+STREAM_CASES = (
+    "masks.get_mask_card_number",
+    "masks.mask_cards_bulk",
+    "masks.get_mask_account",
+    "masks.mask_accounts_bulk",
+    "generators.card_number_generator",
+    "generators.card_number_chunks",
+    "generators.write_card_numbers",
+    "widget.mask_account_card",
+)
+
+
+def _calibration_workload() -> None:
+    data = [str(i * 7919 % 100_003) for i in range(100_000)]
+    data.sort()
+    {item: len(item) for item in data}
+
+
+def _best_time(func: Callable[[Any], Any], data: Any, repeat: int) -> float:
+    """Лучшее время одного вызова из repeat замеров длительностью не меньше MIN_DURATION."""
+    timer = timeit.Timer(lambda: func(data))
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < MIN_DURATION:
+        number *= 10 if elapsed < MIN_DURATION / 10 else 2
+        elapsed = timer.timeit(number)
+    best = elapsed / number
+    if repeat > 1:
+        best = min(best, min(timer.repeat(repeat - 1, number)) / number)
+    return best
+
+
+def run(sizes: List[int], repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Запускает все бенчмарки; возвращает {размер: {функция: секунды}}."""
+    results: Dict[str, Dict[str, float]] = {}
+    for size in sizes:
+        if size > LIST_LIMIT:
+            ops: Any = _OperationStream(size)
+            names = STREAM_CASES
+        else:
+            ops = operations_list(size)
+            names = tuple(CASES)
+        timings = results[str(size)] = {}
+        calibration = _best_time(lambda _: _calibration_workload(), None, max(repeat, 3))
+        prepared: Tuple[Any, Any] = (None, None)
+        for name in names:
+            prepare, func = CASES[name]
+            if prepared[0] is not prepare:
+                prepared = (None, None)
+                prepared = (prepare, prepare(ops))
+            best = _best_time(func, prepared[1], repeat if size <= LIST_LIMIT else 1)
+            timings[name] = best
+            print(f"{size:>10} {name:<40} {best:10.4f} c", flush=True)
+        del ops, prepared
+        # Эталон замеряется до и после набора: берется лучшее, чтобы не зависеть от разовых помех
+        timings[CALIBRATION] = min(calibration, _best_time(lambda _: _calibration_workload(), None, max(repeat, 3)))
+    return results
+
+
+def compare(
+        current: Dict[str, Dict[str, float]],
+        baseline: Dict[str, Dict[str, float]],
+        threshold: float = DEFAULT_THRESHOLD
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Возвращает замедления больше порога: (размер, функция, базовое, текущее).
+
+    Функции и размеры, которых нет в базовом файле, не проверяются. Если
+    в обоих наборах есть замер эталонной нагрузки, базовое время
+    масштабируется на отношение эталонов: так сравнение не зависит от того,
+    что машина в целом стала быстрее или медленнее.
+
+    Examples:
+        >>> compare({"10": {"f": 1.3, "g": 1.0}}, {"10": {"f": 1.0, "g": 1.0}}, threshold=0.25)
+        [('10', 'f', 1.0, 1.3)]
+    """
+    regressions = []
+    for size, timings in current.items():
+        base_timings = baseline.get(size, {})
+        scale = 1.0
+        if timings.get(CALIBRATION) and base_timings.get(CALIBRATION):
+            scale = timings[CALIBRATION] / base_timings[CALIBRATION]
+        for name, seconds in timings.items():
+            base = base_timings.get(name)
+            if name != CALIBRATION and base is not None and seconds > base * scale * (1 + threshold):
+                regressions.append((size, name, base * scale, seconds))
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000", help="размеры наборов через запятую")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON-файл с базовыми результатами")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое замедление (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=3, help="повторов на замер")
+    parser.add_argument("--save", action="store_true", help="записать результаты как новые базовые")
+    args = parser.parse_args(argv)
+
+    results = run([int(size) for size in args.sizes.split(",")], args.repeat)
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Базовые результаты сохранены в {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Нет файла базовых результатов {args.baseline}; запустите с --save")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for size, name, base, seconds in regressions:
+        print(f"РЕГРЕССИЯ {size} {name}: {base:.4f} c -> {seconds:.4f} c (+{(seconds / base - 1) * 100:.0f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,4 +1,4 @@
-from src.widget import mask_account_card, get_date
+from src.pythonproject.widget import mask_account_card, get_date
 
 # Примеры работы функций
 print(mask_account_card("Visa Platinum 7000792289606361"))  # Visa Platinum 7000 79** **** 6361
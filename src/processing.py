@@ -1,73 +1,44 @@
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+"""
+Прежний модуль обработки операций, оставленный для совместимости.
 
+Реализация находится в pythonproject.processing; отсюда sort_by_date
+вызывается в строгом режиме дат, как и раньше. Как и прежде, функции
+принимают любые итерируемые (кортежи, генераторы), а не только списки.
+"""
+from typing import Any, Dict, Iterable, List
 
-def filter_by_state(operations: List[Dict[str, Any]], state: str = 'EXECUTED') -> List[Dict[str, Any]]:
-    """
-    Фильтрует список операций по значению ключа 'state'.
+from .pythonproject.processing import filter_by_state as _filter_by_state
+from .pythonproject.processing import sort_by_date as _sort_by_date
 
-    Args:
-        operations: Список словарей с банковскими операциями.
-                   Каждая операция должна содержать ключ 'state'.
-        state: Значение состояния для фильтрации. По умолчанию 'EXECUTED'.
+__all__ = ["filter_by_state", "sort_by_date"]
 
-    Returns:
-        Новый список операций, где каждая операция имеет указанное состояние.
 
-    Raises:
-        KeyError: Если в какой-либо операции отсутствует ключ 'state'.
+def filter_by_state(operations: Iterable[Dict[str, Any]], state: str = 'EXECUTED') -> List[Dict[str, Any]]:
+    """
+    Фильтрует список операций по значению ключа 'state'.
 
     Examples:
-        >>> operations = [
-        ...     {'id': 1, 'state': 'EXECUTED'},
-        ...     {'id': 2, 'state': 'CANCELED'}
-        ... ]
-        >>> filter_by_state(operations)
+        >>> filter_by_state([{'id': 1, 'state': 'EXECUTED'}, {'id': 2, 'state': 'CANCELED'}])
         [{'id': 1, 'state': 'EXECUTED'}]
     """
     if not operations:
         return []
-
-    return [op for op in operations if op.get('state') == state]
+    # Ядро принимает только списки, а прежние функции -- любые итерируемые
+    return _filter_by_state(list(operations), state)
 
 
-def sort_by_date(operations: List[Dict[str, Any]], reverse: bool = True) -> List[Dict[str, Any]]:
+def sort_by_date(operations: Iterable[Dict[str, Any]], reverse: bool = True) -> List[Dict[str, Any]]:
     """
     Сортирует список операций по дате (ключ 'date').
 
-    Args:
-        operations: Список словарей с банковскими операциями.
-                   Каждая операция должна содержать ключ 'date' в формате ISO.
-        reverse: Если True - сортировка по убыванию (новые сначала),
-                 если False - по возрастанию (старые сначала).
-
-    Returns:
-        Новый список операций, отсортированный по дате.
-
     Raises:
         KeyError: Если в какой-либо операции отсутствует ключ 'date'.
         ValueError: Если дата в неверном формате.
 
     Examples:
-        >>> operations = [
-        ...     {'id': 1, 'date': '2023-01-01'},
-        ...     {'id': 2, 'date': '2023-01-02'}
-        ... ]
-        >>> sort_by_date(operations)
+        >>> sort_by_date([{'id': 1, 'date': '2023-01-01'}, {'id': 2, 'date': '2023-01-02'}])
         [{'id': 2, 'date': '2023-01-02'}, {'id': 1, 'date': '2023-01-01'}]
     """
     if not operations:
         return []
-
-    def get_date(op: Dict[str, Any]) -> datetime:
-        try:
-            return datetime.fromisoformat(op['date'])
-        except KeyError:
-            raise KeyError(f"Операция {op.get('id', 'без ID')} не содержит ключа 'date'")
-        except ValueError:
-            raise ValueError(f"Неверный формат даты в операции {op.get('id', 'без ID')}: {op['date']}")
-
-    return sorted(operations, key=get_date, reverse=reverse)
-
-
-
+    return _sort_by_date(list(operations), reverse, errors="strict")
@@ -1,6 +1,45 @@
 """
 Модуль для маскировки банковских карт и счетов
+
+Функции маскировки загружаются сразу, остальные подмодули (processing,
+widget, generators и др.) -- при первом обращении к ним или к их функциям
+через пакет, например pythonproject.sort_by_date. Поэтому импорт пакета
+ради маскировки не загружает datetime, typing и код обработки операций.
 """
-from .masks import get_mask_account, get_mask_card_number
+from .masks import get_mask_account, get_mask_card_number, mask_account_card, mask_accounts_bulk, mask_cards_bulk
+
+__all__ = ["get_mask_card_number", "get_mask_account", "mask_account_card", "mask_cards_bulk", "mask_accounts_bulk"]
+
+_SUBMODULES = frozenset({
+    "aggregate", "async_streams", "batch", "cluster", "dates", "external_sort", "generators", "index", "instrument",
+    "loader", "masking_cache", "metrics", "operation", "pipeline", "processing", "query", "report", "sorted_log",
+    "store", "validation", "widget",
+})
+
+# Функции подмодулей, доступные как атрибуты пакета
+_LAZY_FUNCTIONS = {
+    "filter_by_state": "processing",
+    "sort_by_date": "processing",
+    "latest_operations": "processing",
+    "get_date": "widget",
+    "print_operations": "widget",
+    "filter_by_currency": "generators",
+    "transaction_descriptions": "generators",
+    "card_number_generator": "generators",
+    "iter_operations": "loader",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        from importlib import import_module
+        return import_module(f"{__name__}.{name}")
+    if name in _LAZY_FUNCTIONS:
+        value = getattr(__getattr__(_LAZY_FUNCTIONS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["get_mask_card_number", "get_mask_account"]
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_FUNCTIONS))
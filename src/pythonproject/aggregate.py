@@ -0,0 +1,284 @@
+import os
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from .batch import AMOUNT_SCALE, format_amount, parse_amount
+from .operation import Operation
+from .pipeline import CHUNKS_IN_FLIGHT_PER_WORKER, iter_chunks
+
+DEFAULT_CHUNK_SIZE = 50_000
+# Сколько разобранных сумм копить по группам перед сверткой в AmountStats
+_FOLD_SIZE = 1 << 16
+
+KeyFunc = Callable[[Dict[str, Any]], Any]
+GroupBy = Union[str, KeyFunc]
+
+
+class AmountStats:
+    """
+    Частичный агрегат сумм одной группы в минимальных единицах (копейках).
+
+    Суммы хранятся целыми числами, поэтому агрегаты порций можно сливать
+    в любом порядке с точно тем же результатом, что и при одном проходе.
+    Операции с неразбираемой суммой не входят в count/total, а учитываются
+    в invalid.
+    """
+
+    __slots__ = ("count", "total", "minimum", "maximum", "invalid")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        self.invalid = 0
+
+    def add(self, amount: Optional[int]) -> None:
+        if amount is None:
+            self.invalid += 1
+            return
+        self.count += 1
+        self.total += amount
+        if self.minimum is None or amount < self.minimum:
+            self.minimum = amount
+        if self.maximum is None or amount > self.maximum:
+            self.maximum = amount
+
+    def add_many(self, amounts: List[Optional[int]]) -> None:
+        """Добавляет сразу много сумм: свертка выполняется встроенными sum/min/max."""
+        invalid = amounts.count(None)
+        if invalid:
+            self.invalid += invalid
+            amounts = [amount for amount in amounts if amount is not None]
+        if not amounts:
+            return
+        self.count += len(amounts)
+        self.total += sum(amounts)
+        low, high = min(amounts), max(amounts)
+        if self.minimum is None or low < self.minimum:
+            self.minimum = low
+        if self.maximum is None or high > self.maximum:
+            self.maximum = high
+
+    def merge(self, other: "AmountStats") -> None:
+        """Добавляет к агрегату другой частичный агрегат той же группы."""
+        self.count += other.count
+        self.total += other.total
+        self.invalid += other.invalid
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+
+    @property
+    def mean(self) -> Optional[Decimal]:
+        """Средняя сумма в основных единицах (рублях, долларах) или None для пустой группы."""
+        if not self.count:
+            return None
+        return Decimal(self.total) / self.count / AMOUNT_SCALE
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Суммы в виде строк, как в operationAmount.amount."""
+        return {
+            "count": self.count,
+            "sum": format_amount(self.total),
+            "min": None if self.minimum is None else format_amount(self.minimum),
+            "max": None if self.maximum is None else format_amount(self.maximum),
+            "mean": None if self.mean is None else str(self.mean.quantize(Decimal("0.01"))),
+            "invalid": self.invalid,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AmountStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"AmountStats(count={self.count}, total={self.total}, minimum={self.minimum}, "
+                f"maximum={self.maximum}, invalid={self.invalid})")
+
+
+def _currency_key(op: Dict[str, Any]) -> Optional[str]:
+    if type(op) is Operation and op.currency is not None:
+        return op.currency
+    try:
+        return op["operationAmount"]["currency"]["code"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _state_key(op: Dict[str, Any]) -> Optional[str]:
+    return op.get("state")
+
+
+def _month_key(op: Dict[str, Any]) -> Optional[str]:
+    date = op.get("date")
+    if type(date) is not str:
+        return None
+    try:
+        dt = datetime.fromisoformat(date)
+    except ValueError:
+        return None
+    return f"{dt.year:04d}-{dt.month:02d}"
+
+
+def _description_key(op: Dict[str, Any]) -> Optional[str]:
+    description = op.get("description")
+    if not isinstance(description, str) or not description:
+        return None
+    return description.split(" ", 1)[0]
+
+
+# Ключи группировки: валюта, статус, месяц даты (YYYY-MM) и первое слово описания
+GROUP_KEYS: Dict[str, KeyFunc] = {
+    "currency": _currency_key,
+    "state": _state_key,
+    "month": _month_key,
+    "description": _description_key,
+}
+
+
+def _key_func(by: GroupBy) -> KeyFunc:
+    if callable(by):
+        return by
+    try:
+        return GROUP_KEYS[by]
+    except KeyError:
+        raise ValueError(f"Неизвестный ключ группировки: {by}") from None
+
+
+def aggregate_operations(operations: Iterable[Dict[str, Any]], by: GroupBy = "currency") -> Dict[Any, AmountStats]:
+    """
+    Считает количество, сумму, минимум, максимум и среднее сумм по группам.
+
+    Один потоковый проход: каждая сумма разбирается один раз в целые
+    копейки (batch.parse_amount). Вход -- любой итератор операций,
+    в том числе результат filter_by_currency или loader.iter_operations.
+
+    Args:
+        operations: Список или итератор операций (словарей или operation.Operation)
+        by: "currency", "state", "month", "description" или функция операция -> ключ.
+            Операции без значения ключа попадают в группу None
+
+    Returns:
+        Словарь ключ группы -> AmountStats
+
+    Raises:
+        ValueError: Если ключ группировки неизвестен
+
+    Examples:
+        >>> ops = [
+        ...     {"state": "EXECUTED", "operationAmount": {"amount": "10.50", "currency": {"code": "USD"}}},
+        ...     {"state": "EXECUTED", "operationAmount": {"amount": "4.50", "currency": {"code": "USD"}}},
+        ...     {"state": "CANCELED", "operationAmount": {"amount": "n/a", "currency": {"code": "RUB"}}},
+        ... ]
+        >>> result = aggregate_operations(ops)
+        >>> result["USD"].as_dict()
+        {'count': 2, 'sum': '15.00', 'min': '4.50', 'max': '10.50', 'mean': '7.50', 'invalid': 0}
+        >>> result["RUB"].invalid
+        1
+    """
+    key_of = _key_func(by)
+    groups: Dict[Any, AmountStats] = {}
+    # Суммы копятся списками по группам и сворачиваются порциями: на операцию
+    # приходится разбор суммы и добавление в список, без вызовов методов агрегата
+    pending: Dict[Any, List[Optional[int]]] = {}
+    pending_size = 0
+    for op in operations:
+        if type(op) is Operation:
+            # Сумма записи уже разобрана в копейки (None -- нет суммы или она неразбираема)
+            amount = op.amount
+        elif type(op) is dict or isinstance(op, Mapping):
+            try:
+                amount = parse_amount(op["operationAmount"]["amount"])
+            except (KeyError, TypeError):
+                amount = None
+        else:
+            continue
+        key = key_of(op)
+        amounts = pending.get(key)
+        if amounts is None:
+            amounts = pending[key] = []
+        amounts.append(amount)
+        pending_size += 1
+        if pending_size >= _FOLD_SIZE:
+            _fold(groups, pending)
+            pending_size = 0
+    _fold(groups, pending)
+    return groups
+
+
+def _fold(groups: Dict[Any, AmountStats], pending: Dict[Any, List[Optional[int]]]) -> None:
+    for key, amounts in pending.items():
+        stats = groups.get(key)
+        if stats is None:
+            stats = groups[key] = AmountStats()
+        stats.add_many(amounts)
+    pending.clear()
+
+
+def merge_aggregates(parts: Iterable[Dict[Any, AmountStats]]) -> Dict[Any, AmountStats]:
+    """Сливает частичные агрегаты порций; результат не зависит от порядка порций."""
+    merged: Dict[Any, AmountStats] = {}
+    for part in parts:
+        for key, stats in part.items():
+            target = merged.get(key)
+            if target is None:
+                target = merged[key] = AmountStats()
+            target.merge(stats)
+    return merged
+
+
+def _aggregate_chunks(
+        executor: ProcessPoolExecutor,
+        chunks: Iterator[List[Dict[str, Any]]],
+        by: GroupBy,
+        window: int
+) -> Iterator[Dict[Any, AmountStats]]:
+    """Агрегирует порции в пуле, держа в обработке не больше window порций."""
+    in_flight: Deque[Future] = deque()
+    for chunk in chunks:
+        if len(in_flight) >= window:
+            yield in_flight.popleft().result()
+        in_flight.append(executor.submit(aggregate_operations, chunk, by))
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+def aggregate_operations_parallel(
+        operations: Iterable[Dict[str, Any]],
+        by: GroupBy = "currency",
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[Any, AmountStats]:
+    """
+    Параллельный аналог aggregate_operations.
+
+    Порции по chunk_size операций агрегируются в ProcessPoolExecutor,
+    частичные агрегаты сливаются merge_aggregates по мере готовности.
+    Вход читается лениво: в обработке не больше CHUNKS_IN_FLIGHT_PER_WORKER
+    порций на процесс. Результат в точности совпадает с последовательным.
+    Функция-ключ должна быть доступна воркерам по имени (не lambda).
+
+    Args:
+        operations: Список или итератор операций
+        by: Ключ группировки, как в aggregate_operations
+        workers: Количество процессов; 1 -- без пула, None -- по числу ядер
+        chunk_size: Размер порции операций
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    if workers is not None and workers <= 0:
+        raise ValueError("Количество процессов должно быть положительным")
+    _key_func(by)
+
+    chunks = iter_chunks(operations, chunk_size)
+    if workers == 1:
+        return merge_aggregates(aggregate_operations(chunk, by) for chunk in chunks)
+    window = CHUNKS_IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_aggregates(_aggregate_chunks(executor, chunks, by, window))
@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from .report import ReportStats, operation_label
+from .widget import get_date, mask_account_card, print_operations
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 1000
+
+# Маркер завершения одного источника в общей очереди
+_DONE = object()
+
+
+class _SourceError:
+    """Ошибка источника, переданная потребителю через очередь."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+async def afilter_by_currency(
+        transactions: AsyncIterable[Dict[str, Any]],
+        currency: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Асинхронный аналог generators.filter_by_currency.
+
+    Examples:
+        >>> async def source():
+        ...     yield {"operationAmount": {"currency": {"code": "USD"}}}
+        ...     yield {"operationAmount": {"currency": {"code": "EUR"}}}
+        >>> async def main():
+        ...     return [tx async for tx in afilter_by_currency(source(), "usd")]
+        >>> asyncio.run(main())
+        [{'operationAmount': {'currency': {'code': 'USD'}}}]
+    """
+    code = currency.upper()
+    async for transaction in transactions:
+        try:
+            if transaction['operationAmount']['currency']['code'] == code:
+                yield transaction
+        except (KeyError, TypeError):
+            continue
+
+
+async def atransaction_descriptions(transactions: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Асинхронный аналог generators.transaction_descriptions."""
+    async for transaction in transactions:
+        try:
+            yield transaction['description']
+        except (KeyError, TypeError):
+            continue
+
+
+async def aiter_sync(iterable: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Any]:
+    """
+    Превращает синхронный итератор в асинхронный, читая его порциями в потоке.
+
+    Подходит для медленных источников вроде файлов на NFS:
+    aiter_sync(loader.iter_operations(path)) не блокирует цикл событий.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = await asyncio.to_thread(lambda: list(islice(iterator, batch_size)))
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+async def aiter_json_lines(reader: asyncio.StreamReader) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Читает операции в формате JSON Lines из потока (сокет, канал).
+
+    Пустые строки пропускаются.
+
+    Raises:
+        ValueError: Если строка не является корректным JSON
+    """
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+async def aiter_queue(queue: "asyncio.Queue[Any]", sentinel: Any = None) -> AsyncIterator[Any]:
+    """Читает элементы из asyncio.Queue, пока не встретится sentinel."""
+    while True:
+        item = await queue.get()
+        if item is sentinel:
+            return
+        yield item
+
+
+async def merge_feeds(*sources: AsyncIterable[Any], maxsize: int = DEFAULT_QUEUE_SIZE) -> AsyncIterator[Any]:
+    """
+    Конкурентно объединяет несколько асинхронных источников.
+
+    Каждый источник читается отдельной задачей в общую ограниченную очередь:
+    медленный источник не задерживает остальные, а заполненная очередь
+    приостанавливает чтение, пока потребитель не освободит место. Порядок
+    элементов внутри одного источника сохраняется.
+
+    Args:
+        sources: Асинхронные итераторы операций
+        maxsize: Размер общей очереди
+
+    Yields:
+        Элементы всех источников по мере поступления
+
+    Raises:
+        Исключение первого упавшего источника; остальные задачи отменяются
+    """
+    if maxsize <= 0:
+        raise ValueError("Размер очереди должен быть положительным")
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize)
+
+    async def pump(source: AsyncIterable[Any]) -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as error:
+            await queue.put(_SourceError(error))
+        else:
+            await queue.put(_DONE)
+
+    tasks = [asyncio.ensure_future(pump(source)) for source in sources]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, _SourceError):
+                raise item.error
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def arender_operations(
+        operations: AsyncIterable[Dict[str, Any]],
+        sink: Callable[[str], Any] = print
+) -> int:
+    """
+    Асинхронный приемник отчета: форматирует операции по мере поступления.
+
+    Строки имеют тот же вид, что и в print_operations, но идут в порядке
+    поступления. Операции с невалидной датой или описанием, как и в
+    print_operations, пропускаются и записываются в журнал. Если sink --
+    корутина-функция, она ожидается.
+
+    Returns:
+        Количество выведенных строк
+    """
+    count = 0
+    is_coroutine = asyncio.iscoroutinefunction(sink)
+    position = 0
+    async for op in operations:
+        try:
+            line = f"{get_date(op['date'])} {mask_account_card(op['description'])}"
+        except (KeyError, TypeError, ValueError) as error:
+            logger.warning("Операция %s пропущена: %s", operation_label(op, position), error)
+            continue
+        finally:
+            position += 1
+        if is_coroutine:
+            await sink(line)
+        else:
+            sink(line)
+        count += 1
+    return count
+
+
+async def aprint_operations(operations: AsyncIterable[Dict[str, Any]], limit: Optional[int] = None) -> ReportStats:
+    """
+    Асинхронный аналог widget.print_operations.
+
+    Дожидается всех операций (сортировка по дате требует их все), после
+    чего сортирует и печатает их в отдельном потоке, не блокируя цикл событий.
+
+    Returns:
+        ReportStats(written, errors), как у print_operations
+    """
+    collected: List[Dict[str, Any]] = [op async for op in operations]
+    return await asyncio.to_thread(print_operations, collected, limit)
@@ -0,0 +1,321 @@
+from array import array
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dates import format_epoch_us, parse_epoch_us
+
+# Значение-маркер «нет данных» для колонок array('q')
+MISSING = -(1 << 63)
+# Фиксированная точка для сумм: "100.00" хранится как 10000
+# (быстрый путь parse_amount рассчитан на два знака после точки)
+AMOUNT_SCALE = 100
+
+_INT64_MAX = (1 << 63) - 1
+_MAX_CODES = 1 << 16
+
+
+def parse_amount(amount: Any) -> Optional[int]:
+    """
+    Переводит строковую сумму в целое число минимальных единиц.
+
+    Examples:
+        >>> parse_amount("100.50")
+        10050
+        >>> parse_amount("1.005") is None
+        True
+    """
+    if not isinstance(amount, str):
+        return None
+    # Быстрый путь для обычного вида выгрузки "123.45": без точки это целое
+    # число копеек, которое int() разбирает с теми же правилами, что и Decimal
+    if amount[-3:-2] == "." and amount[-2:].isdigit() and "_" not in amount:
+        try:
+            value = int(amount.replace(".", "", 1))
+        except ValueError:
+            pass
+        else:
+            return value if MISSING < value <= _INT64_MAX else None
+    try:
+        scaled = Decimal(amount) * AMOUNT_SCALE
+    except InvalidOperation:
+        return None
+    if not scaled.is_finite() or scaled != scaled.to_integral_value():
+        return None
+    value = int(scaled)
+    if not MISSING < value <= _INT64_MAX:
+        return None
+    return value
+
+
+def format_amount(value: int) -> str:
+    """Обратное преобразование суммы в строку с двумя знаками после точки."""
+    sign = "-" if value < 0 else ""
+    units, cents = divmod(abs(value), AMOUNT_SCALE)
+    return f"{sign}{units}.{cents:02d}"
+
+
+class _Interner:
+    """Таблица строк с компактными кодами; код 0 означает отсутствие значения."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = [None]
+        self.codes: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if code >= _MAX_CODES:
+                raise ValueError("Слишком много различных значений для интернирования")
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def copy(self) -> "_Interner":
+        table = _Interner()
+        table.values = self.values.copy()
+        table.codes = self.codes.copy()
+        return table
+
+
+Row = Tuple[int, Optional[str], int, int, Optional[str], Dict[str, Any]]
+
+
+def split_operation(operation: Dict[str, Any]) -> Row:
+    """
+    Раскладывает операцию на значения колонок и «хвост».
+
+    Returns:
+        (id, state, date_us, amount, currency, rest); отсутствующие числовые
+        значения -- MISSING, строковые -- None. В rest остаются поля, которые
+        нельзя без потерь восстановить из колонок
+
+    Raises:
+        TypeError: Если операция не словарь
+    """
+    if not isinstance(operation, dict):
+        raise TypeError("Операция должна быть словарем")
+    rest = dict(operation)
+
+    op_id = rest.get("id")
+    if type(op_id) is int and MISSING < op_id <= _INT64_MAX:
+        del rest["id"]
+    else:
+        op_id = MISSING
+
+    state = rest.get("state")
+    if isinstance(state, str):
+        del rest["state"]
+    else:
+        state = None
+
+    date = rest.get("date")
+    date_us = parse_epoch_us(date) if isinstance(date, str) else None
+    if date_us is None:
+        date_us = MISSING
+    elif format_epoch_us(date_us) == date:
+        del rest["date"]
+
+    amount = MISSING
+    currency_code = None
+    operation_amount = rest.get("operationAmount")
+    if isinstance(operation_amount, dict):
+        operation_amount = dict(operation_amount)
+        raw_amount = operation_amount.get("amount")
+        parsed_amount = parse_amount(raw_amount)
+        if parsed_amount is not None:
+            amount = parsed_amount
+            if format_amount(parsed_amount) == raw_amount:
+                del operation_amount["amount"]
+
+        currency = operation_amount.get("currency")
+        if isinstance(currency, dict) and isinstance(currency.get("code"), str):
+            currency = dict(currency)
+            currency_code = currency.pop("code")
+            if currency:
+                operation_amount["currency"] = currency
+            else:
+                del operation_amount["currency"]
+
+        if operation_amount or (amount == MISSING and currency_code is None):
+            rest["operationAmount"] = operation_amount
+        else:
+            del rest["operationAmount"]
+
+    return op_id, state, date_us, amount, currency_code, rest
+
+
+def join_operation(
+        op_id: int,
+        state: Optional[str],
+        date_us: int,
+        amount: int,
+        currency_code: Optional[str],
+        rest: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Обратное к split_operation: собирает словарь операции."""
+    operation: Dict[str, Any] = {}
+    if op_id != MISSING:
+        operation["id"] = op_id
+    if state is not None:
+        operation["state"] = state
+    if date_us != MISSING:
+        operation["date"] = format_epoch_us(date_us)
+
+    if amount != MISSING or currency_code is not None:
+        operation_amount: Dict[str, Any] = {}
+        if amount != MISSING:
+            operation_amount["amount"] = format_amount(amount)
+        if rest and isinstance(rest.get("operationAmount"), dict):
+            operation_amount.update(rest["operationAmount"])
+        if currency_code is not None:
+            currency = dict(operation_amount.get("currency") or {})
+            currency["code"] = currency_code
+            operation_amount["currency"] = currency
+        operation["operationAmount"] = operation_amount
+
+    if rest:
+        for key, value in rest.items():
+            if key != "operationAmount" or key not in operation:
+                operation[key] = value
+    return operation
+
+
+def select_codes(column: Sequence[int], code: Optional[int]) -> "array[int]":
+    """Индексы строк колонки кодов, равных code (None -- ни одной)."""
+    if code is None:
+        return array("q")
+    return array("q", [i for i, value in enumerate(column) if value == code])
+
+
+def argsort_dates(dates: Sequence[int], reverse: bool = True) -> "array[int]":
+    """Индексы строк по колонке дат; MISSING -- в конце в исходном порядке."""
+    valid = [i for i in range(len(dates)) if dates[i] != MISSING]
+    valid.sort(key=dates.__getitem__, reverse=reverse)
+    valid.extend(i for i in range(len(dates)) if dates[i] == MISSING)
+    return array("q", valid)
+
+
+class OperationBatch:
+    """
+    Колоночное представление набора операций.
+
+    Горячие поля хранятся в компактных массивах:
+        ids        -- array('q'), MISSING если id не целое число
+        dates      -- array('q'), микросекунды от эпохи, MISSING для невалидных
+        amounts    -- array('q'), сумма в минимальных единицах (AMOUNT_SCALE)
+        states     -- array('H'), коды из state_values (0 -- нет значения)
+        currencies -- array('H'), коды из currency_values (0 -- нет значения)
+
+    Остальные поля операции (описание, счета и т.п.), а также значения,
+    которые нельзя восстановить из колонок без потерь, лежат в «хвосте»
+    строки. Поэтому to_dicts() возвращает операции, равные исходным.
+
+    Examples:
+        >>> batch = OperationBatch.from_dicts([{"id": 1, "state": "EXECUTED"}])
+        >>> len(batch), batch.to_dicts()
+        (1, [{'id': 1, 'state': 'EXECUTED'}])
+    """
+
+    __slots__ = ("ids", "dates", "amounts", "states", "currencies", "_state_table", "_currency_table", "_rest")
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.dates = array("q")
+        self.amounts = array("q")
+        self.states = array("H")
+        self.currencies = array("H")
+        self._state_table = _Interner()
+        self._currency_table = _Interner()
+        self._rest: List[Optional[Dict[str, Any]]] = []
+
+    @classmethod
+    def from_dicts(cls, operations: Iterable[Dict[str, Any]]) -> "OperationBatch":
+        """Строит пакет из списка (или итератора) словарей операций."""
+        batch = cls()
+        for operation in operations:
+            batch.append(operation)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def state_values(self) -> List[Optional[str]]:
+        return self._state_table.values
+
+    @property
+    def currency_values(self) -> List[Optional[str]]:
+        return self._currency_table.values
+
+    def append(self, operation: Dict[str, Any]) -> None:
+        """Добавляет операцию в конец пакета."""
+        op_id, state, date_us, amount, currency, rest = split_operation(operation)
+        self.ids.append(op_id)
+        self.dates.append(date_us)
+        self.amounts.append(amount)
+        self.states.append(0 if state is None else self._state_table.intern(state))
+        self.currencies.append(0 if currency is None else self._currency_table.intern(currency))
+        self._rest.append(rest or None)
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """Восстанавливает словарь операции по номеру строки."""
+        return join_operation(
+            self.ids[index],
+            self._state_table.values[self.states[index]],
+            self.dates[index],
+            self.amounts[index],
+            self._currency_table.values[self.currencies[index]],
+            self._rest[index],
+        )
+
+    def to_dicts(self, indices: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Преобразует пакет (или выборку индексов) обратно в список словарей.
+
+        Examples:
+            >>> ops = [{"id": 1, "date": "2023-01-01"}, {"id": 2}]
+            >>> OperationBatch.from_dicts(ops).to_dicts() == ops
+            True
+        """
+        if indices is None:
+            indices = range(len(self))
+        return [self.to_dict(i) for i in indices]
+
+    def take(self, indices: Iterable[int]) -> "OperationBatch":
+        """
+        Возвращает новый пакет из строк с указанными индексами.
+
+        Коды статусов и валют в новом пакете те же, но таблицы значений
+        скопированы: append() в один пакет не меняет state_values другого.
+        """
+        batch = OperationBatch()
+        batch._state_table = self._state_table.copy()
+        batch._currency_table = self._currency_table.copy()
+        for i in indices:
+            batch.ids.append(self.ids[i])
+            batch.dates.append(self.dates[i])
+            batch.amounts.append(self.amounts[i])
+            batch.states.append(self.states[i])
+            batch.currencies.append(self.currencies[i])
+            batch._rest.append(self._rest[i])
+        return batch
+
+    def select_state(self, state: str) -> "array[int]":
+        """Индексы строк с указанным статусом."""
+        return select_codes(self.states, self._state_table.codes.get(state))
+
+    def select_currency(self, currency: str) -> "array[int]":
+        """Индексы строк с указанным кодом валюты."""
+        return select_codes(self.currencies, self._currency_table.codes.get(currency))
+
+    def argsort_by_date(self, reverse: bool = True) -> "array[int]":
+        """
+        Индексы строк, упорядоченные по дате.
+
+        Как и sort_by_date, строки без даты или с невалидной датой
+        всегда оказываются в конце в исходном порядке.
+        """
+        return argsort_dates(self.dates, reverse)
@@ -0,0 +1,329 @@
+import heapq
+import json
+import logging
+import socket
+import socketserver
+import struct
+import sys
+import zlib
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
+
+from .dates import parse_epoch_us
+from .pipeline import render_rows
+
+logger = logging.getLogger(__name__)
+
+# Адрес воркера: (хост, порт) для TCP или путь к Unix-сокету
+Address = Union[str, Tuple[str, int]]
+ShardBy = Literal["hash", "date"]
+# Порция: пары (позиция операции во входе, операция)
+Shard = List[Tuple[int, Dict[str, Any]]]
+# Строка результата: (ключ даты, позиция, строка отчета)
+Row = Sequence[Any]
+
+DEFAULT_RETRIES = 2
+DEFAULT_TIMEOUT = 600.0
+# Порций на воркер по умолчанию: мелкие порции выравнивают нагрузку
+SHARDS_PER_WORKER = 4
+# Наибольший размер сообщения протокола в байтах: длина из заголовка
+# больше этой считается ошибкой протокола, а не поводом выделять память
+MAX_MESSAGE_SIZE = 1 << 30
+
+_LENGTH = struct.Struct("!Q")
+
+
+def _merge_key(row: Row) -> Tuple[int, int]:
+    # Новые сначала, при равных датах -- в порядке входа, как в sort_by_date
+    return row[0], -row[1]
+
+
+class _WorkerError(Exception):
+    """Воркер получил порцию, но не смог ее обработать (нарушен формат порции)."""
+
+
+def _send_message(sock: socket.socket, message: Any) -> None:
+    data = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(data)))
+    sock.sendall(data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("Соединение закрыто до конца сообщения")
+        received += count
+    return buffer
+
+
+def _recv_message(sock: socket.socket, max_size: int = MAX_MESSAGE_SIZE) -> Any:
+    (size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if size > max_size:
+        raise ValueError(f"Сообщение длиной {size} байт больше допустимых {max_size}")
+    return json.loads(_recv_exact(sock, size))
+
+
+def partition_operations(operations: Iterable[Dict[str, Any]], shards: int, by: ShardBy = "hash") -> List[Shard]:
+    """
+    Делит операции на порции для воркеров.
+
+    "hash" -- по CRC32 от id (операции без id -- по позиции), порции
+    примерно равны и не зависят от порядка входа. "date" -- по диапазонам
+    дат с границами по квантилям: порция с большим номером содержит более
+    поздние даты, операции с равной датой попадают в одну порцию,
+    операции без валидной даты -- в порцию 0. Порции -- единственная копия
+    входа: список операций не копируется, итератор при "date" читается
+    в список один раз (границы известны только после просмотра всех дат).
+
+    Args:
+        operations: Список или итератор операций
+        shards: Количество порций
+        by: "hash" или "date"
+
+    Returns:
+        Список порций; каждая -- пары (позиция во входе, операция)
+
+    Raises:
+        ValueError: Если количество порций не положительное или способ разбиения неизвестен
+
+    Examples:
+        >>> ops = [{"id": i, "date": f"2023-01-0{i}"} for i in range(1, 5)]
+        >>> [[position for position, _ in shard] for shard in partition_operations(ops, 2, "date")]
+        [[0, 1], [2, 3]]
+    """
+    if shards <= 0:
+        raise ValueError("Количество порций должно быть положительным")
+    result: List[Shard] = [[] for _ in range(shards)]
+    if by == "hash":
+        for position, op in enumerate(operations):
+            ident = op.get("id", position) if isinstance(op, dict) else position
+            result[zlib.crc32(repr(ident).encode("utf-8")) % shards].append((position, op))
+    elif by == "date":
+        ops = operations if isinstance(operations, list) else list(operations)
+        keys = [parse_epoch_us(op.get("date")) if isinstance(op, dict) else None for op in ops]
+        valid = sorted(key for key in keys if key is not None)
+        boundaries = [valid[len(valid) * i // shards] for i in range(1, shards)] if valid else []
+        del valid
+        for position, (op, key) in enumerate(zip(ops, keys)):
+            result[0 if key is None else bisect_right(boundaries, key)].append((position, op))
+    else:
+        raise ValueError(f"Неизвестный способ разбиения: {by}")
+    return result
+
+
+def process_shard(shard: Shard, state: Optional[str] = None) -> List[Tuple[int, int, str]]:
+    """
+    Фильтрует, маскирует и сортирует одну порцию (выполняется на воркере).
+
+    Обработка та же, что у порций render_operations_parallel
+    (pipeline.render_rows): операции с невалидной датой или описанием
+    пропускаются и пишутся в журнал воркера.
+
+    Returns:
+        Строки (ключ даты, позиция, строка отчета) от новых к старым
+    """
+    return render_rows(shard, state)
+
+
+class _ShardHandler(socketserver.BaseRequestHandler):
+    """Одно соединение -- одна порция: запрос {"shard", "state"}, ответ {"rows"} или {"error"}."""
+
+    def handle(self) -> None:
+        try:
+            request = _recv_message(self.request)
+        except (OSError, ValueError) as error:
+            logger.warning("Некорректный запрос от %s: %s", self.client_address, error)
+            return
+        try:
+            response = {"rows": process_shard(request["shard"], request.get("state"))}
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            response = {"error": f"{type(error).__name__}: {error}"}
+        _send_message(self.request, response)
+
+
+def make_worker(address: Address) -> socketserver.BaseServer:
+    """
+    Создает сервер воркера на TCP-адресе (хост, порт) или Unix-сокете.
+
+    Порт 0 выбирает свободный порт; фактический адрес -- server.server_address.
+    Обработка запускается server.serve_forever().
+    """
+    server: socketserver.BaseServer
+    if isinstance(address, str):
+        server = socketserver.ThreadingUnixStreamServer(address, _ShardHandler)
+    else:
+        server = socketserver.ThreadingTCPServer(tuple(address), _ShardHandler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_worker(address: Address) -> None:
+    """Запускает воркер и обслуживает порции до остановки процесса."""
+    with make_worker(address) as server:
+        logger.info("Воркер слушает %s", server.server_address)
+        server.serve_forever()
+
+
+def _connect(address: Address, timeout: Optional[float]) -> socket.socket:
+    if not isinstance(address, str):
+        return socket.create_connection(tuple(address), timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _request_shard(address: Address, shard: Shard, state: Optional[str], timeout: Optional[float]) -> List[Row]:
+    with _connect(address, timeout) as sock:
+        _send_message(sock, {"shard": shard, "state": state})
+        response = _recv_message(sock)
+    if "error" in response:
+        raise _WorkerError(response["error"])
+    return response["rows"]
+
+
+def _run_shards(
+        shards: List[Shard],
+        addresses: Sequence[Address],
+        order: Iterable[int],
+        state: Optional[str],
+        retries: int,
+        timeout: Optional[float]
+) -> Iterator[Tuple[int, List[Row]]]:
+    """Раздает порции свободным воркерам и выдает (номер порции, строки) по мере готовности."""
+    pending = deque(order)
+    attempts = [0] * len(shards)
+    idle = list(reversed(addresses))
+    running: Dict[Future, Tuple[int, Address]] = {}
+    with ThreadPoolExecutor(max_workers=len(addresses)) as executor:
+        while pending or running:
+            while pending and idle:
+                index = pending.popleft()
+                address = idle.pop()
+                running[executor.submit(_request_shard, address, shards[index], state, timeout)] = (index, address)
+            if not running:
+                raise ConnectionError(f"Нет доступных воркеров, не обработано порций: {len(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, address = running.pop(future)
+                try:
+                    rows = future.result()
+                except _WorkerError as error:
+                    raise ValueError(f"Порция {index}: {error}") from None
+                except (OSError, ValueError, KeyError) as error:
+                    # Воркер с ошибкой соединения или протокола больше не получает порций,
+                    # а порция возвращается в начало очереди
+                    attempts[index] += 1
+                    logger.warning("Порция %d не обработана воркером %s (попытка %d): %s",
+                                   index, address, attempts[index], error)
+                    if attempts[index] > retries:
+                        raise ConnectionError(
+                            f"Порция {index} не обработана после {attempts[index]} попыток"
+                        ) from error
+                    pending.appendleft(index)
+                    continue
+                idle.append(address)
+                yield index, rows
+
+
+def render_operations_sharded(
+        operations: Iterable[Dict[str, Any]],
+        workers: Sequence[Address],
+        shards: Optional[int] = None,
+        by: ShardBy = "hash",
+        state: Optional[str] = None,
+        retries: int = DEFAULT_RETRIES,
+        timeout: Optional[float] = DEFAULT_TIMEOUT
+) -> Iterator[str]:
+    """
+    Формирует строки отчета print_operations на нескольких воркерах.
+
+    Координатор делит операции на порции (partition_operations) и раздает
+    их воркерам по сокетам; воркеры фильтруют, маскируют и сортируют
+    порции. Порция, воркер которой недоступен или оборвал соединение,
+    отправляется другому воркеру (не больше retries повторов), а сам воркер
+    больше не используется. Операции с невалидной датой или описанием, как
+    и в print_operations, пропускаются (журнал пишет воркер), поэтому
+    вывод в точности совпадает с последовательным print_operations.
+
+    При разбиении "date" строки выдаются потоково: порция выводится, как
+    только готовы все порции с более поздними датами. При "hash" порции
+    сливаются k-way слиянием после получения всех порций.
+
+    Args:
+        operations: Список или итератор операций
+        workers: Адреса воркеров (см. serve_worker)
+        shards: Количество порций; None -- SHARDS_PER_WORKER на воркер
+        by: "hash" или "date", как в partition_operations
+        state: Статус для фильтрации; None -- без фильтрации
+        retries: Сколько раз повторять порцию после сбоя воркера
+        timeout: Тайм-аут сокета в секундах на одну порцию; None -- без тайм-аута
+
+    Yields:
+        Строки вида "DD.MM.YYYY <замаскированное описание>"
+
+    Raises:
+        ValueError: Если параметры некорректны или воркер не смог разобрать порцию
+        ConnectionError: Если порция не обработана после всех повторов
+                         или не осталось доступных воркеров
+    """
+    if not workers:
+        raise ValueError("Нужен хотя бы один воркер")
+    if retries < 0:
+        raise ValueError("Количество повторов не может быть отрицательным")
+    if shards is None:
+        shards = SHARDS_PER_WORKER * len(workers)
+    parts = partition_operations(operations, shards, by)
+
+    if by == "date":
+        # Порции с поздними датами отправляются первыми и выводятся, как только готовы
+        ready: Dict[int, List[Row]] = {}
+        next_index = shards - 1
+        for index, rows in _run_shards(parts, workers, range(shards - 1, -1, -1), state, retries, timeout):
+            ready[index] = rows
+            while next_index in ready:
+                for row in ready.pop(next_index):
+                    yield row[2]
+                next_index -= 1
+        return
+
+    runs = [rows for _, rows in _run_shards(parts, workers, range(shards), state, retries, timeout)]
+    for row in heapq.merge(*runs, key=_merge_key, reverse=True):
+        yield row[2]
+
+
+def print_operations_sharded(
+        operations: Iterable[Dict[str, Any]],
+        workers: Sequence[Address],
+        shards: Optional[int] = None,
+        by: ShardBy = "hash",
+        state: Optional[str] = None,
+        retries: int = DEFAULT_RETRIES,
+        timeout: Optional[float] = DEFAULT_TIMEOUT
+) -> None:
+    """Распределенный аналог widget.print_operations; параметры -- как у render_operations_sharded."""
+    for line in render_operations_sharded(operations, workers, shards, by, state, retries, timeout):
+        print(line)
+
+
+def _parse_address(value: str) -> Address:
+    host, separator, port = value.rpartition(":")
+    if separator and port.isdigit():
+        return host, int(port)
+    return value
+
+
+if __name__ == "__main__":
+    # python -m src.pythonproject.cluster ХОСТ:ПОРТ | /путь/к/сокету
+    logging.basicConfig(level=logging.INFO)
+    serve_worker(_parse_address(sys.argv[1]))
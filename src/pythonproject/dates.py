@@ -0,0 +1,254 @@
+import random
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
+
+from .instrument import instrumented
+
+# Сколько различных строк дат держать в кэше разбора. Через кэш идут даты
+# нестандартного вида и, при сортировке, часто повторяющиеся даты выгрузки:
+# уникальные строки фиксированного вида дают кэшу одни промахи и вытеснения
+DATE_CACHE_SIZE = 1 << 16
+# Размер выборки дат, по которой date_sort_key решает, идти ли через кэш,
+# и во сколько раз в среднем должна повторяться дата, чтобы кэш окупался
+_REPEAT_SAMPLE = 2048
+_CACHE_MIN_REPEATS = 16
+# Ключи для операций без валидной даты: меньше и больше любого ключа-микросекунд
+MIN_DATE_KEY = -(1 << 63)
+MAX_DATE_KEY = (1 << 63) - 1
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# Длина строки вида 2019-08-26T10:50:58.294041
+_FAST_LEN = 26
+_NO_KEY = object()
+# Выборка только решает, какой ключ быстрее, и не влияет на результат;
+# отдельный генератор не трогает состояние модуля random
+_sampler = random.Random(0)
+
+# Граница диапазона дат в запросах: ISO-строка, datetime или None (без границы)
+DateBound = Union[str, datetime, None]
+
+
+def _is_fast_shape(date_str: str) -> bool:
+    return len(date_str) == _FAST_LEN and date_str[10] == "T" and date_str[19] == "."
+
+
+def _epoch_us(date_str: str) -> Optional[int]:
+    if _is_fast_shape(date_str):
+        # Фиксированный формат выгрузки: разбор целиком в C, без проверки пояса
+        try:
+            return (datetime.fromisoformat(date_str) - _EPOCH) // _MICROSECOND
+        except ValueError:
+            return None
+        except TypeError:
+            pass  # строка той же длины, но с часовым поясом
+    try:
+        dt = datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+_cached_epoch_us = lru_cache(maxsize=DATE_CACHE_SIZE)(_epoch_us)
+
+
+@instrumented
+def parse_epoch_us(date_str: Any) -> Optional[int]:
+    """
+    Переводит ISO-дату в микросекунды от эпохи (наивное время, aware -- в UTC).
+
+    Строки вида YYYY-MM-DDTHH:MM:SS.ffffff разбираются напрямую, остальные
+    (с поясом, без времени) -- через ограниченный LRU-кэш.
+
+    Args:
+        date_str: Строка с датой в ISO формате
+
+    Returns:
+        Микросекунды от 1970-01-01 или None, если дата невалидна
+
+    Examples:
+        >>> parse_epoch_us("1970-01-01T00:00:01.000000")
+        1000000
+        >>> parse_epoch_us("invalid-date") is None
+        True
+    """
+    if type(date_str) is not str:
+        return None
+    if _is_fast_shape(date_str):
+        return _epoch_us(date_str)
+    return _cached_epoch_us(date_str)
+
+
+def parse_date_bound(bound: DateBound) -> Optional[int]:
+    """
+    Переводит границу диапазона дат в микросекунды от эпохи.
+
+    Raises:
+        ValueError: Если граница невалидна
+
+    Examples:
+        >>> parse_date_bound(datetime(1970, 1, 1, 0, 0, 1)), parse_date_bound(None)
+        (1000000, None)
+    """
+    if bound is None:
+        return None
+    key = parse_epoch_us(bound.isoformat() if isinstance(bound, datetime) else bound)
+    if key is None:
+        raise ValueError(f"Неверный формат даты: {bound}")
+    return key
+
+
+def format_epoch_us(value: int) -> str:
+    """Обратное преобразование в вид YYYY-MM-DDTHH:MM:SS.ffffff."""
+    return (_EPOCH + timedelta(microseconds=value)).isoformat(timespec="microseconds")
+
+
+@instrumented
+def format_date(date_str: Any) -> str:
+    """
+    Преобразует ISO-дату в DD.MM.YYYY без вызова strftime.
+
+    Для строк вида YYYY-MM-DDTHH:MM:SS.ffffff компоненты берутся срезами
+    после проверки даты.
+
+    Raises:
+        ValueError: Если дата невалидна
+
+    Examples:
+        >>> format_date("2019-08-26T10:50:58.294041")
+        '26.08.2019'
+    """
+    if type(date_str) is str and _is_fast_shape(date_str):
+        # Даты выгрузки почти всегда уникальны, поэтому проверяем напрямую, минуя кэш
+        try:
+            datetime.fromisoformat(date_str)
+        except ValueError:
+            raise ValueError("Неверный формат даты") from None
+        return f"{date_str[8:10]}.{date_str[5:7]}.{date_str[:4]}"
+    if parse_epoch_us(date_str) is None:
+        raise ValueError("Неверный формат даты")
+    dt = datetime.fromisoformat(date_str)
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year:04d}"
+
+
+@instrumented
+def date_keys(operations: Iterable[Any]) -> List[Optional[int]]:
+    """
+    Заранее вычисляет ключи сортировки по дате для списка операций.
+
+    Результат можно многократно передавать в sort_by_date(..., keys=...),
+    пока список операций не меняется.
+
+    Examples:
+        >>> date_keys([{"date": "1970-01-01T00:00:00.000001"}, {"date": "bad"}, {}])
+        [1, None, None]
+    """
+    keys: List[Optional[int]] = []
+    append = keys.append
+    fromisoformat = datetime.fromisoformat
+    for op in operations:
+        if type(op) is not dict:
+            # Записи с уже разобранной датой (operation.Operation)
+            key = getattr(op, "date_key", _NO_KEY)
+            if key is not _NO_KEY:
+                append(key)
+                continue
+        try:
+            date_str = op["date"]
+        except (KeyError, TypeError):
+            append(None)
+            continue
+        if type(date_str) is not str:
+            append(None)
+        elif len(date_str) == _FAST_LEN and date_str[10] == "T" and date_str[19] == ".":
+            # Фиксированный вид выгрузки разбирается напрямую, без кэша
+            try:
+                append((fromisoformat(date_str) - _EPOCH) // _MICROSECOND)
+            except ValueError:
+                append(None)
+            except TypeError:
+                append(_cached_epoch_us(date_str))  # та же длина, но с часовым поясом
+        else:
+            append(_cached_epoch_us(date_str))
+    return keys
+
+
+def _dates_repeat(operations: Sequence[Any]) -> bool:
+    count = len(operations)
+    if count < 4 * _REPEAT_SAMPLE:
+        return False
+    sample = []
+    for i in _sampler.sample(range(count), _REPEAT_SAMPLE):
+        try:
+            sample.append(operations[i]["date"])
+        except (KeyError, TypeError):
+            pass
+    try:
+        collisions = len(sample) - len(set(sample))
+    except TypeError:
+        return False
+    # Совпадений в случайной выборке из k дат примерно k² / (2 * различных),
+    # отсюда средняя кратность повтора даты -- 2 * совпадений * count / k²
+    return 2 * collisions * count >= _CACHE_MIN_REPEATS * len(sample) ** 2
+
+
+def date_sort_key(operations: Sequence[Any], reverse: bool = True) -> Callable[[Any], Any]:
+    """
+    Функция-ключ для разовой сортировки операций по дате через sorted(key=...).
+
+    Операции без даты или с невалидной датой получают ключ, который при
+    заданном направлении ставит их в конец (в исходном порядке, так как
+    сортировка стабильна). Если по случайной выборке даты повторяются
+    часто, ключом служат микросекунды из LRU-кэша parse_epoch_us; иначе
+    строка разбирается напрямую в наивный datetime (aware -- в UTC), и
+    сортировка не медленнее sorted(key=datetime.fromisoformat).
+
+    Args:
+        operations: Список операций, который будет сортироваться
+        reverse: Направление будущей сортировки
+
+    Returns:
+        Функция операция -> ключ сортировки
+
+    Examples:
+        >>> ops = [{"date": "bad"}, {"date": "2023-01-01"}, {"date": "2023-01-02"}]
+        >>> sorted(ops, key=date_sort_key(ops), reverse=True)
+        [{'date': '2023-01-02'}, {'date': '2023-01-01'}, {'date': 'bad'}]
+    """
+    if _dates_repeat(operations):
+        cached_epoch_us = _cached_epoch_us
+        missing_key = MIN_DATE_KEY if reverse else MAX_DATE_KEY
+
+        def cached_key(op: Any) -> int:
+            try:
+                key = cached_epoch_us(op["date"])
+            except (KeyError, TypeError):
+                return missing_key
+            return missing_key if key is None else key
+        return cached_key
+
+    fromisoformat = datetime.fromisoformat
+    # Валидная дата, равная datetime.min/max, встанет среди невалидных --
+    # граница недостижима для дат выгрузки
+    missing = datetime.min if reverse else datetime.max
+
+    def datetime_key(op: Any) -> datetime:
+        try:
+            dt = fromisoformat(op["date"])
+        except (KeyError, TypeError, ValueError):
+            return missing
+        return dt if dt.tzinfo is None else dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return datetime_key
+
+
+def clear_date_cache() -> None:
+    """Очищает кэш разобранных дат."""
+    _cached_epoch_us.cache_clear()
+
+
+def date_cache_info() -> Any:
+    """Статистика кэша разобранных дат (hits, misses, maxsize, currsize)."""
+    return _cached_epoch_us.cache_info()
@@ -0,0 +1,151 @@
+import heapq
+import os
+import pickle
+import struct
+import tempfile
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .dates import MAX_DATE_KEY, MIN_DATE_KEY, parse_epoch_us
+
+# Запись во временном файле: ключ даты (int64), длина данных (uint32), данные (pickle)
+_HEADER = struct.Struct("<qI")
+# Оценка накладных расходов на одну запись в памяти сверх размера данных
+_ENTRY_OVERHEAD = 120
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+DEFAULT_MAX_FANIN = 64
+
+_first = itemgetter(0)
+
+
+def _write_run(entries: Iterable[Tuple[int, bytes]], directory: Optional[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix="sort_run_", suffix=".bin", dir=directory)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+        for key, payload in entries:
+            f.write(_HEADER.pack(key, len(payload)))
+            f.write(payload)
+    return path
+
+
+def _read_run(f: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    header_size = _HEADER.size
+    while True:
+        header = f.read(header_size)
+        if not header:
+            return
+        key, length = _HEADER.unpack(header)
+        yield key, f.read(length)
+
+
+class _Runs:
+    """Набор отсортированных временных файлов; удаляет их при закрытии."""
+
+    def __init__(self, directory: Optional[str]) -> None:
+        self.directory = directory
+        self.paths: List[str] = []
+
+    def spill(self, entries: List[Tuple[int, bytes]], reverse: bool) -> None:
+        entries.sort(key=_first, reverse=reverse)
+        self.paths.append(_write_run(entries, self.directory))
+        entries.clear()
+
+    def merge(self, paths: List[str], reverse: bool) -> Iterator[Tuple[int, bytes]]:
+        files = [open(path, "rb", buffering=1 << 16) for path in paths]
+        try:
+            # heapq.merge стабилен: при равных ключах раньше идут записи из более ранних файлов
+            yield from heapq.merge(*(_read_run(f) for f in files), key=_first, reverse=reverse)
+        finally:
+            for f in files:
+                f.close()
+
+    def reduce(self, max_fanin: int, reverse: bool) -> None:
+        """Сливает файлы группами, пока их не станет не больше max_fanin."""
+        while len(self.paths) > max_fanin:
+            merged = []
+            for start in range(0, len(self.paths), max_fanin):
+                group = self.paths[start:start + max_fanin]
+                merged.append(_write_run(self.merge(group, reverse), self.directory))
+                self._remove(group)
+            self.paths = merged
+
+    def _remove(self, paths: List[str]) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self._remove(self.paths)
+        self.paths = []
+
+
+def sort_by_date_external(
+        operations: Iterable[Dict[str, Any]],
+        reverse: bool = True,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        temp_dir: Optional[str] = None,
+        max_fanin: int = DEFAULT_MAX_FANIN
+) -> Iterator[Dict[str, Any]]:
+    """
+    Сортирует операции по дате внешней сортировкой слиянием.
+
+    Операции накапливаются порциями не больше memory_limit байт, каждая
+    порция сортируется и сбрасывается во временный файл в бинарном формате
+    (ключ даты + сериализованная операция), затем файлы сливаются k-way
+    слиянием. Порядок совпадает с processing.sort_by_date, включая
+    операции без даты или с невалидной датой -- они идут в конце в исходном
+    порядке.
+
+    Args:
+        operations: Список или итератор операций (например, loader.iter_operations)
+        reverse: Если True - новые сначала (по умолчанию)
+        memory_limit: Предел памяти под накопленные операции, байт
+        temp_dir: Каталог для временных файлов (по умолчанию системный)
+        max_fanin: Сколько файлов сливать одновременно
+
+    Yields:
+        Операции в отсортированном порядке
+
+    Examples:
+        >>> ops = [{"date": "2023-01-01"}, {"date": "bad"}, {"date": "2023-01-02"}]
+        >>> list(sort_by_date_external(ops, memory_limit=1))
+        [{'date': '2023-01-02'}, {'date': '2023-01-01'}, {'date': 'bad'}]
+    """
+    if memory_limit <= 0:
+        raise ValueError("Предел памяти должен быть положительным")
+    if max_fanin < 2:
+        raise ValueError("Можно сливать не меньше двух файлов одновременно")
+
+    missing = MIN_DATE_KEY if reverse else MAX_DATE_KEY
+    runs = _Runs(temp_dir)
+    entries: List[Tuple[int, bytes]] = []
+    used = 0
+    try:
+        for op in operations:
+            try:
+                key = parse_epoch_us(op["date"])
+            except (KeyError, TypeError):
+                key = None
+            payload = pickle.dumps(op, protocol=pickle.HIGHEST_PROTOCOL)
+            entries.append((missing if key is None else key, payload))
+            used += len(payload) + _ENTRY_OVERHEAD
+            if used >= memory_limit:
+                runs.spill(entries, reverse)
+                used = 0
+
+        if not runs.paths:
+            # Все поместилось в память -- временные файлы не нужны
+            entries.sort(key=_first, reverse=reverse)
+            for _, payload in entries:
+                yield pickle.loads(payload)
+            return
+
+        if entries:
+            runs.spill(entries, reverse)
+        runs.reduce(max_fanin, reverse)
+        for _, payload in runs.merge(runs.paths, reverse):
+            yield pickle.loads(payload)
+    finally:
+        runs.close()
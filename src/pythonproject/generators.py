@@ -1,36 +1,63 @@
 # src/pythonproject/generators.py
-from typing import Iterator, Dict, List, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple, Union
 
+from .batch import OperationBatch
+from .instrument import instrumented
+from .operation import Operation
+from .store import OperationStore
 
-def filter_by_currency(transactions: List[Dict[str, Any]], currency: str) -> Iterator[Dict[str, Any]]:
+_MAX_CARD = 10 ** 16 - 1
+_MAX_LUHN_BODY = 10 ** 15 - 1
+# Готовые окончания номеров "0000".."9999"
+_SUFFIXES = [f"{i:04d}" for i in range(10000)]
+# Заполняется при первом запросе номеров с контрольной цифрой Луна
+_LUHN_TAILS: List[List[str]] = []
+
+
+@instrumented
+def filter_by_currency(
+        transactions: Union[Iterable[Dict[str, Any]], OperationBatch, OperationStore],
+        currency: str
+) -> Iterator[Any]:
     """
     Фильтрует транзакции по указанной валюте.
 
     Args:
-        transactions: Список словарей с транзакциями
+        transactions: Список или итератор словарей или Operation, OperationBatch или OperationStore
         currency: Код валюты (например, "USD")
 
     Yields:
-        Словари транзакций с указанной валютой
+        Словари транзакций с указанной валютой; для OperationBatch и OperationStore -- индексы строк
 
     Examples:
         >>> list(filter_by_currency([{"operationAmount": {"currency": {"code": "USD"}}}], "USD"))
         [{'operationAmount': {'currency': {'code': 'USD'}}}]
     """
+    if isinstance(transactions, (OperationBatch, OperationStore)):
+        yield from transactions.select_currency(currency.upper())
+        return
+
+    code = currency.upper()
     for transaction in transactions:
+        if type(transaction) is Operation:
+            # Код валюты разобран заранее, вложенные словари не собираются
+            if transaction.currency == code:
+                yield transaction
+            continue
         try:
-            if transaction['operationAmount']['currency']['code'] == currency.upper():
+            if transaction['operationAmount']['currency']['code'] == code:
                 yield transaction
         except (KeyError, TypeError):
             continue
 
 
-def transaction_descriptions(transactions: List[Dict[str, Any]]) -> Iterator[str]:
+@instrumented
+def transaction_descriptions(transactions: Union[Iterable[Dict[str, Any]], OperationStore]) -> Iterator[str]:
     """
     Генерирует описания транзакций.
 
     Args:
-        transactions: Список словарей с транзакциями
+        transactions: Список или итератор словарей с транзакциями либо OperationStore
 
     Yields:
         Описание каждой транзакции
@@ -39,6 +66,10 @@ def transaction_descriptions(transactions: List[Dict[str, Any]]) -> Iterator[str
         >>> list(transaction_descriptions([{"description": "Payment"}]))
         ['Payment']
     """
+    if isinstance(transactions, OperationStore):
+        yield from transactions.descriptions()
+        return
+
     for transaction in transactions:
         try:
             yield transaction['description']
@@ -46,6 +77,7 @@ def transaction_descriptions(transactions: List[Dict[str, Any]]) -> Iterator[str
             continue
 
 
+@instrumented
 def card_number_generator(start: int, end: int) -> Iterator[str]:
     """
     Генерирует номера карт в указанном диапазоне.
@@ -61,6 +93,130 @@ def card_number_generator(start: int, end: int) -> Iterator[str]:
         >>> list(card_number_generator(1, 2))
         ['0000 0000 0000 0001', '0000 0000 0000 0002']
     """
+    if 0 <= start and end <= _MAX_CARD:
+        for chunk in card_number_chunks(start, end):
+            yield from chunk
+        return
+
     for num in range(start, end + 1):
-        yield f"{num:016d}"[:4] + " " + f"{num:016d}"[4:8] + " " + \
-            f"{num:016d}"[8:12] + " " + f"{num:016d}"[12:16]
+        digits = f"{num:016d}"
+        yield f"{digits[:4]} {digits[4:8]} {digits[8:12]} {digits[12:16]}"
+
+
+def _luhn_prefix_sum(digits: str) -> int:
+    # Сумма Луна для первых 12 цифр 15-значного тела; удваиваются цифры на четных позициях
+    total = 0
+    for position, char in enumerate(digits):
+        digit = int(char)
+        if position % 2 == 0:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total
+
+
+def _luhn_tails() -> List[List[str]]:
+    # Для каждого остатка суммы префикса -- последние группы "DDDC" для всех 1000 окончаний тела
+    tails: List[List[str]] = [[] for _ in range(10)]
+    for tail in range(1000):
+        d12, d13, d14 = tail // 100, tail // 10 % 10, tail % 10
+        tail_sum = sum(d * 2 - 9 if d > 4 else d * 2 for d in (d12, d14)) + d13
+        for residue in range(10):
+            check = (10 - (residue + tail_sum) % 10) % 10
+            tails[residue].append(f"{tail:03d}{check}")
+    return tails
+
+
+def _card_blocks(start: int, end: int, luhn: bool) -> Iterator[Tuple[str, List[str]]]:
+    """Делит диапазон на блоки с общим префиксом "XXXX XXXX XXXX " и срезом готовых окончаний."""
+    if luhn:
+        if not _LUHN_TAILS:
+            _LUHN_TAILS.extend(_luhn_tails())
+        block_size, limit = 1000, _MAX_LUHN_BODY
+    else:
+        block_size, limit = 10000, _MAX_CARD
+    if start < 0 or end > limit:
+        raise ValueError(f"Диапазон должен лежать в пределах от 0 до {limit}")
+
+    number = start
+    while number <= end:
+        block, low = divmod(number, block_size)
+        high = min(end - block * block_size, block_size - 1) + 1
+        head = f"{block:012d}"
+        if luhn:
+            suffixes = _LUHN_TAILS[_luhn_prefix_sum(head) % 10][low:high]
+        else:
+            suffixes = _SUFFIXES[low:high]
+        yield f"{head[:4]} {head[4:8]} {head[8:12]} ", suffixes
+        number = (block + 1) * block_size
+
+
+@instrumented
+def card_number_chunks(start: int, end: int, luhn: bool = False) -> Iterator[List[str]]:
+    """
+    Генерирует номера карт порциями (до 10 000 номеров в порции).
+
+    Номера внутри порции имеют общий префикс из первых 12 цифр, который
+    форматируется один раз на порцию; окончания берутся из готовой таблицы.
+
+    Args:
+        start: Начальный номер
+        end: Конечный номер включительно
+        luhn: Если True, start и end задают 15-значное тело номера, а 16-я цифра --
+              контрольная цифра по алгоритму Луна
+
+    Yields:
+        Списки номеров в формате "XXXX XXXX XXXX XXXX"
+
+    Raises:
+        ValueError: Если диапазон выходит за допустимые пределы
+
+    Examples:
+        >>> list(card_number_chunks(9999, 10000))
+        [['0000 0000 0000 9999'], ['0000 0000 0001 0000']]
+        >>> list(card_number_chunks(411111111111111, 411111111111111, luhn=True))
+        [['4111 1111 1111 1111']]
+    """
+    for prefix, suffixes in _card_blocks(start, end, luhn):
+        yield list(map(prefix.__add__, suffixes))
+
+
+@instrumented
+def write_card_numbers(
+        start: int,
+        end: int,
+        out: Union[BinaryIO, bytearray],
+        luhn: bool = False,
+        separator: bytes = b"\n"
+) -> int:
+    """
+    Записывает номера карт напрямую в бинарный файл или bytearray.
+
+    Каждый блок номеров собирается одним bytes.join без создания
+    промежуточных строк на каждый номер.
+
+    Args:
+        start: Начальный номер
+        end: Конечный номер включительно
+        out: Открытый в режиме "wb" файл или bytearray
+        luhn: Дописывать контрольную цифру Луна (см. card_number_chunks)
+        separator: Разделитель после каждого номера
+
+    Returns:
+        Количество записанных номеров
+
+    Examples:
+        >>> buffer = bytearray()
+        >>> write_card_numbers(1, 2, buffer)
+        2
+        >>> bytes(buffer)
+        b'0000 0000 0000 0001\\n0000 0000 0000 0002\\n'
+    """
+    write = out.extend if isinstance(out, bytearray) else out.write
+    # latin-1 переводит любые байты разделителя в символы и обратно без потерь
+    separator_str = separator.decode("latin-1")
+    count = 0
+    for prefix, suffixes in _card_blocks(start, end, luhn):
+        block = prefix + (separator_str + prefix).join(suffixes) + separator_str
+        write(block.encode("latin-1"))
+        count += len(suffixes)
+    return count
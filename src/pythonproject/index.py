@@ -0,0 +1,192 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .dates import DateBound, parse_date_bound, parse_epoch_us
+from .operation import Operation
+
+
+def _currency_of(op: Dict[str, Any]) -> Optional[str]:
+    if type(op) is Operation:
+        return op.currency
+    try:
+        code = op["operationAmount"]["currency"]["code"]
+    except (KeyError, TypeError):
+        return None
+    return code if isinstance(code, str) else None
+
+
+class OperationIndex:
+    """
+    Вторичные индексы по загруженному набору операций.
+
+    Хэш-индексы по state и operationAmount.currency.code и отсортированный
+    индекс по дате строятся один раз; комбинированные запросы отвечают
+    пересечением индексов, не просматривая все операции. Индекс
+    поддерживает add/remove для новых и отмененных операций.
+
+    Операции идентифицируются по объекту: remove() принимает тот же словарь,
+    что был добавлен.
+
+    Examples:
+        >>> index = OperationIndex([
+        ...     {"id": 1, "state": "EXECUTED", "date": "2019-01-01", "operationAmount": {"currency": {"code": "USD"}}},
+        ...     {"id": 2, "state": "CANCELED", "date": "2019-01-02", "operationAmount": {"currency": {"code": "USD"}}},
+        ... ])
+        >>> [op["id"] for op in index.query(state="EXECUTED", currency="usd", date_from="2019-01-01")]
+        [1]
+    """
+
+    def __init__(self, operations: Iterable[Dict[str, Any]] = ()) -> None:
+        self._operations: Dict[int, Dict[str, Any]] = {}
+        self._rows_by_object: Dict[int, int] = {}
+        self._by_state: Dict[Any, Set[int]] = {}
+        self._by_currency: Dict[str, Set[int]] = {}
+        # Отсортированный индекс: ключи дат и номера строк в том же порядке
+        self._date_keys: List[int] = []
+        self._date_rows: List[int] = []
+        self._row_keys: Dict[int, int] = {}
+        # Значения полей на момент добавления -- remove() не зависит от последующих изменений словаря
+        self._row_values: Dict[int, Tuple[Any, Optional[str]]] = {}
+        self._next_row = 0
+        # Начальный набор: ключи дат сортируются один раз, а не вставляются по одному
+        pairs = []
+        for op in operations:
+            row, key = self._add_row(op)
+            if key is not None:
+                pairs.append((key, row))
+        pairs.sort()
+        self._date_keys = [key for key, _ in pairs]
+        self._date_rows = [row for _, row in pairs]
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def __contains__(self, op: object) -> bool:
+        return id(op) in self._rows_by_object
+
+    def add(self, op: Dict[str, Any]) -> None:
+        """Добавляет операцию (словарь или operation.Operation) во все индексы."""
+        row, key = self._add_row(op)
+        if key is not None:
+            # Номера строк растут, поэтому bisect_right сохраняет порядок добавления
+            position = bisect_right(self._date_keys, key)
+            self._date_keys.insert(position, key)
+            self._date_rows.insert(position, row)
+
+    def _add_row(self, op: Dict[str, Any]) -> Tuple[int, Optional[int]]:
+        """Добавляет операцию во все индексы, кроме индекса дат; возвращает (строка, ключ даты)."""
+        if not isinstance(op, Mapping):
+            raise TypeError("Операция должна быть словарем")
+        if id(op) in self._rows_by_object:
+            raise ValueError("Операция уже добавлена в индекс")
+
+        row = self._next_row
+        self._next_row += 1
+        self._operations[row] = op
+        self._rows_by_object[id(op)] = row
+
+        state = op.get("state")
+        currency = _currency_of(op)
+        self._row_values[row] = (state, currency)
+        self._by_state.setdefault(state, set()).add(row)
+        if currency is not None:
+            self._by_currency.setdefault(currency, set()).add(row)
+        key = op.date_key if type(op) is Operation else parse_epoch_us(op.get("date"))
+        if key is not None:
+            self._row_keys[row] = key
+        return row, key
+
+    def remove(self, op: Dict[str, Any]) -> None:
+        """
+        Удаляет операцию из всех индексов.
+
+        Raises:
+            KeyError: Если операция не была добавлена
+        """
+        row = self._rows_by_object.pop(id(op), None)
+        if row is None:
+            raise KeyError("Операция отсутствует в индексе")
+        del self._operations[row]
+
+        state, currency = self._row_values.pop(row)
+        self._discard(self._by_state, state, row)
+        self._discard(self._by_currency, currency, row)
+        key = self._row_keys.pop(row, None)
+        if key is not None:
+            position = bisect_left(self._date_keys, key)
+            while self._date_rows[position] != row:
+                position += 1
+            del self._date_keys[position]
+            del self._date_rows[position]
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[int]], value: Any, row: int) -> None:
+        rows = index.get(value)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del index[value]
+
+    def query(
+            self,
+            state: Optional[str] = None,
+            currency: Optional[str] = None,
+            date_from: DateBound = None,
+            date_to: DateBound = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Возвращает операции, удовлетворяющие всем заданным условиям.
+
+        Args:
+            state: Статус операции
+            currency: Код валюты (регистр не важен, как в filter_by_currency)
+            date_from: Начало диапазона дат включительно
+            date_to: Конец диапазона дат не включительно
+
+        Returns:
+            Операции в порядке добавления в индекс
+
+        Raises:
+            ValueError: Если граница диапазона дат невалидна
+        """
+        sets: List[Set[int]] = []
+        if state is not None:
+            sets.append(self._by_state.get(state, set()))
+        if currency is not None:
+            sets.append(self._by_currency.get(currency.upper(), set()))
+        sets.sort(key=len)
+
+        if date_from is None and date_to is None:
+            if not sets:
+                return list(self._operations.values())
+            rows = sorted(sets[0].intersection(*sets[1:]))
+            return [self._operations[row] for row in rows]
+
+        start_key = parse_date_bound(date_from)
+        end_key = parse_date_bound(date_to)
+        start = 0 if start_key is None else bisect_left(self._date_keys, start_key)
+        end = len(self._date_keys) if end_key is None else bisect_left(self._date_keys, end_key)
+
+        if not sets or end - start <= len(sets[0]):
+            # Диапазон дат -- самый узкий индекс: проверяем его строки по хэш-индексам
+            rows = [row for row in self._date_rows[start:end] if all(row in rows_set for rows_set in sets)]
+        else:
+            # Самый узкий -- хэш-индекс: проверяем даты его строк
+            low = -(1 << 63) if start_key is None else start_key
+            high = 1 << 63 if end_key is None else end_key
+            row_keys = self._row_keys
+            rows = [
+                row for row in sets[0]
+                if row in row_keys and low <= row_keys[row] < high and all(row in rows_set for rows_set in sets[1:])
+            ]
+        rows.sort()
+        return [self._operations[row] for row in rows]
+
+    def filter_by_state(self, state: str = "EXECUTED") -> List[Dict[str, Any]]:
+        """Индексный аналог processing.filter_by_state."""
+        return self.query(state=state)
+
+    def filter_by_currency(self, currency: str) -> List[Dict[str, Any]]:
+        """Индексный аналог generators.filter_by_currency."""
+        return self.query(currency=currency)
@@ -0,0 +1,107 @@
+"""
+Обертки функций пакета для сбора метрик (модуль metrics).
+
+Функции оборачиваются один раз при определении и подписываются модулем,
+в котором определены (masks.mask_account_card, а не widget.mask_account_card).
+Пока метрики выключены, обертка только проверяет флаг и вызывает функцию,
+поэтому замеры попадают и в вызовы по ссылкам, импортированным до
+metrics.enable(). Модуль не импортирует typing: его использует masks.
+"""
+from __future__ import annotations
+
+import functools
+import time
+
+# Флаги co_flags из inspect: *args, **kwargs, генераторная функция
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+_CO_GENERATOR = 0x20
+_NO_ARG = object()
+
+# Функция записи замера (имя, секунды, элементы), пока метрики включены;
+# None -- метрики выключены
+_recorder = None
+# Имена обернутых функций в порядке определения: "модуль.функция"
+registered: list[str] = []
+
+
+def set_recorder(recorder) -> None:
+    """Включает запись замеров функцией recorder(имя, секунды, элементы); None -- выключает."""
+    global _recorder
+    _recorder = recorder
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def _input_items(args: tuple) -> int:
+    if not args:
+        return 1
+    first = args[0]
+    if isinstance(first, (str, bytes)):
+        return 1
+    if hasattr(first, "__len__"):
+        return len(first)
+    return 1
+
+
+def _measure_iteration(name: str, recorder, iterator, started: float):
+    # Для генераторов учитывается время всей итерации и число выданных элементов
+    produced = 0
+    try:
+        for item in iterator:
+            produced += 1
+            yield item
+    finally:
+        recorder(name, time.perf_counter() - started, produced)
+
+
+def instrumented(func):
+    """
+    Оборачивает функцию для сбора метрик под именем "модуль.функция".
+
+    Examples:
+        >>> def double(x):
+        ...     return 2 * x
+        >>> wrapped = instrumented(double)
+        >>> wrapped(4), wrapped(x=4), wrapped.__wrapped__ is double
+        (8, 8, True)
+    """
+    name = f"{func.__module__.rpartition('.')[2]}.{func.__name__}"
+    registered.append(name)
+    perf_counter = time.perf_counter
+
+    if func.__code__.co_flags & _CO_GENERATOR:
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            started = perf_counter()
+            return _measure_iteration(name, recorder, func(*args, **kwargs), started)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = _recorder
+        if recorder is None:
+            return func(*args, **kwargs)
+        started = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder(name, perf_counter() - started, _input_items(args))
+
+    code = func.__code__
+    if code.co_argcount != 1 or code.co_kwonlyargcount or code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS):
+        return wrapper
+
+    # Функции одного аргумента (маскировка, разбор дат) вызываются поштучно в
+    # циклах: без упаковки *args обертка в выключенном состоянии вдвое дешевле
+    @functools.wraps(func)
+    def single_argument_wrapper(arg=_NO_ARG, /, **kwargs):
+        if _recorder is None and arg is not _NO_ARG and not kwargs:
+            return func(arg)
+        return wrapper(**kwargs) if arg is _NO_ARG else wrapper(arg, **kwargs)
+    return single_argument_wrapper
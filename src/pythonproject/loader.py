@@ -0,0 +1,138 @@
+import json
+from os import PathLike
+from typing import Any, Dict, Iterator, TextIO, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+# Сколько символов в конце буфера может занимать обрезанный границей порции
+# токен: литерал (-Infinity), экранирование \uXXXX или хвост числа (1.5e-)
+_CUT_TOKEN_LENGTH = 16
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_operations_from_stream(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Потоково разбирает JSON-массив операций из текстового потока.
+
+    В памяти держится только текущий буфер чтения и одна разбираемая операция,
+    поэтому объём памяти не зависит от размера файла.
+
+    Args:
+        stream: Текстовый поток с JSON-массивом операций
+        chunk_size: Размер порции чтения в символах
+
+    Yields:
+        Словари операций в порядке следования в массиве
+
+    Raises:
+        ValueError: Если содержимое не является JSON-массивом
+
+    Examples:
+        >>> import io
+        >>> list(iter_operations_from_stream(io.StringIO('[{"id": 1}, {"id": 2}]')))
+        [{'id': 1}, {'id': 2}]
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции чтения должен быть положительным")
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    # Открывающая скобка массива
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos < len(buffer) or not fill():
+            break
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Ожидается JSON-массив операций")
+    pos += 1
+
+    expect_item = True
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if not fill():
+                raise ValueError("Неожиданный конец JSON-массива")
+            continue
+
+        char = buffer[pos]
+        if char == "]":
+            return
+        if char == ",":
+            if expect_item:
+                raise ValueError(f"Неожиданная запятая в позиции {pos}")
+            expect_item = True
+            pos += 1
+            continue
+        if not expect_item:
+            raise ValueError(f"Ожидается ',' или ']' в позиции {pos}")
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as error:
+            # Ошибка у конца буфера или незакрытая строка -- объект не поместился
+            # в буфер: дочитываем и пробуем снова. Ошибка внутри буфера -- JSON
+            # неверен, и дочитывать остаток потока незачем
+            truncated = error.pos >= len(buffer) - _CUT_TOKEN_LENGTH or error.msg.startswith("Unterminated string")
+            if not truncated or not fill():
+                raise ValueError(f"Неверный формат JSON-массива операций: {error}") from None
+            continue
+        if end == len(buffer) and not eof:
+            # Числа и литералы могут быть обрезаны границей порции
+            if fill():
+                continue
+        pos = end
+        expect_item = False
+        yield item
+
+
+def iter_operations(
+        source: Union[str, "PathLike[str]", TextIO],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Лениво загружает операции из JSON-файла по одной.
+
+    Результат можно передавать напрямую в filter_by_currency и
+    transaction_descriptions, не загружая весь файл в память.
+
+    Args:
+        source: Путь к JSON-файлу или открытый текстовый поток
+        chunk_size: Размер порции чтения в символах
+        encoding: Кодировка файла
+
+    Yields:
+        Словари операций
+
+    Examples:
+        >>> import io
+        >>> list(iter_operations(io.StringIO('[{"state": "EXECUTED"}]')))
+        [{'state': 'EXECUTED'}]
+    """
+    if hasattr(source, "read"):
+        yield from iter_operations_from_stream(source, chunk_size)  # type: ignore[arg-type]
+        return
+
+    with open(source, encoding=encoding) as stream:  # type: ignore[arg-type]
+        yield from iter_operations_from_stream(stream, chunk_size)
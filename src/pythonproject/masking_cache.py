@@ -0,0 +1,196 @@
+import hashlib
+import os
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Hashable, Literal, Optional
+
+from .masks import mask_account_card
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+# Размер ключа-дайджеста в байтах: 128 бит -- коллизии практически исключены
+_DIGEST_SIZE = 16
+_DIGEST_KEY_SIZE = 32
+
+
+class _LFUStore:
+    """Хранилище с вытеснением наименее часто используемых ключей за O(1)."""
+
+    __slots__ = ("values", "counts", "buckets", "min_count")
+
+    def __init__(self) -> None:
+        self.values: Dict[Hashable, str] = {}
+        self.counts: Dict[Hashable, int] = {}
+        # частота -> ключи с этой частотой в порядке последнего обращения
+        self.buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self.min_count = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _touch(self, key: Hashable) -> None:
+        count = self.counts[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_count == count:
+                self.min_count = count + 1
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key: Hashable) -> Optional[str]:
+        value = self.values.get(key)
+        if value is not None:
+            self._touch(key)
+        return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        if key in self.values:
+            self.values[key] = value
+            return
+        self.values[key] = value
+        self.counts[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_count = 1
+
+    def evict(self) -> None:
+        bucket = self.buckets[self.min_count]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.buckets[self.min_count]
+        del self.values[key]
+        del self.counts[key]
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.min_count = 0
+
+
+class _LRUStore:
+    """Хранилище с вытеснением давно не использованных ключей."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values: "OrderedDict[Hashable, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        value = self.values.get(key)
+        if value is not None:
+            self.values.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        self.values[key] = value
+
+    def evict(self) -> None:
+        self.values.popitem(last=False)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+
+class MaskingCache:
+    """
+    Кэш результатов mask_account_card для повторяющихся карт и счетов.
+
+    По умолчанию ключом служит hash() строки -- SipHash с солью, случайной
+    для каждого процесса, -- поэтому исходные номера карт в кэше не хранятся,
+    а попадание стоит одного хэширования строки и поиска в словаре. Хэш
+    64-битный: при n записях в кэше вероятность того, что очередная новая
+    строка совпадет по хэшу с чужой записью и получит ее результат, не больше
+    n / 2**64 (около 5e-15 для 100 000 записей). Если и этот риск недопустим
+    или хэш не должен позволять перебор номера по видимым в маске цифрам,
+    digest_keys=True включает 128-битный BLAKE2b с ключом, случайным для
+    каждого экземпляра; он дороже маскировки, поэтому выключен по умолчанию.
+    Невалидные строки не кэшируются: для них каждый раз выбрасывается
+    ValueError, как и в mask_account_card.
+
+    Args:
+        maxsize: Максимальное количество записей
+        policy: "lru" -- вытеснять давно не использованные,
+                "lfu" -- вытеснять редко используемые
+        hash_keys: Хранить вместо строк их hash() (рекомендуется в продакшене)
+        digest_keys: Хранить вместо строк дайджесты BLAKE2b с ключом экземпляра
+        masker: Функция маскировки (по умолчанию mask_account_card)
+
+    Examples:
+        >>> cache = MaskingCache(maxsize=2)
+        >>> cache("Visa 7000792289606361")
+        'Visa 7000 79** **** 6361'
+        >>> cache("Visa 7000792289606361")
+        'Visa 7000 79** **** 6361'
+        >>> cache.cache_info().hits
+        1
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 100_000,
+            policy: Literal["lru", "lfu"] = "lru",
+            hash_keys: bool = True,
+            masker: Callable[[str], str] = mask_account_card,
+            digest_keys: bool = False
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        if policy == "lru":
+            self._store = _LRUStore()
+        elif policy == "lfu":
+            self._store = _LFUStore()
+        else:
+            raise ValueError(f"Неизвестная политика вытеснения: {policy}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hash_keys = hash_keys
+        self.digest_keys = digest_keys
+        # Хэшер с ключом экземпляра; для каждой строки используется его копия
+        self._hasher = (
+            hashlib.blake2b(digest_size=_DIGEST_SIZE, key=os.urandom(_DIGEST_KEY_SIZE)) if digest_keys else None
+        )
+        self._masker = masker
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, account_info: str) -> str:
+        """Маскирует строку, используя кэш."""
+        if not isinstance(account_info, str):
+            return self._masker(account_info)
+        if self._hasher is not None:
+            hasher = self._hasher.copy()
+            hasher.update(account_info.encode("utf-8", "surrogatepass"))
+            key: Hashable = hasher.digest()
+        elif self.hash_keys:
+            key = hash(account_info)
+        else:
+            key = account_info
+        masked = self._store.get(key)
+        if masked is not None:
+            self.hits += 1
+            return masked
+
+        self.misses += 1
+        masked = self._masker(account_info)
+        if len(self._store) >= self.maxsize:
+            self._store.evict()
+            self.evictions += 1
+        self._store.put(key, masked)
+        return masked
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def cache_info(self) -> CacheInfo:
+        """Статистика кэша в стиле functools.lru_cache."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._store))
+
+    def clear(self) -> None:
+        """Очищает кэш и счетчики."""
+        self._store.clear()
+        self.hits = self.misses = self.evictions = 0
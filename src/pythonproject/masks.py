@@ -1,3 +1,14 @@
+from __future__ import annotations
+
+from operator import not_
+
+from .instrument import instrumented
+
+# Аннотации модуля -- строки (from __future__ import annotations) и используют
+# только встроенные типы: маскировка не импортирует typing при загрузке
+
+
+@instrumented
 def get_mask_card_number(card_number: str) -> str:
     """
     Маскирует номер карты в формате XXXX XX** **** XXXX
@@ -13,6 +24,7 @@ def get_mask_card_number(card_number: str) -> str:
     return f"{card_number[:4]} {card_number[4:6]}** **** {card_number[-4:]}"
 
 
+@instrumented
 def get_mask_account(account_number: str) -> str:
     """
     Маскирует номер счета в формате **XXXX
@@ -26,3 +38,172 @@ def get_mask_account(account_number: str) -> str:
     if not isinstance(account_number, str) or not account_number.isdigit() or len(account_number) < 4:
         raise ValueError("Номер счета должен быть строкой минимум из 4 цифр")
     return f"**{account_number[-4:]}"
+
+
+@instrumented
+def mask_account_card(account_info: str) -> str:
+    """
+    Маскирует номер карты или счета в строке.
+
+    Args:
+        account_info: Строка вида "Visa 1234567812345678" или "Счет 1234567890123456"
+
+    Returns:
+        Маскированная строка
+
+    Raises:
+        ValueError: Если входные данные невалидны
+    """
+    if not account_info or " " not in account_info:
+        raise ValueError("Неверный формат входных данных")
+
+    parts = account_info.rsplit(" ", 1)
+    if "счет" in parts[0].lower():
+        return f"{parts[0]} {get_mask_account(parts[1])}"
+    return f"{parts[0]} {get_mask_card_number(parts[1])}"
+
+
+# Таблица для bytes.translate: цифры -> 0, любой другой байт -> 1
+_NON_DIGIT = b"\x01" * 48 + b"\x00" * 10 + b"\x01" * 198
+
+_CARD_WIDTH = 16
+_CARD_TEMPLATE = b"       ** ****     "
+_BAD_CARD = "x" * _CARD_WIDTH
+_CARD_COLUMNS = [(0, 0), (1, 1), (2, 2), (3, 3), (5, 4), (6, 5), (15, 12), (16, 13), (17, 14), (18, 15)]
+_ACCOUNT_TEMPLATE = b"**    "
+
+
+def _invalid_flags(data: bytes, width: int) -> bytes:
+    # Для каждой записи 1, если в ней есть не-цифра. Колонки записей берутся
+    # срезами с шагом и объединяются побитовым OR над длинными целыми.
+    count = len(data) // width
+    mapped = data.translate(_NON_DIGIT)
+    acc = 0
+    for column in range(width):
+        acc |= int.from_bytes(mapped[column::width], "big")
+    return acc.to_bytes(count, "big")
+
+
+def _mask_fixed_width(data: bytes, width: int, template: bytes, columns: list[tuple[int, int]]) -> tuple[bytes, bytes]:
+    count = len(data) // width
+    flags = _invalid_flags(data, width)
+    out_width = len(template)
+    out = bytearray(template * count)
+    for dst, src in columns:
+        out[dst::out_width] = data[src::width]
+    blank = b" " * out_width
+    invalid = flags.find(1)
+    while invalid != -1:
+        out[invalid * out_width:(invalid + 1) * out_width] = blank
+        invalid = flags.find(1, invalid + 1)
+    return bytes(out), flags
+
+
+def _as_items(numbers: object) -> list | tuple:
+    # NumPy-массивы и прочие контейнеры с tolist() переводим в список Python
+    if hasattr(numbers, "tolist"):
+        return numbers.tolist()
+    return numbers
+
+
+def _normalize(number: object, card: bool) -> str | None:
+    if isinstance(number, (bytes, bytearray)):
+        return number.decode("ascii") if number.isascii() else None
+    if type(number) is int:
+        if number < 0 or (card and number >= 10 ** 16):
+            return None
+        return f"{number:016d}" if card else str(number)
+    return number if isinstance(number, str) else None
+
+
+def _check_buffer(numbers: bytes | bytearray | memoryview, width: int) -> bytes:
+    data = bytes(numbers)
+    if width <= 0 or len(data) % width:
+        raise ValueError("Размер буфера должен быть кратен ширине записи")
+    return data
+
+
+def _split_masked(data: bytes, flags: bytes, width: int) -> list[str]:
+    text = data.decode("ascii")
+    masked = [text[i:i + width] for i in range(0, len(text), width)]
+    invalid = flags.find(1)
+    while invalid != -1:
+        masked[invalid] = ""
+        invalid = flags.find(1, invalid + 1)
+    return masked
+
+
+@instrumented
+def mask_cards_bulk(numbers: object) -> tuple[list[str] | bytes, bytearray]:
+    """
+    Маскирует множество номеров карт за один проход.
+
+    Невалидные номера не вызывают исключений: для них в результате стоит
+    пустая строка, а в маске ошибок -- 1.
+
+    Args:
+        numbers: Последовательность номеров (str, bytes или int), массив NumPy
+                 либо один буфер bytes из записей по 16 ASCII-цифр
+
+    Returns:
+        Кортеж (маскированные номера, маска ошибок). Для буфера bytes
+        маскированные номера -- один буфер bytes из записей по 19 байт,
+        невалидные записи заполнены пробелами.
+
+    Examples:
+        >>> mask_cards_bulk(["1234567890123456", "123"])
+        (['1234 56** **** 3456', ''], bytearray(b'\\x00\\x01'))
+    """
+    if isinstance(numbers, (bytes, bytearray, memoryview)):
+        data = _check_buffer(numbers, _CARD_WIDTH)
+        masked, flags = _mask_fixed_width(data, _CARD_WIDTH, _CARD_TEMPLATE, _CARD_COLUMNS)
+        return masked, bytearray(flags)
+
+    items = _as_items(numbers)
+    if set(map(type, items)) != {str}:
+        items = [_normalize(number, card=True) or "" for number in items]
+    # Номера неверной длины заменяем заведомо невалидной записью той же ширины,
+    # чтобы замаскировать весь список как один буфер записей
+    joined = "".join([n if len(n) == _CARD_WIDTH else _BAD_CARD for n in items])
+    if joined.isascii():
+        data, flags = _mask_fixed_width(joined.encode("ascii"), _CARD_WIDTH, _CARD_TEMPLATE, _CARD_COLUMNS)
+        return _split_masked(data, flags, len(_CARD_TEMPLATE)), bytearray(flags)
+
+    masked = [f"{n[:4]} {n[4:6]}** **** {n[12:]}" if len(n) == 16 and n.isdigit() else "" for n in items]
+    return masked, bytearray(map(not_, masked))
+
+
+@instrumented
+def mask_accounts_bulk(numbers: object, record_width: int | None = None) -> tuple[list[str] | bytes, bytearray]:
+    """
+    Маскирует множество номеров счетов за один проход.
+
+    Args:
+        numbers: Последовательность номеров (str, bytes или int), массив NumPy
+                 либо один буфер bytes из записей фиксированной ширины
+        record_width: Ширина записи в буфере bytes (обязательна для буфера)
+
+    Returns:
+        Кортеж (маскированные номера, маска ошибок). Для буфера bytes
+        маскированные номера -- буфер из записей по 6 байт.
+
+    Examples:
+        >>> mask_accounts_bulk(["73654108430135874305", "12"])
+        (['**4305', ''], bytearray(b'\\x00\\x01'))
+    """
+    if isinstance(numbers, (bytes, bytearray, memoryview)):
+        if record_width is None:
+            raise ValueError("Для буфера bytes нужно указать record_width")
+        data = _check_buffer(numbers, record_width)
+        count = len(data) // record_width
+        if record_width < 4:
+            return b" " * (len(_ACCOUNT_TEMPLATE) * count), bytearray(b"\x01" * count)
+        columns = [(2 + i, record_width - 4 + i) for i in range(4)]
+        masked, flags = _mask_fixed_width(data, record_width, _ACCOUNT_TEMPLATE, columns)
+        return masked, bytearray(flags)
+
+    items = _as_items(numbers)
+    if set(map(type, items)) != {str}:
+        items = [_normalize(number, card=False) or "" for number in items]
+    masked = ["**" + n[-4:] if len(n) >= 4 and n.isdigit() else "" for n in items]
+    return masked, bytearray(map(not_, masked))
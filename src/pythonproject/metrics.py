@@ -0,0 +1,177 @@
+import importlib
+import json
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from . import instrument
+
+# Сколько последних замеров хранить для расчета перцентилей
+SAMPLE_SIZE = 4096
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Модуль пакета -> функции, обернутые instrument.instrumented при определении;
+# метрики подписываются модулем, в котором функция определена
+INSTRUMENTED: Dict[str, Tuple[str, ...]] = {
+    "masks": (
+        "get_mask_card_number", "get_mask_account", "mask_account_card", "mask_cards_bulk", "mask_accounts_bulk",
+    ),
+    "processing": ("filter_by_state", "sort_by_date", "latest_operations", "latest_operations_page"),
+    "generators": (
+        "filter_by_currency", "transaction_descriptions", "card_number_generator", "card_number_chunks",
+        "write_card_numbers",
+    ),
+    "widget": ("get_date", "print_operations"),
+    "dates": ("parse_epoch_us", "format_date", "date_keys"),
+}
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+
+class FunctionStats:
+    """Счетчики одной функции: вызовы, суммарное время, элементы, последние задержки."""
+
+    __slots__ = ("calls", "seconds", "items", "samples")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.items = 0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def record(self, elapsed: float, items: int) -> None:
+        self.calls += 1
+        self.seconds += elapsed
+        self.items += items
+        self.samples.append(elapsed)
+
+    def quantiles(self) -> Dict[float, float]:
+        """Перцентили задержки по последним SAMPLE_SIZE вызовам."""
+        if not self.samples:
+            return {q: 0.0 for q in QUANTILES}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {q: ordered[min(last, int(q * len(ordered)))] for q in QUANTILES}
+
+
+class Metrics:
+    """Набор счетчиков по функциям с экспортом в JSON и текстовый формат Prometheus."""
+
+    def __init__(self) -> None:
+        self.functions: Dict[str, FunctionStats] = {}
+
+    def stats(self, name: str) -> FunctionStats:
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = FunctionStats()
+        return stats
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for name, stats in sorted(self.functions.items()):
+            result[name] = {
+                "calls": stats.calls,
+                "seconds": stats.seconds,
+                "items": stats.items,
+                "quantiles": {str(q): value for q, value in stats.quantiles().items()},
+            }
+        return result
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Возвращает метрики в JSON и, если указан path, записывает в файл."""
+        text = json.dumps(self.as_dict(), ensure_ascii=False, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def to_prometheus(self, path: Optional[str] = None) -> str:
+        """Возвращает метрики в текстовом формате Prometheus и, если указан path, записывает в файл."""
+        lines = [
+            "# HELP pythonproject_calls_total Количество вызовов функции.",
+            "# TYPE pythonproject_calls_total counter",
+        ]
+        lines += [f'pythonproject_calls_total{{function="{n}"}} {s.calls}' for n, s in sorted(self.functions.items())]
+        lines += [
+            "# HELP pythonproject_items_total Количество обработанных элементов.",
+            "# TYPE pythonproject_items_total counter",
+        ]
+        lines += [f'pythonproject_items_total{{function="{n}"}} {s.items}' for n, s in sorted(self.functions.items())]
+        lines += [
+            "# HELP pythonproject_latency_seconds Время выполнения функции.",
+            "# TYPE pythonproject_latency_seconds summary",
+        ]
+        for name, stats in sorted(self.functions.items()):
+            for q, value in stats.quantiles().items():
+                lines.append(f'pythonproject_latency_seconds{{function="{name}",quantile="{q}"}} {value!r}')
+            lines.append(f'pythonproject_latency_seconds_sum{{function="{name}"}} {stats.seconds!r}')
+            lines.append(f'pythonproject_latency_seconds_count{{function="{name}"}} {stats.calls}')
+        text = "\n".join(lines) + "\n"
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def reset(self) -> None:
+        self.functions.clear()
+
+
+_current = Metrics()
+
+
+def current() -> Metrics:
+    """Текущий набор метрик, в который пишут обернутые функции."""
+    return _current
+
+
+def _record(name: str, elapsed: float, items: int) -> None:
+    _current.stats(name).record(elapsed, items)
+
+
+def is_enabled() -> bool:
+    return instrument.enabled()
+
+
+def enable() -> None:
+    """
+    Включает сбор метрик для функций INSTRUMENTED.
+
+    Функции обернуты один раз при определении (instrument.instrumented),
+    поэтому замеры идут и через ссылки, импортированные до включения,
+    например "from pythonproject.widget import print_operations".
+    В выключенном состоянии обертка только проверяет флаг. Включение
+    действует на весь процесс, счетчики общие для всех потоков.
+    """
+    for module_name in INSTRUMENTED:
+        importlib.import_module(f"{_PACKAGE}.{module_name}")
+    instrument.set_recorder(_record)
+
+
+def disable() -> None:
+    """Выключает сбор метрик."""
+    instrument.set_recorder(None)
+
+
+@contextmanager
+def measure() -> Iterator[Metrics]:
+    """
+    Включает метрики на время блока и собирает их в отдельный набор.
+
+    Examples:
+        >>> from pythonproject import masks
+        >>> with measure() as metrics:
+        ...     _ = masks.get_mask_account("73654108430135874305")
+        >>> metrics.functions["masks.get_mask_account"].calls
+        1
+    """
+    global _current
+    previous = _current
+    was_enabled = is_enabled()
+    _current = Metrics()
+    enable()
+    try:
+        yield _current
+    finally:
+        if not was_enabled:
+            disable()
+        _current = previous
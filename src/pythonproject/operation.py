@@ -0,0 +1,186 @@
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .batch import MISSING, format_amount, join_operation, split_operation
+from .dates import format_epoch_us
+
+# Компактная запись хвоста: без пробелов и без \uXXXX для кириллицы
+_encode_rest = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class Operation(Mapping):
+    """
+    Компактная запись операции со слотами вместо вложенных словарей.
+
+    Горячие поля разобраны заранее:
+        id          -- целый id или None
+        state       -- статус (интернированная строка) или None
+        date_key    -- дата в микросекундах от эпохи (dates.parse_epoch_us) или None
+        amount      -- сумма в минимальных единицах (batch.AMOUNT_SCALE) или None
+        currency    -- код валюты (интернированная строка) или None
+        description -- описание или None
+
+    Остальные поля (from, to, название валюты и значения, которые нельзя
+    без потерь восстановить из горячих полей) хранятся одной строкой JSON
+    в UTF-8 и разбираются только при обращении к ним.
+
+    Запись ведет себя как неизменяемый словарь исходной операции
+    (op["state"], op.get("from"), dict(op)), поэтому ее принимают функции
+    processing, generators и widget; горячие поля они читают напрямую.
+
+    Examples:
+        >>> op = Operation.from_dict({
+        ...     "id": 1, "state": "EXECUTED", "date": "2019-08-26T10:50:58.294041",
+        ...     "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+        ...     "description": "Перевод организации", "to": "Счет 64686473678894779589",
+        ... })
+        >>> op.currency, op.amount, op["to"]
+        ('RUB', 3195758, 'Счет 64686473678894779589')
+        >>> op["operationAmount"]
+        {'amount': '31957.58', 'currency': {'name': 'руб.', 'code': 'RUB'}}
+    """
+
+    __slots__ = ("id", "state", "date_key", "amount", "currency", "description", "_date", "_rest")
+
+    def __init__(
+            self,
+            op_id: Optional[int] = None,
+            state: Optional[str] = None,
+            date_key: Optional[int] = None,
+            amount: Optional[int] = None,
+            currency: Optional[str] = None,
+            description: Optional[str] = None,
+            rest: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.id = op_id
+        self.state = None if state is None else sys.intern(state)
+        self.date_key = date_key
+        self.amount = amount
+        self.currency = None if currency is None else sys.intern(currency)
+        self.description = description
+        # Исходная строка даты, если она не совпадает с format_epoch_us(date_key)
+        self._date: Optional[str] = None
+        self._rest: Union[None, bytes, Dict[str, Any]] = None
+        if rest:
+            try:
+                self._rest = _encode_rest(rest).encode("utf-8")
+            except (TypeError, ValueError):
+                # Значения, которых нет в JSON, хранятся как есть
+                self._rest = dict(rest)
+
+    @classmethod
+    def from_dict(cls, operation: Dict[str, Any]) -> "Operation":
+        """
+        Строит запись из словаря операции; dict(запись) равен исходному словарю.
+
+        Raises:
+            TypeError: Если операция не словарь
+        """
+        op_id, state, date_us, amount, currency, rest = split_operation(operation)
+        description = rest.get("description")
+        if isinstance(description, str):
+            del rest["description"]
+        else:
+            description = None
+        original_date = rest.pop("date", None) if date_us != MISSING else None
+        record = cls(
+            None if op_id == MISSING else op_id,
+            state,
+            None if date_us == MISSING else date_us,
+            None if amount == MISSING else amount,
+            currency,
+            description,
+            rest,
+        )
+        record._date = original_date
+        return record
+
+    @property
+    def date(self) -> Optional[str]:
+        """Дата в исходном виде; None, если дата отсутствует или невалидна."""
+        if self._date is not None:
+            return self._date
+        return None if self.date_key is None else format_epoch_us(self.date_key)
+
+    @property
+    def rest(self) -> Dict[str, Any]:
+        """Редко используемые поля; каждый вызов разбирает их заново."""
+        if self._rest is None:
+            return {}
+        if isinstance(self._rest, bytes):
+            return json.loads(self._rest)
+        return dict(self._rest)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Исходный словарь операции."""
+        rest = self.rest
+        if self.description is not None:
+            rest = {"description": self.description, **rest}
+        operation = join_operation(
+            MISSING if self.id is None else self.id,
+            self.state,
+            MISSING if self.date_key is None else self.date_key,
+            MISSING if self.amount is None else self.amount,
+            self.currency,
+            rest,
+        )
+        if self._date is not None:
+            operation["date"] = self._date
+        return operation
+
+    def __getitem__(self, key: str) -> Any:
+        # Горячие поля -- без разбора хвоста; None в слоте означает,
+        # что значения нет или оно нестандартное и лежит в хвосте
+        if key == "description":
+            if self.description is not None:
+                return self.description
+        elif key == "state":
+            if self.state is not None:
+                return self.state
+        elif key == "date":
+            if self.date_key is not None:
+                return self.date
+        elif key == "id":
+            if self.id is not None:
+                return self.id
+        elif key == "operationAmount":
+            return self.to_dict()[key]
+        return self.rest[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Operation):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (f"Operation(id={self.id!r}, state={self.state!r}, date={self.date!r}, "
+                f"amount={None if self.amount is None else format_amount(self.amount)!r}, "
+                f"currency={self.currency!r}, description={self.description!r})")
+
+
+def operations_from_dicts(operations: Iterable[Dict[str, Any]]) -> List[Operation]:
+    """
+    Переводит список или итератор словарей (например, loader.iter_operations) в записи Operation.
+
+    Examples:
+        >>> ops = operations_from_dicts([{"id": 1, "state": "EXECUTED"}, {"id": 2, "from": "Счет 1234"}])
+        >>> [op.state for op in ops], ops[1]["from"]
+        (['EXECUTED', None], 'Счет 1234')
+    """
+    return [Operation.from_dict(operation) for operation in operations]
@@ -0,0 +1,142 @@
+import heapq
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .dates import MIN_DATE_KEY, format_date, parse_epoch_us
+from .masks import mask_account_card
+from .report import operation_label
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 50_000
+# Сколько порций на процесс может быть в обработке одновременно
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+_first = itemgetter(0)
+
+
+def iter_chunks(operations: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Лениво делит операции на списки по chunk_size (последний может быть короче)."""
+    iterator = iter(operations)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def render_rows(
+        operations: Iterable[Tuple[int, Dict[str, Any]]],
+        state: Optional[str] = None
+) -> List[Tuple[int, int, str]]:
+    """
+    Фильтрует, разбирает даты, маскирует и сортирует порцию операций (выполняется в воркере).
+
+    Общий шаг render_operations_parallel и cluster.process_shard. Операции
+    с невалидной датой или описанием пропускаются и пишутся в журнал, как
+    в report.render_operations.
+
+    Args:
+        operations: Пары (позиция операции во входе, операция) по возрастанию позиций
+        state: Статус для фильтрации; None -- без фильтрации
+
+    Returns:
+        Строки (ключ даты, позиция, строка отчета) от новых к старым
+
+    Examples:
+        >>> render_rows([(0, {"date": "2023-01-01", "description": "Счет 73654108430135874305"}),
+        ...              (3, {"date": "2023-01-02", "description": "Счет 73654108430135874306"})])
+        [(1672617600000000, 3, '02.01.2023 Счет **4306'), (1672531200000000, 0, '01.01.2023 Счет **4305')]
+    """
+    rows = []
+    for position, op in operations:
+        try:
+            if state is not None and op.get("state") != state:
+                continue
+            line = f"{format_date(op['date'])} {mask_account_card(op['description'])}"
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            logger.warning("Операция %s пропущена: %s", operation_label(op, position), error)
+            continue
+        key = parse_epoch_us(op["date"])
+        rows.append((MIN_DATE_KEY if key is None else key, position, line))
+    # Позиции возрастают, поэтому стабильная сортировка оставляет операции
+    # с равной датой в порядке входа -- как в sort_by_date
+    rows.sort(key=_first, reverse=True)
+    return rows
+
+
+def _process_chunk(chunk: List[Dict[str, Any]], state: Optional[str], offset: int = 0) -> List[Tuple[int, int, str]]:
+    # offset -- позиция первой операции порции во входе
+    return render_rows(enumerate(chunk, offset), state)
+
+
+def render_operations_parallel(
+        operations: Iterable[Dict[str, Any]],
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        state: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Формирует строки отчета print_operations на нескольких ядрах.
+
+    Операции делятся на порции по chunk_size; фильтрация, разбор дат и
+    маскировка выполняются в ProcessPoolExecutor, после чего отсортированные
+    порции сливаются k-way слиянием. Вход читается лениво: в обработке
+    не больше CHUNKS_IN_FLIGHT_PER_WORKER порций на процесс, следующая
+    порция отправляется, когда готова самая ранняя. Слияние стабильно,
+    поэтому порядок строк в точности совпадает с последовательным
+    print_operations; операции с невалидной датой или описанием, как и там,
+    пропускаются и записываются в журнал.
+
+    Args:
+        operations: Список или итератор операций
+        workers: Количество процессов; 1 -- без пула, None -- по числу ядер
+        chunk_size: Размер порции операций
+        state: Статус для фильтрации; None -- без фильтрации
+
+    Yields:
+        Строки вида "DD.MM.YYYY <замаскированное описание>"
+
+    Raises:
+        ValueError: Если количество процессов или размер порции не положительные
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    if workers is not None and workers <= 0:
+        raise ValueError("Количество процессов должно быть положительным")
+
+    chunks = iter_chunks(operations, chunk_size)
+    runs: List[List[Tuple[int, int, str]]] = []
+    if workers == 1:
+        for number, chunk in enumerate(chunks):
+            runs.append(_process_chunk(chunk, state, number * chunk_size))
+    else:
+        window = CHUNKS_IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight: Deque[Future] = deque()
+            for number, chunk in enumerate(chunks):
+                if len(in_flight) >= window:
+                    runs.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(_process_chunk, chunk, state, number * chunk_size))
+            while in_flight:
+                runs.append(in_flight.popleft().result())
+
+    # Порции идут в порядке входа, поэтому при равных датах слияние сохраняет порядок входа
+    for _, _, line in heapq.merge(*runs, key=_first, reverse=True):
+        yield line
+
+
+def print_operations_parallel(
+        operations: Iterable[Dict[str, Any]],
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        state: Optional[str] = None
+) -> None:
+    """Параллельный аналог widget.print_operations."""
+    for line in render_operations_parallel(operations, workers, chunk_size, state):
+        print(line)
@@ -1,55 +1,185 @@
-from typing import List, Dict, Any, Literal
-from datetime import datetime
+import heapq
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterable, Literal, Optional, Union
 
+from .batch import MISSING, OperationBatch
+from .dates import MIN_DATE_KEY, date_keys, date_sort_key, parse_epoch_us
+from .instrument import instrumented
+from .operation import Operation
+from .store import OperationStore
 
+
+DateErrors = Literal["lenient", "strict"]
+
+
+@instrumented
 def filter_by_state(
-        operations: List[Dict[str, Any]],
+        operations: Union[List[Dict[str, Any]], List[Operation], OperationBatch, OperationStore],
         state: Literal["EXECUTED", "CANCELED", "PENDING"] = "EXECUTED"
-) -> List[Dict[str, Any]]:
+) -> Union[List[Dict[str, Any]], "array[int]"]:
     """
     Фильтрует операции по статусу.
 
     Args:
-        operations: Список операций
+        operations: Список операций (словарей или Operation), OperationBatch или OperationStore
         state: Статус для фильтрации (по умолчанию "EXECUTED")
 
     Returns:
-        Отфильтрованный список операций
+        Отфильтрованный список операций; для OperationBatch и OperationStore -- массив индексов строк
 
     Examples:
         >>> filter_by_state([{"state": "EXECUTED"}])
         [{'state': 'EXECUTED'}]
     """
+    if isinstance(operations, (OperationBatch, OperationStore)):
+        return operations.select_state(state)
     if not isinstance(operations, list):
         raise TypeError("Ожидается список операций")
+    if isinstance(state, str) and operations and type(operations[0]) is Operation:
+        # Список записей: статус уже разобран, непустой слот совпадает с op["state"]
+        return [op for op in operations if (op.state if type(op) is Operation else op.get("state")) == state]
     return [op for op in operations if op.get("state") == state]
 
 
+@instrumented
 def sort_by_date(
-        operations: List[Dict[str, Any]],
-        reverse: bool = True
-) -> List[Dict[str, Any]]:
+        operations: Union[List[Dict[str, Any]], List[Operation], OperationBatch, OperationStore],
+        reverse: bool = True,
+        keys: Optional[List[Optional[int]]] = None,
+        errors: DateErrors = "lenient"
+) -> Union[List[Dict[str, Any]], "array[int]"]:
     """
     Сортирует операции по дате.
 
+    В мягком режиме (по умолчанию) операции без даты или с невалидной датой
+    оказываются в конце в исходном порядке. В строгом режиме такие операции
+    считаются ошибкой.
+
     Args:
-        operations: Список операций
+        operations: Список операций (словарей или Operation), OperationBatch или OperationStore
         reverse: Если True - новые сначала (по умолчанию)
+        keys: Ключи из dates.date_keys(operations) для повторных сортировок
+              того же списка без повторного разбора дат
+        errors: "lenient" или "strict"
 
     Returns:
-        Отсортированный список операций
+        Отсортированный список операций; для OperationBatch и OperationStore -- массив индексов строк
+
+    Raises:
+        KeyError: В строгом режиме, если у операции нет ключа 'date'
+        ValueError: В строгом режиме, если дата в неверном формате
 
     Examples:
         >>> sort_by_date([{"date": "2023-01-01"}, {"date": "2023-01-02"}])
         [{'date': '2023-01-02'}, {'date': '2023-01-01'}]
+        >>> sort_by_date([{"id": 7, "date": "bad"}], errors="strict")
+        Traceback (most recent call last):
+        ...
+        ValueError: Неверный формат даты в операции 7: bad
     """
+    if errors not in ("lenient", "strict"):
+        raise ValueError(f"Неизвестный режим ошибок дат: {errors}")
+    if isinstance(operations, (OperationBatch, OperationStore)):
+        if errors == "strict" and MISSING in operations.dates:
+            raise ValueError("В операциях есть отсутствующие или невалидные даты")
+        return operations.argsort_by_date(reverse)
     if not isinstance(operations, list):
         raise TypeError("Ожидается список операций")
 
-    def get_date(op):
-        try:
-            return datetime.fromisoformat(op["date"])
-        except (KeyError, ValueError, TypeError):
-            return datetime.min if reverse else datetime.max
+    if keys is None:
+        if errors == "lenient" and not (operations and type(operations[0]) is Operation):
+            # Разовая сортировка словарей -- один проход sorted с функцией-ключом,
+            # без промежуточного списка ключей и перестановки номеров строк
+            return sorted(operations, key=date_sort_key(operations, reverse), reverse=reverse)
+        # Записи Operation хранят готовые ключи-микросекунды
+        keys = date_keys(operations)
+    elif len(keys) != len(operations):
+        raise ValueError("Количество ключей не совпадает с количеством операций")
+    if errors == "strict" and None in keys:
+        _raise_date_error(operations[keys.index(None)])
+
+    # Сортируются номера строк с валидной датой (стабильно и при reverse=True),
+    # операции без даты добавляются в конец в исходном порядке
+    order = [i for i, key in enumerate(keys) if key is not None]
+    order.sort(key=keys.__getitem__, reverse=reverse)
+    if len(order) < len(keys):
+        order.extend(i for i, key in enumerate(keys) if key is None)
+    return [operations[i] for i in order]
+
+
+def _raise_date_error(op: Any) -> None:
+    op_id = op.get("id", "без ID") if isinstance(op, Mapping) else "без ID"
+    if not isinstance(op, Mapping) or "date" not in op:
+        raise KeyError(f"Операция {op_id} не содержит ключа 'date'")
+    raise ValueError(f"Неверный формат даты в операции {op_id}: {op['date']}")
+
+
+def _latest_key(op: Dict[str, Any]) -> int:
+    if type(op) is Operation:
+        key = op.date_key
+        return MIN_DATE_KEY if key is None else key
+    try:
+        key = parse_epoch_us(op["date"])
+    except (KeyError, TypeError):
+        return MIN_DATE_KEY
+    return MIN_DATE_KEY if key is None else key
+
+
+@instrumented
+def latest_operations(
+        operations: Iterable[Dict[str, Any]],
+        k: int,
+        state: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Возвращает k самых новых операций без полной сортировки.
 
-    return sorted(operations, key=get_date, reverse=reverse)
+    Результат совпадает с sort_by_date(filter_by_state(operations, state))[:k],
+    но фильтрация и отбор выполняются за один проход с кучей размера k:
+    O(n log k) по времени и O(k) по памяти. Принимает любой итерируемый
+    источник, в том числе потоковый loader.iter_operations.
+
+    Args:
+        operations: Список или итератор операций
+        k: Сколько операций вернуть
+        state: Статус для фильтрации; None -- без фильтрации
+
+    Returns:
+        Не более k операций, новые сначала
+
+    Examples:
+        >>> ops = [{"id": 1, "date": "2023-01-01"}, {"id": 2, "date": "2023-01-03"}, {"id": 3, "date": "2023-01-02"}]
+        >>> [op["id"] for op in latest_operations(ops, 2)]
+        [2, 3]
+    """
+    if k <= 0:
+        return []
+    if isinstance(state, str):
+        operations = (op for op in operations if (op.state if type(op) is Operation else op.get("state")) == state)
+    elif state is not None:
+        operations = (op for op in operations if op.get("state") == state)
+    return heapq.nlargest(k, operations, key=_latest_key)
+
+
+@instrumented
+def latest_operations_page(
+        operations: Iterable[Dict[str, Any]],
+        offset: int,
+        limit: int,
+        state: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Возвращает страницу самых новых операций: limit штук, пропустив offset.
+
+    Эквивалентно sort_by_date(filter_by_state(operations, state))[offset:offset + limit]
+    при памяти O(offset + limit).
+
+    Examples:
+        >>> ops = [{"id": i, "date": f"2023-01-0{i}"} for i in range(1, 6)]
+        >>> [op["id"] for op in latest_operations_page(ops, offset=2, limit=2)]
+        [3, 2]
+    """
+    if offset < 0 or limit < 0:
+        raise ValueError("offset и limit не могут быть отрицательными")
+    return latest_operations(operations, offset + limit, state)[offset:]
@@ -0,0 +1,152 @@
+from collections.abc import Mapping
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .operation import Operation
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Значение-маркер «условие не задано» (None -- допустимое значение поля)
+_ANY = object()
+# Значение-маркер для противоречивых условий: ни одна операция не подходит
+_NOTHING = object()
+
+
+class Query:
+    """
+    Ленивый запрос к операциям с объединением фильтров в один проход.
+
+    Условия и проекция накапливаются цепочкой вызовов и выполняются одним
+    генератором без промежуточных списков; limit() останавливает проход,
+    как только набрано нужное количество результатов. Каждый вызов
+    возвращает новый Query, исходный не меняется.
+
+    Результаты совпадают с цепочкой существующих функций, например
+    Query(ops).where_state("EXECUTED").where_currency("USD").select("description")
+    дает то же, что
+    transaction_descriptions(filter_by_currency(filter_by_state(ops, "EXECUTED"), "USD")).
+
+    Examples:
+        >>> ops = [
+        ...     {"state": "EXECUTED", "operationAmount": {"currency": {"code": "USD"}}, "description": "A"},
+        ...     {"state": "CANCELED", "operationAmount": {"currency": {"code": "USD"}}, "description": "B"},
+        ... ]
+        >>> list(Query(ops).where_state("EXECUTED").where_currency("usd").select("description"))
+        ['A']
+    """
+
+    __slots__ = ("_source", "_state", "_currency", "_predicates", "_fields", "_limit")
+
+    def __init__(self, operations: Iterable[Dict[str, Any]]) -> None:
+        self._source = operations
+        self._state: Any = _ANY
+        self._currency: Any = _ANY
+        self._predicates: Tuple[Predicate, ...] = ()
+        self._fields: Tuple[str, ...] = ()
+        self._limit: Optional[int] = None
+
+    def _copy(self) -> "Query":
+        query = Query(self._source)
+        query._state = self._state
+        query._currency = self._currency
+        query._predicates = self._predicates
+        query._fields = self._fields
+        query._limit = self._limit
+        return query
+
+    @staticmethod
+    def _combine(current: Any, value: Any) -> Any:
+        if current is _ANY or current == value:
+            return value
+        return _NOTHING
+
+    def where_state(self, state: str = "EXECUTED") -> "Query":
+        """Условие как в processing.filter_by_state."""
+        query = self._copy()
+        query._state = self._combine(self._state, state)
+        return query
+
+    def where_currency(self, currency: str) -> "Query":
+        """Условие как в generators.filter_by_currency (регистр кода не важен)."""
+        query = self._copy()
+        query._currency = self._combine(self._currency, currency.upper())
+        return query
+
+    def where(self, predicate: Predicate) -> "Query":
+        """Произвольное условие над словарем операции."""
+        query = self._copy()
+        query._predicates = self._predicates + (predicate,)
+        return query
+
+    def select(self, *fields: str) -> "Query":
+        """
+        Проекция: одно поле -- значения поля, несколько -- кортежи значений.
+
+        Операции без нужного поля пропускаются, как в transaction_descriptions.
+        """
+        if not fields:
+            raise ValueError("Нужно указать хотя бы одно поле")
+        query = self._copy()
+        query._fields = fields
+        return query
+
+    def limit(self, count: int) -> "Query":
+        """Ограничивает количество результатов; проход останавливается досрочно."""
+        if count < 0:
+            raise ValueError("Ограничение не может быть отрицательным")
+        query = self._copy()
+        query._limit = count if self._limit is None else min(self._limit, count)
+        return query
+
+    def _scan(self) -> Iterator[Any]:
+        state = self._state
+        currency = self._currency
+        if state is _NOTHING or currency is _NOTHING:
+            return
+        predicates = self._predicates
+        fields = self._fields
+        single = fields[0] if len(fields) == 1 else None
+
+        for op in self._source:
+            record = type(op) is Operation
+            if not record and type(op) is not dict and not isinstance(op, Mapping):
+                continue
+            if state is not _ANY and op.get("state") != state:
+                continue
+            if currency is not _ANY:
+                if record:
+                    # Код валюты записи разобран заранее (None -- нет строкового кода)
+                    if op.currency != currency:
+                        continue
+                else:
+                    try:
+                        if op["operationAmount"]["currency"]["code"] != currency:
+                            continue
+                    except (KeyError, TypeError):
+                        continue
+            if predicates and not all(predicate(op) for predicate in predicates):
+                continue
+
+            if not fields:
+                yield op
+            elif single is not None:
+                if single in op:
+                    yield op[single]
+            else:
+                try:
+                    yield tuple(op[field] for field in fields)
+                except KeyError:
+                    continue
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._limit is None:
+            return self._scan()
+        return islice(self._scan(), self._limit)
+
+    def to_list(self) -> List[Any]:
+        """Выполняет запрос и возвращает список результатов."""
+        return list(self)
+
+    def count(self) -> int:
+        """Количество результатов без построения списка."""
+        return sum(1 for _ in self)
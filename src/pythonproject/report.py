@@ -0,0 +1,163 @@
+import csv
+import json
+import logging
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Literal, Tuple
+
+from .dates import format_date
+from .masks import mask_account_card
+
+logger = logging.getLogger(__name__)
+
+# Сколько символов копить перед одной записью в поток
+DEFAULT_BUFFER_SIZE = 1 << 20
+CSV_FIELDS = ("id", "date", "description", "amount", "currency")
+
+ReportStats = namedtuple("ReportStats", ["written", "errors"])
+
+OutputFormat = Literal["text", "csv", "jsonl"]
+
+# Готовый кодировщик: json.dumps с параметрами создает новый на каждый вызов
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _amount_fields(op: Dict[str, Any]) -> Tuple[Any, Any]:
+    operation_amount = op.get("operationAmount")
+    if not isinstance(operation_amount, dict):
+        return None, None
+    currency = operation_amount.get("currency")
+    return operation_amount.get("amount"), currency.get("code") if isinstance(currency, dict) else None
+
+
+def _format_text(op: Dict[str, Any]) -> str:
+    return f"{format_date(op['date'])} {mask_account_card(op['description'])}\n"
+
+
+def _format_jsonl(op: Dict[str, Any]) -> str:
+    date = format_date(op["date"])
+    description = mask_account_card(op["description"])
+    amount, currency = _amount_fields(op)
+    record = {"id": op.get("id"), "date": date, "description": description, "amount": amount, "currency": currency}
+    return _encode_json(record) + "\n"
+
+
+class _LastLine:
+    """Приемник для csv.writer: запоминает последнюю записанную строку."""
+
+    __slots__ = ("line",)
+
+    def __init__(self) -> None:
+        self.line = ""
+
+    def write(self, line: str) -> None:
+        self.line = line
+
+
+def _csv_formatter() -> Tuple[str, Callable[[Dict[str, Any]], str]]:
+    sink = _LastLine()
+    writer = csv.writer(sink, lineterminator="\n")
+    writer.writerow(CSV_FIELDS)
+    header = sink.line
+
+    def format_csv(op: Dict[str, Any]) -> str:
+        date = format_date(op["date"])
+        description = mask_account_card(op["description"])
+        amount, currency = _amount_fields(op)
+        writer.writerow((op.get("id"), date, description, amount, currency))
+        return sink.line
+
+    return header, format_csv
+
+
+def operation_label(op: Any, position: int) -> str:
+    """
+    Подпись операции для журнала пропусков: id, если он есть, иначе позиция во входе.
+
+    Examples:
+        >>> operation_label({"id": 7}, 3), operation_label({}, 3)
+        ('id=7', '#3')
+    """
+    if isinstance(op, Mapping) and "id" in op:
+        return f"id={op['id']!r}"
+    return f"#{position}"
+
+
+def render_operations(
+        operations: Iterable[Dict[str, Any]],
+        out: BinaryIO,
+        output_format: OutputFormat = "text",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        encoding: str = "utf-8"
+) -> ReportStats:
+    """
+    Записывает отчет по операциям в бинарный поток через большой буфер.
+
+    Операции выводятся в переданном порядке. Строки копятся в памяти и
+    пишутся в поток одним вызовом write() примерно по buffer_size символов.
+    Операция с невалидной датой или описанием не прерывает отчет: она
+    пропускается, ошибка пишется в журнал (logging, уровень WARNING)
+    и учитывается в счетчике.
+
+    Форматы:
+        text  -- "DD.MM.YYYY <замаскированное описание>", как в print_operations
+        csv   -- заголовок и колонки CSV_FIELDS
+        jsonl -- по одному JSON-объекту с полями CSV_FIELDS в строке
+
+    Args:
+        operations: Список или итератор операций
+        out: Бинарный поток (файл, sys.stdout.buffer, сокет через makefile("wb"))
+        output_format: "text", "csv" или "jsonl"
+        buffer_size: Размер буфера в символах
+        encoding: Кодировка вывода
+
+    Returns:
+        ReportStats(written, errors) -- сколько операций выведено и пропущено
+
+    Raises:
+        ValueError: Если формат неизвестен или размер буфера не положительный
+
+    Examples:
+        >>> import io
+        >>> out = io.BytesIO()
+        >>> render_operations([
+        ...     {"date": "2019-08-26T10:50:58.294041", "description": "Счет 64686473678894779589"},
+        ...     {"date": "invalid-date", "description": "Счет 64686473678894779589"},
+        ... ], out)
+        ReportStats(written=1, errors=1)
+        >>> out.getvalue().decode()
+        '26.08.2019 Счет **9589\\n'
+    """
+    if buffer_size <= 0:
+        raise ValueError("Размер буфера должен быть положительным")
+    parts: List[str] = []
+    if output_format == "text":
+        formatter = _format_text
+    elif output_format == "jsonl":
+        formatter = _format_jsonl
+    elif output_format == "csv":
+        header, formatter = _csv_formatter()
+        parts.append(header)
+    else:
+        raise ValueError(f"Неизвестный формат отчета: {output_format}")
+
+    append = parts.append
+    pending = sum(map(len, parts))
+    written = errors = 0
+    for position, op in enumerate(operations):
+        try:
+            line = formatter(op)
+        except (KeyError, TypeError, ValueError) as error:
+            errors += 1
+            logger.warning("Операция %s пропущена: %s", operation_label(op, position), error)
+            continue
+        append(line)
+        written += 1
+        pending += len(line)
+        if pending >= buffer_size:
+            out.write("".join(parts).encode(encoding))
+            parts.clear()
+            pending = 0
+    if parts:
+        out.write("".join(parts).encode(encoding))
+    return ReportStats(written, errors)
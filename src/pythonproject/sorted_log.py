@@ -0,0 +1,165 @@
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .dates import DateBound, date_keys, parse_date_bound
+
+# Пакеты меньше этого размера вставляются по одной операции через bisect,
+# большие -- сливаются с уже отсортированными операциями за один проход
+MERGE_THRESHOLD = 64
+
+
+class SortedOperationLog:
+    """
+    Журнал операций, который остается упорядоченным по дате при добавлении.
+
+    Операции с валидной датой хранятся в двух параллельных списках
+    (ключи дат и сами операции) по возрастанию даты, при равных датах --
+    в порядке добавления. Операции без даты или с невалидной датой лежат
+    отдельно в порядке добавления. Поэтому порядок обхода в точности
+    совпадает с processing.sort_by_date для списка всех добавленных
+    операций, а сортировка всего журнала после каждого пакета не нужна.
+
+    Examples:
+        >>> log = SortedOperationLog([{"id": 1, "date": "2023-01-01"}, {"id": 2, "date": "bad"}])
+        >>> log.extend([{"id": 3, "date": "2023-01-03"}, {"id": 4, "date": "2023-01-02"}])
+        >>> [op["id"] for op in log]
+        [3, 4, 1, 2]
+        >>> [op["id"] for op in log.range("2023-01-02", "2023-01-03")]
+        [4]
+    """
+
+    __slots__ = ("_keys", "_ops", "_undated")
+
+    def __init__(self, operations: Iterable[Dict[str, Any]] = ()) -> None:
+        self._keys: List[int] = []
+        self._ops: List[Dict[str, Any]] = []
+        self._undated: List[Dict[str, Any]] = []
+        self.extend(operations)
+
+    def __len__(self) -> int:
+        return len(self._ops) + len(self._undated)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Обход от новых к старым, как sort_by_date(operations)."""
+        return self.newest_first()
+
+    def append(self, operation: Dict[str, Any]) -> None:
+        """Добавляет операцию за O(log n) сравнений и один сдвиг списка."""
+        key = date_keys((operation,))[0]
+        if key is None:
+            self._undated.append(operation)
+            return
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ops.insert(position, operation)
+
+    def extend(self, operations: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пакет операций.
+
+        Небольшие пакеты вставляются по одной операции; большие
+        сортируются и сливаются с хвостом журнала, начиная с самой ранней
+        даты пакета: O(m log m + t), где t -- длина затронутого хвоста.
+        """
+        batch = operations if isinstance(operations, list) else list(operations)
+        if len(batch) < MERGE_THRESHOLD:
+            for operation in batch:
+                self.append(operation)
+            return
+
+        batch_keys = date_keys(batch)
+        new_keys = []
+        new_ops = []
+        for key, operation in zip(batch_keys, batch):
+            if key is None:
+                self._undated.append(operation)
+            else:
+                new_keys.append(key)
+                new_ops.append(operation)
+        if not new_keys:
+            return
+
+        order = sorted(range(len(new_keys)), key=new_keys.__getitem__)
+        new_keys = [new_keys[i] for i in order]
+        new_ops = [new_ops[i] for i in order]
+        # Затрагивается только хвост журнала начиная с самой ранней даты пакета;
+        # для потока свежих операций он пуст или короток
+        tail = bisect_right(self._keys, new_keys[0])
+        if tail == len(self._keys):
+            self._keys.extend(new_keys)
+            self._ops.extend(new_ops)
+            return
+        keys = self._keys[tail:] + new_keys
+        ops = self._ops[tail:] + new_ops
+        # Сортировка стабильна и находит готовые отсортированные серии, поэтому
+        # хвост сливается с пакетом за линейное время, а старые операции
+        # остаются раньше новых при равных датах
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys[tail:] = [keys[i] for i in order]
+        self._ops[tail:] = [ops[i] for i in order]
+
+    def _descending(self, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        # От больших ключей к меньшим, но операции с равной датой -- в порядке добавления
+        keys, ops = self._keys, self._ops
+        while end > start:
+            last = end - 1
+            key = keys[last]
+            if last == start or keys[last - 1] != key:
+                yield ops[last]
+                end = last
+                continue
+            first = bisect_left(keys, key, start, last)
+            yield from ops[first:end]
+            end = first
+
+    def newest_first(self) -> Iterator[Dict[str, Any]]:
+        """Операции от новых к старым; без валидной даты -- в конце."""
+        yield from self._descending(0, len(self._keys))
+        yield from self._undated
+
+    def oldest_first(self) -> Iterator[Dict[str, Any]]:
+        """Операции от старых к новым; без валидной даты -- в конце."""
+        yield from self._ops
+        yield from self._undated
+
+    def to_list(self, reverse: bool = True) -> List[Dict[str, Any]]:
+        """Список операций, равный sort_by_date(все добавленные операции, reverse)."""
+        if reverse:
+            return list(self.newest_first())
+        return self._ops + self._undated
+
+    def latest(self, k: int) -> List[Dict[str, Any]]:
+        """k самых новых операций, как sort_by_date(...)[:k]."""
+        if k <= 0:
+            return []
+        return list(islice(self.newest_first(), k))
+
+    def range(
+            self,
+            date_from: DateBound = None,
+            date_to: DateBound = None,
+            reverse: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Операции с датой в диапазоне [date_from, date_to) за O(log n + k).
+
+        Операции без валидной даты в диапазон не попадают.
+
+        Args:
+            date_from: Начало диапазона включительно (None -- без границы)
+            date_to: Конец диапазона не включительно (None -- без границы)
+            reverse: Если True - новые сначала (по умолчанию)
+
+        Raises:
+            ValueError: Если граница диапазона невалидна
+        """
+        start_key = parse_date_bound(date_from)
+        end_key = parse_date_bound(date_to)
+        start = 0 if start_key is None else bisect_left(self._keys, start_key)
+        end = len(self._keys) if end_key is None else bisect_left(self._keys, end_key)
+        if start >= end:
+            return []
+        if reverse:
+            return list(self._descending(start, end))
+        return self._ops[start:end]
@@ -0,0 +1,313 @@
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .batch import argsort_dates, join_operation, select_codes, split_operation
+
+MAGIC = b"OPSTORE1"
+VERSION = 1
+
+# Секции файла по порядку; колонки фиксированной ширины идут первыми
+_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ids", "q"),            # id операции или MISSING
+    ("dates", "q"),          # микросекунды от эпохи или MISSING
+    ("amounts", "q"),        # сумма в минимальных единицах или MISSING
+    ("states", "H"),         # код статуса, 0 -- нет значения
+    ("currencies", "H"),     # код валюты, 0 -- нет значения
+    ("flags", "B"),          # _HAS_DESCRIPTION
+    ("text_offsets", "Q"),   # count + 1 смещений в куче описаний
+    ("extra_offsets", "Q"),  # count + 1 смещений в куче остальных полей
+)
+_HEAPS = ("text_heap", "extra_heap", "tables")
+_SECTIONS = tuple(name for name, _ in _COLUMNS) + _HEAPS
+
+# Заголовок: сигнатура, версия, число операций, затем (смещение, размер) каждой секции
+_HEADER = struct.Struct("<8sIxxxxQ" + "QQ" * len(_SECTIONS))
+_ALIGN = 8
+_HAS_DESCRIPTION = 1
+# Колонки в файле всегда little-endian, как и заголовок; на big-endian
+# хосте они переставляются при записи и копируются с перестановкой при чтении
+_BYTESWAP = sys.byteorder != "little"
+
+# Заглушка колонок закрытого хранилища: любое обращение -- ValueError, как у освобожденного memoryview
+_RELEASED = memoryview(b"")
+_RELEASED.release()
+
+
+def _pad(f: BinaryIO) -> None:
+    position = f.tell()
+    if position % _ALIGN:
+        f.write(b"\0" * (_ALIGN - position % _ALIGN))
+
+
+def write_store(operations: Iterable[Dict[str, Any]], path: str) -> int:
+    """
+    Записывает операции в бинарное хранилище для быстрой загрузки.
+
+    Поля id, date, state, код валюты и сумма хранятся колонками
+    фиксированной ширины, описания -- в куче строк UTF-8, остальные поля
+    (счета, название валюты, значения, которые нельзя восстановить
+    из колонок без потерь) -- в отдельной куче JSON. Кучи пишутся на диск
+    по мере чтения операций, в памяти держатся только колонки.
+
+    Args:
+        operations: Список или итератор операций (например, loader.iter_operations)
+        path: Путь к файлу хранилища
+
+    Returns:
+        Количество записанных операций
+
+    Raises:
+        TypeError: Если операция не словарь или содержит несериализуемые в JSON значения
+    """
+    columns = {name: array(code) for name, code in _COLUMNS}
+    tables: Dict[str, Dict[str, int]] = {"states": {}, "currencies": {}}
+    columns["text_offsets"].append(0)
+    columns["extra_offsets"].append(0)
+    text_size = extra_size = 0
+
+    def code_of(table: Dict[str, int], value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        code = table.get(value)
+        if code is None:
+            code = table[value] = len(table) + 1
+            if code >= 1 << 16:
+                raise ValueError("Слишком много различных значений для интернирования")
+        return code
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with open(path, "wb") as f, tempfile.TemporaryFile(dir=directory) as extra:
+        f.write(b"\0" * _HEADER.size)
+        _pad(f)
+        text_start = f.tell()
+        for operation in operations:
+            op_id, state, date_us, amount, currency, rest = split_operation(operation)
+            columns["ids"].append(op_id)
+            columns["dates"].append(date_us)
+            columns["amounts"].append(amount)
+            columns["states"].append(code_of(tables["states"], state))
+            columns["currencies"].append(code_of(tables["currencies"], currency))
+
+            description = rest.get("description")
+            if isinstance(description, str):
+                del rest["description"]
+                data = description.encode("utf-8", "surrogatepass")
+                f.write(data)
+                text_size += len(data)
+                columns["flags"].append(_HAS_DESCRIPTION)
+            else:
+                columns["flags"].append(0)
+            columns["text_offsets"].append(text_size)
+
+            if rest:
+                data = json.dumps(rest, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+                extra.write(data)
+                extra_size += len(data)
+            columns["extra_offsets"].append(extra_size)
+
+        sections: Dict[str, Tuple[int, int]] = {"text_heap": (text_start, text_size)}
+        _pad(f)
+        extra.seek(0)
+        sections["extra_heap"] = (f.tell(), extra_size)
+        shutil.copyfileobj(extra, f, 1 << 20)
+        for name, _ in _COLUMNS:
+            _pad(f)
+            column = columns[name]
+            sections[name] = (f.tell(), len(column) * column.itemsize)
+            if _BYTESWAP:
+                column.byteswap()
+            column.tofile(f)
+        data = json.dumps({name: list(table) for name, table in tables.items()}, ensure_ascii=False).encode("utf-8")
+        sections["tables"] = (f.tell(), len(data))
+        f.write(data)
+
+        count = len(columns["ids"])
+        fields = [value for name in _SECTIONS for value in sections[name]]
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, count, *fields))
+    return count
+
+
+class OperationStore:
+    """
+    Хранилище операций, отображенное в память через mmap.
+
+    Открытие читает только заголовок и таблицы кодов, поэтому занимает
+    одно и то же время независимо от размера файла; данные подгружаются
+    операционной системой по мере обращения. Колонки ids, dates, amounts,
+    states и currencies -- memoryview прямо над файлом, без копирования
+    (на big-endian хосте -- копии с переставленными байтами).
+
+    Набор методов совпадает с OperationBatch, поэтому хранилище можно
+    передавать в processing.filter_by_state, processing.sort_by_date,
+    generators.filter_by_currency и generators.transaction_descriptions.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "ops.bin")
+        >>> write_store([{"id": 1, "state": "EXECUTED", "description": "Открытие вклада"}], path)
+        1
+        >>> with OperationStore(path) as store:
+        ...     len(store), store.description(0), store.to_dicts()
+        (1, 'Открытие вклада', [{'id': 1, 'state': 'EXECUTED', 'description': 'Открытие вклада'}])
+    """
+
+    def __init__(self, path: str) -> None:
+        self._closed = False
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _open(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Файл не является хранилищем операций")
+        magic, version, count, *fields = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Файл не является хранилищем операций")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия хранилища: {version}")
+
+        self._count = count
+        self._buffer = memoryview(self._mmap)
+        self._views: List[memoryview] = [self._buffer]
+        sections = {name: (fields[2 * i], fields[2 * i + 1]) for i, name in enumerate(_SECTIONS)}
+        for name, code in _COLUMNS:
+            view = self._section(sections, name)
+            self._views.append(view)
+            view = view.cast(code)
+            expected = count + 1 if name.endswith("_offsets") else count
+            if len(view) != expected:
+                raise ValueError(f"Поврежденная секция {name}")
+            if _BYTESWAP:
+                column = array(code, view)
+                column.byteswap()
+                view = memoryview(column)
+            self._views.append(view)
+            setattr(self, name, view)
+        self._text = self._section(sections, "text_heap")
+        self._extra = self._section(sections, "extra_heap")
+        self._views += [self._text, self._extra]
+        tables = json.loads(bytes(self._section(sections, "tables")))
+        self._state_values: List[Optional[str]] = [None] + tables["states"]
+        self._currency_values: List[Optional[str]] = [None] + tables["currencies"]
+        self._state_codes = {value: code for code, value in enumerate(self._state_values) if code}
+        self._currency_codes = {value: code for code, value in enumerate(self._currency_values) if code}
+
+    def _section(self, sections: Dict[str, Tuple[int, int]], name: str) -> memoryview:
+        offset, size = sections[name]
+        if offset + size > len(self._mmap):
+            raise ValueError(f"Поврежденная секция {name}")
+        return self._buffer[offset:offset + size]
+
+    def close(self) -> None:
+        """
+        Освобождает отображение файла.
+
+        Колонки, полученные из хранилища, после закрытия использовать нельзя.
+        Если у вызывающего кода остались срезы колонок (store.dates[0:2]),
+        хранилище отпускает свои ссылки, а файл перестает быть отображенным,
+        когда удален последний срез.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        views, self._views = self._views, []
+        for name, _ in _COLUMNS:
+            setattr(self, name, _RELEASED)
+        self._buffer = self._text = self._extra = _RELEASED
+        for view in reversed(views):
+            try:
+                view.release()
+            except BufferError:
+                pass  # view экспортирован; он освободится вместе с последним срезом
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # отображение закроется при сборке последнего среза
+        self._mmap = None
+
+    def __enter__(self) -> "OperationStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def state_values(self) -> List[Optional[str]]:
+        return self._state_values
+
+    @property
+    def currency_values(self) -> List[Optional[str]]:
+        return self._currency_values
+
+    def description(self, index: int) -> Optional[str]:
+        """Описание операции или None, если его нет."""
+        if not self.flags[index] & _HAS_DESCRIPTION:
+            return None
+        return str(self._text[self.text_offsets[index]:self.text_offsets[index + 1]], "utf-8", "surrogatepass")
+
+    def descriptions(self, indices: Optional[Iterable[int]] = None) -> Iterator[str]:
+        """Описания операций (или выбранных строк), пропуская операции без описания."""
+        text, offsets, flags = self._text, self.text_offsets, self.flags
+        for i in range(self._count) if indices is None else indices:
+            if flags[i] & _HAS_DESCRIPTION:
+                yield str(text[offsets[i]:offsets[i + 1]], "utf-8", "surrogatepass")
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """Восстанавливает словарь операции по номеру строки."""
+        if not 0 <= index < self._count:
+            if -self._count <= index < 0:
+                index += self._count
+            else:
+                raise IndexError("Номер строки вне хранилища")
+        rest: Dict[str, Any] = {}
+        description = self.description(index)
+        if description is not None:
+            rest["description"] = description
+        start, end = self.extra_offsets[index], self.extra_offsets[index + 1]
+        if start != end:
+            rest.update(json.loads(str(self._extra[start:end], "utf-8", "surrogatepass")))
+        return join_operation(
+            self.ids[index],
+            self._state_values[self.states[index]],
+            self.dates[index],
+            self.amounts[index],
+            self._currency_values[self.currencies[index]],
+            rest,
+        )
+
+    def to_dicts(self, indices: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Преобразует хранилище (или выборку индексов) в список словарей."""
+        if indices is None:
+            indices = range(self._count)
+        return [self.to_dict(i) for i in indices]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self.to_dict(i)
+
+    def select_state(self, state: str) -> "array[int]":
+        """Индексы строк с указанным статусом."""
+        return select_codes(self.states, self._state_codes.get(state))
+
+    def select_currency(self, currency: str) -> "array[int]":
+        """Индексы строк с указанным кодом валюты."""
+        return select_codes(self.currencies, self._currency_codes.get(currency))
+
+    def argsort_by_date(self, reverse: bool = True) -> "array[int]":
+        """Индексы строк по дате; строки без валидной даты -- в конце в исходном порядке."""
+        return argsort_dates(self.dates, reverse)
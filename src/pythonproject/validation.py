@@ -0,0 +1,169 @@
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Коды результата проверки строки описания вида "<название> <номер>"
+CARD = 0          # номер карты: 16 цифр (и контрольная цифра Луна, если проверяется)
+ACCOUNT = 1       # номер счета: не меньше 4 цифр, в названии есть "счет"
+MALFORMED = 2     # не строка, нет пробела или номер пустой
+BAD_LENGTH = 3    # только цифры, но неверная длина
+NON_DIGIT = 4     # в номере есть символы кроме ASCII-цифр
+LUHN_FAILED = 5   # 16 цифр, но контрольная сумма Луна не сходится
+
+RESULT_NAMES = ("card", "account", "malformed", "bad_length", "non_digit", "luhn_failed")
+
+_CARD_WIDTH = 16
+_ASCII_DIGITS = b"0123456789"
+# Значение цифры и сумма цифр удвоенного значения (шаг алгоритма Луна)
+_PLAIN = bytes.maketrans(_ASCII_DIGITS, bytes(range(10)))
+_DOUBLED = bytes.maketrans(_ASCII_DIGITS, bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+# Сумма по номеру (не больше 16 * 9) -> 1, если она не делится на 10
+_NOT_DIVISIBLE = bytes(1 if value % 10 else 0 for value in range(256))
+# Разбор для значений, которые не являются строкой: нет пробела -- MALFORMED
+_NO_PARTS = ("", "", "")
+_LUHN_FILLER = "0" * _CARD_WIDTH
+_FAILURE_CODE = bytes.maketrans(b"\x00\x01", bytes((0, LUHN_FAILED - CARD)))
+
+
+def _luhn_failures(data: bytes) -> bytes:
+    """
+    Проверка Луна для буфера 16-значных номеров из ASCII-цифр.
+
+    Колонки цифр берутся срезами с шагом 16 и складываются как длинные
+    целые: каждый байт -- отдельная «дорожка», сумма по номеру не больше
+    144, поэтому переносов между номерами нет.
+    """
+    count = len(data) // _CARD_WIDTH
+    plain = data.translate(_PLAIN)
+    doubled = data.translate(_DOUBLED)
+    total = 0
+    for column in range(_CARD_WIDTH):
+        # Удваивается каждая вторая цифра справа, не считая контрольной
+        source = doubled if column % 2 == 0 else plain
+        total += int.from_bytes(source[column::_CARD_WIDTH], "big")
+    return total.to_bytes(count, "big").translate(_NOT_DIVISIBLE)
+
+
+class ValidationReport:
+    """
+    Результат пакетной проверки описаний.
+
+    codes -- bytearray с кодом результата для каждой строки (CARD, ACCOUNT,
+    MALFORMED, BAD_LENGTH, NON_DIGIT, LUHN_FAILED). Разбор строк сохраняется,
+    поэтому mask() маскирует валидные строки без повторной проверки.
+    """
+
+    __slots__ = ("codes", "_prefixes", "_numbers")
+
+    def __init__(self, codes: bytearray, prefixes: Sequence[str], numbers: Sequence[str]) -> None:
+        self.codes = codes
+        self._prefixes = prefixes
+        self._numbers = numbers
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def counts(self) -> Dict[str, int]:
+        """Количество строк с каждым кодом результата."""
+        return {name: self.codes.count(code) for code, name in enumerate(RESULT_NAMES)}
+
+    def rows(self, code: int) -> "array[int]":
+        """Номера строк с указанным кодом результата."""
+        codes = self.codes
+        found = array("q")
+        position = codes.find(code)
+        while position != -1:
+            found.append(position)
+            position = codes.find(code, position + 1)
+        return found
+
+    def mask(self) -> List[str]:
+        """
+        Маскированные описания, как у mask_account_card; для строк
+        с ошибкой (в том числе LUHN_FAILED) -- пустая строка.
+        """
+        return [
+            f"{prefix} {number[:4]} {number[4:6]}** **** {number[12:]}" if code == CARD
+            else f"{prefix} **{number[-4:]}" if code == ACCOUNT
+            else ""
+            for code, prefix, number in zip(self.codes, self._prefixes, self._numbers)
+        ]
+
+
+def validate_descriptions(descriptions: Iterable[Any], luhn: bool = True) -> ValidationReport:
+    """
+    Проверяет множество описаний "<название> <номер>" за один проход без исключений.
+
+    Классификация карта/счет совпадает с mask_account_card: счет -- если
+    в названии есть "счет" (без учета регистра). Название проверяется один
+    раз для каждого различного значения, состав номеров -- одной проверкой
+    всех номеров сразу (по строкам только при ошибке), контрольная сумма
+    Луна -- сразу для всех карт над одним буфером.
+
+    Args:
+        descriptions: Последовательность или итератор строк (например,
+                      transaction_descriptions(...)); массивы NumPy -- через tolist()
+        luhn: Проверять ли контрольную цифру номеров карт
+
+    Returns:
+        ValidationReport с кодами по строкам
+
+    Examples:
+        >>> report = validate_descriptions(["Visa 4111111111111111", "Visa 4111111111111112", "Счет 12", None])
+        >>> list(report.codes) == [CARD, LUHN_FAILED, BAD_LENGTH, MALFORMED]
+        True
+        >>> report.counts()["luhn_failed"], report.mask()[0]
+        (1, 'Visa 4111 11** **** 1111')
+    """
+    if hasattr(descriptions, "tolist"):
+        descriptions = descriptions.tolist()
+    items = descriptions if isinstance(descriptions, list) else list(descriptions)
+    if not items:
+        return ValidationReport(bytearray(), [], [])
+
+    # Без пробела номер остается пустым -- такие строки и не-строки получают MALFORMED
+    parts = [text.rpartition(" ") if type(text) is str and " " in text else _NO_PARTS for text in items]
+    prefixes = list(map(itemgetter(0), parts))
+    numbers = list(map(itemgetter(2), parts))
+    is_account = {prefix: "счет" in prefix.lower() for prefix in set(prefixes)}
+    accounts = map(is_account.__getitem__, prefixes)
+    joined = "".join(numbers)
+    # Частый случай: все номера из цифр, тогда по строкам проверяются только длины
+    all_digits = joined.isascii() and joined.isdigit()
+    codes = bytearray([
+        MALFORMED if not number
+        else NON_DIGIT if not all_digits and not (number.isascii() and number.isdigit())
+        else (ACCOUNT if len(number) >= 4 else BAD_LENGTH) if account
+        else CARD if len(number) == _CARD_WIDTH else BAD_LENGTH
+        for number, account in zip(numbers, accounts)
+    ])
+
+    if luhn and CARD in codes:
+        # Буфер выровнен по строкам: у строк, которые не являются картой, номер
+        # из нулей проходит проверку, поэтому флаги ошибок прибавляются к кодам
+        # целиком, одним сложением длинных целых (CARD + LUHN_FAILED без переносов)
+        buffer = "".join([number if code == CARD else _LUHN_FILLER for code, number in zip(codes, numbers)])
+        failures = _luhn_failures(buffer.encode("ascii")).translate(_FAILURE_CODE)
+        total = int.from_bytes(codes, "big") + int.from_bytes(failures, "big")
+        codes = bytearray(total.to_bytes(len(codes), "big"))
+
+    return ValidationReport(codes, prefixes, numbers)
+
+
+def mask_descriptions_bulk(descriptions: Iterable[Any], luhn: bool = False) -> Tuple[List[str], bytearray]:
+    """
+    Проверяет и маскирует описания за один проход.
+
+    С luhn=False результат для каждой строки из ASCII-цифр совпадает
+    с mask_account_card, но вместо исключений невалидные строки получают
+    пустую строку и код ошибки.
+
+    Returns:
+        Кортеж (маскированные описания, коды результата)
+
+    Examples:
+        >>> mask_descriptions_bulk(["Счет 73654108430135874305", "Maestro 159683786870519"])
+        (['Счет **4305', ''], bytearray(b'\\x01\\x03'))
+    """
+    report = validate_descriptions(descriptions, luhn)
+    return report.mask(), report.codes
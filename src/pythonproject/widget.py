@@ -1,30 +1,15 @@
-from datetime import datetime
+import sys
 
-from .masks import get_mask_account, get_mask_card_number
+from .dates import format_date
+from .instrument import instrumented
+from .masks import mask_account_card
+from .processing import latest_operations, sort_by_date
+from .report import render_operations
 
-
-def mask_account_card(account_info: str) -> str:
-    """
-    Маскирует номер карты или счета в строке.
-
-    Args:
-        account_info: Строка вида "Visa 1234567812345678" или "Счет 1234567890123456"
-
-    Returns:
-        Маскированная строка
-
-    Raises:
-        ValueError: Если входные данные невалидны
-    """
-    if not account_info or " " not in account_info:
-        raise ValueError("Неверный формат входных данных")
-
-    parts = account_info.rsplit(" ", 1)
-    if "счет" in parts[0].lower():
-        return f"{parts[0]} {get_mask_account(parts[1])}"
-    return f"{parts[0]} {get_mask_card_number(parts[1])}"
+__all__ = ["mask_account_card", "get_date", "print_operations"]
 
 
+@instrumented
 def get_date(date_str: str) -> str:
     """
     Преобразует дату из ISO формата в DD.MM.YYYY.
@@ -38,16 +23,43 @@ def get_date(date_str: str) -> str:
     Raises:
         ValueError: Если дата невалидна
     """
-    try:
-        return datetime.fromisoformat(date_str).strftime("%d.%m.%Y")
-    except (ValueError, TypeError) as e:
-        raise ValueError("Неверный формат даты") from e
+    return format_date(date_str)
 
 
-def print_operations(operations):
-    """Печатает отсортированные операции с маскировкой (интеграция с processing.py)"""
-    from .processing import \
-        sort_by_date  # Локальный импорт во избежание циклических зависимостей
+class _TextStreamWriter:
+    """Бинарный интерфейс write() поверх текстового потока без .buffer (например, StringIO)."""
 
-    for op in sort_by_date(operations):
-        print(f"{get_date(op['date'])} {mask_account_card(op['description'])}")
\ No newline at end of file
+    def __init__(self, stream, encoding):
+        self.stream = stream
+        self.encoding = encoding
+
+    def write(self, data):
+        return self.stream.write(data.decode(self.encoding))
+
+
+@instrumented
+def print_operations(operations, limit=None, output_format="text"):
+    """Печатает отсортированные операции с маскировкой (интеграция с processing.py).
+
+    Если задан limit, печатаются только limit самых новых операций без полной сортировки.
+    Вывод идет в sys.stdout крупными блоками через report.render_operations; операции
+    с невалидной датой или описанием пропускаются и записываются в журнал.
+
+    Args:
+        operations: Список операций (словарей или operation.Operation)
+        limit: Сколько самых новых операций вывести (None -- все)
+        output_format: "text", "csv" или "jsonl"
+
+    Returns:
+        ReportStats(written, errors)
+    """
+    selected = sort_by_date(operations) if limit is None else latest_operations(operations, limit)
+    stdout = sys.stdout
+    encoding = getattr(stdout, "encoding", None) or "utf-8"
+    buffer = getattr(stdout, "buffer", None)
+    stdout.flush()
+    if buffer is None:
+        return render_operations(selected, _TextStreamWriter(stdout, encoding), output_format, encoding=encoding)
+    stats = render_operations(selected, buffer, output_format, encoding=encoding)
+    buffer.flush()
+    return stats
@@ -0,0 +1,117 @@
+# tests/test_aggregate.py
+from concurrent.futures import Future
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+from src.pythonproject import aggregate
+from src.pythonproject.aggregate import (AmountStats, aggregate_operations, aggregate_operations_parallel,
+                                         merge_aggregates)
+from src.pythonproject.generators import filter_by_currency
+
+
+@pytest.fixture
+def money_operations():
+    return [
+        {"state": "EXECUTED", "date": "2019-08-26T10:50:58.294041", "description": "Перевод организации",
+         "operationAmount": {"amount": "31957.58", "currency": {"code": "RUB"}}},
+        {"state": "EXECUTED", "date": "2019-08-03T18:35:29.512364", "description": "Перевод с карты на карту",
+         "operationAmount": {"amount": "0.10", "currency": {"code": "USD"}}},
+        {"state": "CANCELED", "date": "2019-07-03T18:35:29.512364", "description": "Открытие вклада",
+         "operationAmount": {"amount": "0.20", "currency": {"code": "USD"}}},
+        {"state": "EXECUTED", "date": "invalid-date", "description": "Перевод",
+         "operationAmount": {"amount": "1.005", "currency": {"code": "USD"}}},
+        {"state": "PENDING", "operationAmount": {"amount": "-5", "currency": {}}},
+        {"state": "EXECUTED"},
+        None,
+    ]
+
+
+def _stats(count, total, minimum, maximum, invalid=0):
+    stats = AmountStats()
+    stats.count, stats.total, stats.minimum, stats.maximum, stats.invalid = count, total, minimum, maximum, invalid
+    return stats
+
+
+def test_group_by_currency_is_exact(money_operations):
+    result = aggregate_operations(money_operations)
+    assert result == {
+        "RUB": _stats(1, 3195758, 3195758, 3195758),
+        "USD": _stats(2, 30, 10, 20, invalid=1),
+        None: _stats(1, -500, -500, -500, invalid=1),
+    }
+    # 0.1 + 0.2 во float дало бы 0.30000000000000004
+    assert result["USD"].as_dict()["sum"] == "0.30"
+    assert result["USD"].mean == Decimal("0.15")
+
+
+def test_other_group_keys(money_operations):
+    assert set(aggregate_operations(money_operations, "state")) == {"EXECUTED", "CANCELED", "PENDING"}
+    by_month = aggregate_operations(money_operations, "month")
+    assert by_month["2019-08"].count == 2 and by_month["2019-07"].count == 1
+    by_prefix = aggregate_operations(money_operations, "description")
+    assert by_prefix["Перевод"] == _stats(2, 3195768, 10, 3195758, invalid=1)
+    by_custom = aggregate_operations(money_operations, lambda op: op.get("state") == "EXECUTED")
+    assert by_custom[True].invalid == 2
+    with pytest.raises(ValueError):
+        aggregate_operations(money_operations, "amount")
+
+
+def test_accepts_filter_by_currency(money_operations):
+    usd = aggregate_operations(filter_by_currency(money_operations, "usd"), "state")
+    assert usd["EXECUTED"] == _stats(1, 10, 10, 10, invalid=1)
+
+
+def test_empty_group_stats():
+    stats = AmountStats()
+    assert stats.mean is None
+    assert stats.as_dict() == {"count": 0, "sum": "0.00", "min": None, "max": None, "mean": None, "invalid": 0}
+
+
+@pytest.mark.parametrize("workers,chunk_size", [(1, 2), (2, 3)])
+def test_parallel_matches_single_pass(money_operations, workers, chunk_size):
+    operations = money_operations * 20
+    expected = aggregate_operations(operations, "month")
+    assert aggregate_operations_parallel(operations, "month", workers=workers, chunk_size=chunk_size) == expected
+
+
+def test_parallel_bounds_in_flight_chunks(monkeypatch, money_operations):
+    in_flight = []
+
+    class RecordingExecutor:
+        def __init__(self, max_workers=None):
+            self.pending = 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            self.pending += 1
+            in_flight.append(self.pending)
+
+            def result():
+                self.pending -= 1
+                return fn(*args)
+            future.result = result
+            return future
+
+    monkeypatch.setattr(aggregate, "ProcessPoolExecutor", RecordingExecutor)
+    operations = money_operations * 20
+    assert aggregate_operations_parallel(operations, workers=3, chunk_size=2) == aggregate_operations(operations)
+    assert max(in_flight) == aggregate.CHUNKS_IN_FLIGHT_PER_WORKER * 3
+
+
+def test_accepts_any_mapping(money_operations):
+    proxies = [MappingProxyType(op) if isinstance(op, dict) else op for op in money_operations]
+    assert aggregate_operations(proxies, "state") == aggregate_operations(money_operations, "state")
+
+
+def test_merge_is_order_independent(money_operations):
+    parts = [aggregate_operations(money_operations[i:i + 2]) for i in range(0, len(money_operations), 2)]
+    assert merge_aggregates(parts) == merge_aggregates(reversed(parts)) == aggregate_operations(money_operations)
+    with pytest.raises(ValueError):
+        aggregate_operations_parallel(money_operations, chunk_size=0)
@@ -0,0 +1,141 @@
+# tests/test_async_streams.py
+import asyncio
+import json
+import time
+
+import pytest
+from src.pythonproject import async_streams
+from src.pythonproject.async_streams import (afilter_by_currency, aiter_json_lines, aiter_queue, aiter_sync,
+                                             aprint_operations, arender_operations, atransaction_descriptions,
+                                             merge_feeds)
+from src.pythonproject.generators import filter_by_currency, transaction_descriptions
+from src.pythonproject.widget import print_operations
+
+
+async def _aiter(items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def _collect(source):
+    return [item async for item in source]
+
+
+def test_afilter_by_currency(sample_transactions, edge_cases):
+    items = sample_transactions + edge_cases
+    result = asyncio.run(_collect(afilter_by_currency(_aiter(items), "usd")))
+    assert result == list(filter_by_currency(items, "usd"))
+
+
+def test_atransaction_descriptions(sample_transactions):
+    result = asyncio.run(_collect(atransaction_descriptions(aiter_sync(sample_transactions, batch_size=1))))
+    assert result == list(transaction_descriptions(sample_transactions))
+
+
+def test_merge_feeds_with_socket_source(sample_transactions):
+    async def scenario():
+        async def serve(reader, writer):
+            for tx in sample_transactions:
+                writer.write(json.dumps(tx).encode() + b"\n\n")
+                await writer.drain()
+                await asyncio.sleep(0.01)
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            queue = asyncio.Queue()
+            for i in range(3):
+                queue.put_nowait({"id": 100 + i})
+            queue.put_nowait(None)
+
+            slow = _aiter([{"id": 200}, {"id": 201}], delay=0.05)
+            result = await _collect(merge_feeds(aiter_json_lines(reader), aiter_queue(queue), slow, maxsize=2))
+            writer.close()
+        return result
+
+    result = asyncio.run(scenario())
+    ids = [item["id"] for item in result]
+    assert sorted(ids) == [1, 2, 100, 101, 102, 200, 201]
+    # Порядок внутри каждого источника сохраняется, медленный источник приходит последним
+    assert [i for i in ids if i < 100] == [1, 2]
+    assert [i for i in ids if 100 <= i < 200] == [100, 101, 102]
+    assert ids[-1] == 201
+
+
+def test_merge_feeds_propagates_errors():
+    async def broken():
+        yield {"id": 1}
+        raise RuntimeError("feed down")
+
+    async def scenario():
+        return await _collect(merge_feeds(broken(), _aiter([{"id": 2}] * 5, delay=0.01)))
+
+    with pytest.raises(RuntimeError, match="feed down"):
+        asyncio.run(scenario())
+
+
+def test_merge_feeds_invalid_queue_size():
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(merge_feeds(maxsize=0)))
+
+
+def test_arender_operations_sinks(sample_operations):
+    valid = sample_operations[:3]
+    lines = []
+    assert asyncio.run(arender_operations(_aiter(valid), lines.append)) == 3
+
+    collected = []
+
+    async def async_sink(line):
+        collected.append(line)
+
+    asyncio.run(arender_operations(_aiter(valid), async_sink))
+    assert collected == lines
+
+
+def test_aprint_operations_matches_print_operations(capsys, sample_operations):
+    valid = sample_operations[:3]
+    print_operations(valid)
+    expected = capsys.readouterr().out
+    asyncio.run(aprint_operations(_aiter(valid)))
+    assert capsys.readouterr().out == expected
+
+
+def test_async_report_skips_invalid_like_print_operations(capsys, caplog, sample_operations):
+    operations = sample_operations + [{"id": 5, "date": "2019-01-01"}, ["not", "a", "dict"]]
+    stats = print_operations(operations)
+    expected = capsys.readouterr().out
+    caplog.clear()
+    assert asyncio.run(aprint_operations(_aiter(operations))) == stats
+    assert capsys.readouterr().out == expected
+
+    lines = []
+    assert asyncio.run(arender_operations(_aiter(operations), lines.append)) == stats.written
+    assert sorted(lines) == sorted(expected.splitlines())
+    assert "id=4" in caplog.text and "id=5" in caplog.text and "#5" in caplog.text
+
+
+def test_aprint_operations_does_not_block_loop(monkeypatch, sample_operations):
+    ticks = []
+    ticks_during_print = []
+
+    def slow_print(operations, limit=None):
+        time.sleep(0.2)
+        ticks_during_print.append(len(ticks))
+        return len(operations)
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        return await asyncio.gather(aprint_operations(_aiter(sample_operations)), ticker())
+
+    monkeypatch.setattr(async_streams, "print_operations", slow_print)
+    assert asyncio.run(main())[0] == len(sample_operations)
+    assert ticks_during_print == [3]
@@ -0,0 +1,107 @@
+# tests/test_batch.py
+import pytest
+from src.pythonproject.batch import OperationBatch, format_amount, parse_amount
+from src.pythonproject.generators import filter_by_currency
+from src.pythonproject.processing import filter_by_state, sort_by_date
+
+
+@pytest.fixture
+def bank_operations():
+    return [
+        {
+            "id": 441945886,
+            "state": "EXECUTED",
+            "date": "2019-08-26T10:50:58.294041",
+            "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+            "description": "Перевод организации",
+            "from": "Maestro 1596837868705199",
+            "to": "Счет 64686473678894779589"
+        },
+        {
+            "id": 41428829,
+            "state": "CANCELED",
+            "date": "2019-07-03T18:35:29.512364",
+            "operationAmount": {"amount": "8221.37", "currency": {"name": "USD", "code": "USD"}},
+            "description": "Перевод с карты на карту"
+        },
+        {"id": 3, "state": "EXECUTED", "date": "2023-01-01", "operationAmount": {"amount": "10", "currency": {}}},
+        {"id": "x-4", "state": "PENDING", "date": "invalid-date", "operationAmount": None},
+        {"state": "EXECUTED", "operationAmount": {"amount": "-0.05", "currency": {"code": "USD"}}},
+        {"id": 6, "date": "2018-06-30T02:08:58+03:00"},
+        {},
+    ]
+
+
+def test_round_trip(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    assert len(batch) == len(bank_operations)
+    assert batch.to_dicts() == bank_operations
+
+
+def test_columns_are_compact(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    assert batch.amounts[0] == 3195758
+    assert batch.currency_values[batch.currencies[1]] == "USD"
+    assert batch.state_values[batch.states[3]] == "PENDING"
+    assert batch.dates.typecode == "q"
+
+
+def test_filter_by_state_matches_lists(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    for state in ("EXECUTED", "CANCELED", "PENDING", "UNKNOWN"):
+        selection = filter_by_state(batch, state)
+        assert batch.to_dicts(selection) == filter_by_state(bank_operations, state)
+
+
+def test_filter_by_currency_matches_lists(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    for currency in ("usd", "RUB", "EUR"):
+        selection = list(filter_by_currency(batch, currency))
+        assert batch.to_dicts(selection) == list(filter_by_currency(bank_operations, currency))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_sort_by_date_matches_lists(reverse):
+    operations = [
+        {"id": 1, "date": "2023-01-01"},
+        {"id": 2, "date": "invalid-date"},
+        {"id": 3, "date": "2023-01-03T00:00:00.000001"},
+        {"id": 4},
+        {"id": 5, "date": "2023-01-01"},
+    ]
+    batch = OperationBatch.from_dicts(operations)
+    assert batch.to_dicts(sort_by_date(batch, reverse)) == sort_by_date(operations, reverse)
+
+
+def test_take(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    subset = batch.take(filter_by_state(batch))
+    assert subset.to_dicts() == filter_by_state(bank_operations)
+
+
+def test_take_does_not_share_tables(bank_operations):
+    batch = OperationBatch.from_dicts(bank_operations)
+    subset = batch.take([0])
+    states = list(batch.state_values)
+    subset.append({"state": "NEW_STATE", "operationAmount": {"amount": "1.00", "currency": {"code": "XYZ"}}})
+    assert batch.state_values == states
+    assert "XYZ" not in batch.currency_values
+    assert subset.to_dicts()[-1]["state"] == "NEW_STATE"
+    assert batch.to_dicts() == bank_operations
+
+
+@pytest.mark.parametrize("amount,expected", [
+    ("100.00", 10000), ("-1.5", -150), ("0.001", None), ("abc", None), (1.0, None),
+])
+def test_parse_amount(amount, expected):
+    assert parse_amount(amount) == expected
+
+
+def test_format_amount():
+    assert format_amount(-5) == "-0.05"
+    assert format_amount(10000) == "100.00"
+
+
+def test_append_rejects_non_dict():
+    with pytest.raises(TypeError):
+        OperationBatch.from_dicts([None])
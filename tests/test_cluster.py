@@ -0,0 +1,165 @@
+# tests/test_cluster.py
+import multiprocessing
+import socket
+import socketserver
+import threading
+
+import pytest
+from src.pythonproject.cluster import (_LENGTH, _recv_message, make_worker, partition_operations,
+                                       print_operations_sharded, render_operations_sharded)
+from src.pythonproject.widget import print_operations
+
+
+def _run_worker(addresses):
+    server = make_worker(("127.0.0.1", 0))
+    addresses.put(server.server_address)
+    server.serve_forever()
+
+
+@pytest.fixture(scope="module")
+def workers():
+    """Три воркера в отдельных процессах на localhost."""
+    context = multiprocessing.get_context("fork")
+    addresses = context.Queue()
+    processes = [context.Process(target=_run_worker, args=(addresses,), daemon=True) for _ in range(3)]
+    for process in processes:
+        process.start()
+    yield [addresses.get(timeout=10) for _ in processes]
+    for process in processes:
+        process.terminate()
+        process.join()
+
+
+@pytest.fixture
+def report_operations():
+    states = ["EXECUTED", "CANCELED"]
+    descriptions = ["Visa Platinum 7000792289606361", "Счет 73654108430135874305", "Maestro 1596837868705199"]
+    return [
+        {
+            "id": i,
+            "state": states[i % 2],
+            # Повторяющиеся даты проверяют порядок операций с равной датой
+            "date": f"2019-{i % 12 + 1:02d}-{i % 5 + 1:02d}T10:50:58.294041",
+            "description": descriptions[i % 3],
+        }
+        for i in range(200)
+    ]
+
+
+def _free_address():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()
+
+
+class _DroppingHandler(socketserver.BaseRequestHandler):
+    """Воркер, который принимает соединение и обрывает его без ответа."""
+
+    def handle(self):
+        self.request.recv(1)
+
+
+@pytest.fixture
+def dropping_worker():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _DroppingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("by,shards", [("hash", None), ("hash", 7), ("date", 5), ("date", 1)])
+def test_sharded_output_matches_print_operations(capsys, workers, report_operations, by, shards):
+    print_operations(report_operations)
+    expected = capsys.readouterr().out
+    print_operations_sharded(report_operations, workers, shards=shards, by=by)
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("by", ["hash", "date"])
+def test_sharded_state_filter(capsys, workers, report_operations, by):
+    print_operations([op for op in report_operations if op["state"] == "EXECUTED"])
+    expected = capsys.readouterr().out.splitlines()
+    assert list(render_operations_sharded(report_operations, workers, by=by, state="EXECUTED")) == expected
+
+
+def test_failed_shards_are_retried(capsys, workers, report_operations, dropping_worker):
+    print_operations(report_operations)
+    expected = capsys.readouterr().out.splitlines()
+    addresses = [_free_address(), dropping_worker] + workers
+    assert list(render_operations_sharded(report_operations, addresses, shards=12, timeout=5)) == expected
+
+
+def test_all_workers_down(report_operations, dropping_worker):
+    with pytest.raises(ConnectionError):
+        list(render_operations_sharded(report_operations, [_free_address(), dropping_worker], retries=5, timeout=5))
+
+
+def test_retries_exhausted(report_operations, dropping_worker):
+    with pytest.raises(ConnectionError, match="после 1 попыток"):
+        list(render_operations_sharded(report_operations, [dropping_worker, _free_address()], retries=0, timeout=5))
+
+
+@pytest.mark.parametrize("by", ["hash", "date"])
+def test_invalid_operations_are_skipped_like_print_operations(capsys, workers, sample_operations, by):
+    operations = sample_operations + [{"id": 5, "date": "2019-01-01"}, ["not", "a", "dict"]]
+    print_operations(operations)
+    expected = capsys.readouterr().out.splitlines()
+    assert list(render_operations_sharded(operations, workers, shards=2, by=by)) == expected
+
+
+def test_print_passes_retries(report_operations, dropping_worker):
+    with pytest.raises(ConnectionError, match="после 1 попыток"):
+        print_operations_sharded(report_operations, [dropping_worker, _free_address()], retries=0, timeout=5)
+
+
+def test_oversized_message_is_rejected():
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(_LENGTH.pack(1 << 62))
+        with pytest.raises(ValueError, match="больше допустимых"):
+            _recv_message(right)
+        left.sendall(_LENGTH.pack(3) + b"[1]")
+        with pytest.raises(ValueError):
+            _recv_message(right, max_size=2)
+
+
+def test_unix_socket_worker(tmp_path, report_operations, capsys):
+    server = make_worker(str(tmp_path / "worker.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        print_operations(report_operations)
+        expected = capsys.readouterr().out.splitlines()
+        assert list(render_operations_sharded(report_operations, [server.server_address], by="date")) == expected
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_partition_by_hash_is_stable(report_operations):
+    shards = partition_operations(report_operations, 4)
+    assert sorted(position for shard in shards for position, _ in shard) == list(range(len(report_operations)))
+    assert partition_operations(list(reversed(report_operations)), 4)[1][-1][1] in [op for _, op in shards[1]]
+
+
+def test_partition_by_date_ranges(report_operations):
+    shards = partition_operations(report_operations + [{"id": -1, "date": "bad"}], 3, "date")
+    last_dates = [max(op["date"] for _, op in shard if op["date"] != "bad") for shard in shards]
+    first_dates = [min(op["date"] for _, op in shard) for shard in shards]
+    assert last_dates[0] < first_dates[1] and last_dates[1] < first_dates[2]
+    assert shards[0][-1][1]["date"] == "bad"
+    expected = partition_operations(report_operations, 3, "date")
+    assert partition_operations(iter(report_operations), 3, "date") == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"shards": 0}, {"by": "month"}, {"retries": -1}])
+def test_invalid_settings(workers, kwargs):
+    with pytest.raises(ValueError):
+        list(render_operations_sharded([], workers, **kwargs))
+
+
+def test_no_workers():
+    with pytest.raises(ValueError):
+        list(render_operations_sharded([], []))
@@ -0,0 +1,94 @@
+# tests/test_dates.py
+from datetime import datetime
+
+import pytest
+from src.pythonproject.dates import (clear_date_cache, date_cache_info, date_keys, format_date, format_epoch_us,
+                                     parse_epoch_us)
+from src.pythonproject.processing import sort_by_date
+
+
+@pytest.mark.parametrize("date_str", [
+    "2019-08-26T10:50:58.294041",
+    "2023-01-01",
+    "2023-01-01T12:00:00",
+    "1969-12-31T23:59:59.999999",
+])
+def test_parse_epoch_us_matches_datetime(date_str):
+    expected = (datetime.fromisoformat(date_str) - datetime(1970, 1, 1)).total_seconds()
+    assert parse_epoch_us(date_str) == round(expected * 1_000_000)
+
+
+def test_parse_epoch_us_timezone():
+    assert parse_epoch_us("2019-08-26T10:50:58.294+03") == parse_epoch_us("2019-08-26T07:50:58.294000")
+
+
+@pytest.mark.parametrize("invalid", ["invalid-date", "", None, 123, "2019-13-26T10:50:58.294041"])
+def test_parse_epoch_us_invalid(invalid):
+    assert parse_epoch_us(invalid) is None
+
+
+def test_format_epoch_us_round_trip():
+    date_str = "2019-08-26T10:50:58.294041"
+    assert format_epoch_us(parse_epoch_us(date_str)) == date_str
+
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("2019-08-26T10:50:58.294041", "26.08.2019"),
+    ("2023-12-31", "31.12.2023"),
+    ("2023-01-01T12:00:00+03:00", "01.01.2023"),
+])
+def test_format_date(date_str, expected):
+    assert format_date(date_str) == expected
+
+
+@pytest.mark.parametrize("invalid", ["invalid-date", "2019-02-30T10:50:58.294041", None])
+def test_format_date_invalid(invalid):
+    with pytest.raises(ValueError):
+        format_date(invalid)
+
+
+def test_cache_reuses_results():
+    clear_date_cache()
+    for _ in range(3):
+        parse_epoch_us("2020-02-02T02:02:02+03:00")
+    info = date_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_fixed_shape_bypasses_cache():
+    clear_date_cache()
+    parse_epoch_us("2020-02-02T02:02:02.000002")
+    assert date_keys([{"date": "2020-02-02T02:02:02.000002"}, {"date": "2020-02-30T02:02:02.000002"}]) == \
+        [1580608922000002, None]
+    assert date_cache_info().currsize == 0
+    # Та же длина, но с часовым поясом -- через общий разбор
+    assert date_keys([{"date": "2019-08-26T10:50:58.294+03"}]) == [parse_epoch_us("2019-08-26T07:50:58.294000")]
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_sort_by_date_with_keys(sample_operations, reverse):
+    keys = date_keys(sample_operations)
+    assert keys[3] is None
+    assert sort_by_date(sample_operations, reverse, keys=keys) == sort_by_date(sample_operations, reverse)
+    assert sort_by_date(sample_operations, reverse)[-1]["id"] == 4
+
+
+def test_sort_by_date_keys_length_mismatch(sample_operations):
+    with pytest.raises(ValueError):
+        sort_by_date(sample_operations, keys=[])
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize("distinct", [50, 20_000])
+def test_sort_by_date_repeated_and_unique(reverse, distinct):
+    dates = [f"2020-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00.{i:06d}" for i in range(distinct)]
+    operations = [{"id": i, "date": dates[(i * 7919) % distinct]} for i in range(20_000)]
+    operations[5] = {"id": 5, "date": "bad"}
+    operations[9] = {"id": 9}
+    clear_date_cache()
+    result = sort_by_date(operations, reverse)
+    # Часто повторяющиеся даты сортируются через кэш, уникальные -- напрямую
+    assert (date_cache_info().currsize > 0) == (distinct == 50)
+    assert result == sort_by_date(operations, reverse, keys=date_keys(operations))
+    assert [op["id"] for op in result[-2:]] == [5, 9]
@@ -0,0 +1,42 @@
+# tests/test_external_sort.py
+import os
+
+import pytest
+from src.pythonproject.external_sort import sort_by_date_external
+from src.pythonproject.processing import sort_by_date
+
+
+@pytest.fixture
+def archive_operations():
+    ops = [{"id": i, "date": f"2019-{i % 12 + 1:02d}-{i % 7 + 1:02d}T10:50:58.294041"} for i in range(200)]
+    ops[5]["date"] = "invalid-date"
+    del ops[17]["date"]
+    ops[40]["date"] = None
+    return ops
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize("memory_limit,max_fanin", [(10 ** 9, 64), (2000, 64), (2000, 2), (1, 3)])
+def test_external_sort_matches_sort_by_date(tmp_path, archive_operations, reverse, memory_limit, max_fanin):
+    result = list(sort_by_date_external(iter(archive_operations), reverse, memory_limit, str(tmp_path), max_fanin))
+    assert result == sort_by_date(archive_operations, reverse)
+    assert os.listdir(tmp_path) == []
+
+
+def test_external_sort_spills_to_disk(tmp_path, archive_operations):
+    result = sort_by_date_external(archive_operations, memory_limit=2000, temp_dir=str(tmp_path))
+    first = next(result)
+    assert first == sort_by_date(archive_operations)[0]
+    assert len(os.listdir(tmp_path)) > 1
+    result.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_external_sort_empty():
+    assert list(sort_by_date_external([])) == []
+
+
+@pytest.mark.parametrize("memory_limit,max_fanin", [(0, 64), (100, 1)])
+def test_external_sort_invalid_settings(memory_limit, max_fanin):
+    with pytest.raises(ValueError):
+        list(sort_by_date_external([], memory_limit=memory_limit, max_fanin=max_fanin))
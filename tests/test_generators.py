@@ -20,3 +20,49 @@ def test_transaction_descriptions(sample_transactions):
 ])
 def test_card_number_generator(start, end, expected):
     assert list(card_number_generator(start, end)) == expected
+
+
+def _luhn_valid(number):
+    digits = [int(c) for c in number.replace(" ", "")][::-1]
+    total = sum(d if i % 2 == 0 else (d * 2 - 9 if d > 4 else d * 2) for i, d in enumerate(digits))
+    return total % 10 == 0
+
+
+@pytest.mark.parametrize("start,end", [(1, 3), (9995, 10005), (0, 25000), (9999999999999990, 9999999999999999)])
+def test_card_number_chunks_match_generator(start, end):
+    expected = [f"{n:016d}" for n in range(start, end + 1)]
+    expected = [f"{n[:4]} {n[4:8]} {n[8:12]} {n[12:]}" for n in expected]
+    chunks = list(card_number_chunks(start, end))
+    assert all(len(chunk) <= 10000 for chunk in chunks)
+    assert [number for chunk in chunks for number in chunk] == expected
+    assert list(card_number_generator(start, end)) == expected
+
+
+def test_card_number_chunks_luhn():
+    numbers = [number for chunk in card_number_chunks(411111111110990, 411111111111120, luhn=True) for number in chunk]
+    assert len(numbers) == 131
+    assert "4111 1111 1111 1111" in numbers
+    assert all(_luhn_valid(number) for number in numbers)
+    assert [n[:18] for n in numbers] == [f"{b:015d}"[:4] + " " + f"{b:015d}"[4:8] + " " + f"{b:015d}"[8:12] + " "
+                                         + f"{b:015d}"[12:] for b in range(411111111110990, 411111111111121)]
+
+
+@pytest.mark.parametrize("start,end,luhn", [(-1, 5, False), (0, 10 ** 16, False), (0, 10 ** 15, True)])
+def test_card_number_chunks_invalid_range(start, end, luhn):
+    with pytest.raises(ValueError):
+        list(card_number_chunks(start, end, luhn))
+
+
+def test_write_card_numbers(tmp_path):
+    buffer = bytearray()
+    assert write_card_numbers(9998, 10001, buffer) == 4
+    assert buffer.decode().splitlines() == list(card_number_generator(9998, 10001))
+
+    path = tmp_path / "cards.txt"
+    with open(path, "wb") as f:
+        assert write_card_numbers(411111111111110, 411111111111112, f, luhn=True, separator=b";") == 3
+    assert path.read_bytes().split(b";")[1] == b"4111 1111 1111 1111"
+
+
+def test_card_number_generator_empty_range():
+    assert list(card_number_generator(5, 4)) == []
@@ -0,0 +1,97 @@
+# tests/test_index.py
+import pytest
+from src.pythonproject.generators import filter_by_currency
+from src.pythonproject.index import OperationIndex
+from src.pythonproject.processing import filter_by_state
+
+
+@pytest.fixture
+def indexed_operations():
+    states = ["EXECUTED", "CANCELED", "PENDING"]
+    currencies = ["USD", "RUB", "EUR", "USD"]
+    ops = [
+        {
+            "id": i,
+            "state": states[i % 3],
+            "date": f"2019-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:50:58.294041",
+            "operationAmount": {"amount": "1.00", "currency": {"code": currencies[i % 4]}},
+        }
+        for i in range(120)
+    ]
+    ops += [{"id": 120, "state": "EXECUTED", "date": "invalid-date"}, {"id": 121}, {"id": 122, "operationAmount": {}}]
+    return ops
+
+
+def _expected(ops, state=None, currency=None, date_from=None, date_to=None):
+    if state is not None:
+        ops = filter_by_state(ops, state)
+    if currency is not None:
+        ops = list(filter_by_currency(ops, currency))
+    if date_from is not None or date_to is not None:
+        ops = [
+            op for op in ops
+            if op.get("date", "").startswith("2019") and (date_from is None or op["date"] >= date_from)
+            and (date_to is None or op["date"] < date_to)
+        ]
+    return ops
+
+
+@pytest.mark.parametrize("state", [None, "EXECUTED", "CANCELED", "UNKNOWN"])
+@pytest.mark.parametrize("currency", [None, "USD", "eur", "JPY"])
+@pytest.mark.parametrize("date_from,date_to", [
+    (None, None),
+    ("2019-03-01", "2019-05-01"),
+    ("2019-12-01", None),
+    (None, "2019-01-15T00:00:00.000000"),
+    ("2019-06-01", "2019-06-02"),
+])
+def test_query_matches_linear_scan(indexed_operations, state, currency, date_from, date_to):
+    index = OperationIndex(indexed_operations)
+    expected = _expected(indexed_operations, state, currency, date_from, date_to)
+    assert index.query(state, currency, date_from, date_to) == expected
+
+
+def test_index_filters(indexed_operations):
+    index = OperationIndex(indexed_operations)
+    assert index.filter_by_state() == filter_by_state(indexed_operations)
+    assert index.filter_by_currency("usd") == list(filter_by_currency(indexed_operations, "usd"))
+
+
+def test_add_and_remove(indexed_operations):
+    index = OperationIndex(indexed_operations[:60])
+    for op in indexed_operations[60:]:
+        index.add(op)
+    removed = indexed_operations[::7]
+    for op in removed:
+        index.remove(op)
+    remaining = [op for op in indexed_operations if all(op is not r for r in removed)]
+    assert len(index) == len(remaining)
+    assert removed[0] not in index
+    assert index.query(state="EXECUTED", currency="USD", date_from="2019-02-01") == \
+        _expected(remaining, "EXECUTED", "USD", "2019-02-01")
+
+
+def test_bulk_build_matches_incremental_add(indexed_operations):
+    shuffled = indexed_operations[::-1][::2] + indexed_operations[::-1][1::2]
+    bulk = OperationIndex(shuffled)
+    incremental = OperationIndex()
+    for op in shuffled:
+        incremental.add(op)
+    assert bulk._date_keys == incremental._date_keys == sorted(bulk._date_keys)
+    assert bulk._date_rows == incremental._date_rows
+    for date_from, date_to in [(None, None), ("2019-03-01", "2019-05-01"), ("2019-06-01", "2019-06-02")]:
+        expected = _expected(shuffled, date_from=date_from, date_to=date_to)
+        assert bulk.query(date_from=date_from, date_to=date_to) == expected
+        assert incremental.query(date_from=date_from, date_to=date_to) == expected
+
+
+def test_add_remove_errors(indexed_operations):
+    index = OperationIndex(indexed_operations[:1])
+    with pytest.raises(ValueError):
+        index.add(indexed_operations[0])
+    with pytest.raises(TypeError):
+        index.add(None)
+    with pytest.raises(KeyError):
+        index.remove(indexed_operations[1])
+    with pytest.raises(ValueError):
+        index.query(date_from="invalid-date")
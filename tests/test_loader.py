@@ -0,0 +1,61 @@
+# tests/test_loader.py
+import io
+import json
+
+import pytest
+from src.pythonproject.generators import filter_by_currency, transaction_descriptions
+from src.pythonproject.loader import iter_operations, iter_operations_from_stream
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 16])
+def test_iter_operations_matches_json_load(sample_transactions, chunk_size):
+    extra = {"id": 12345, "amount": 1.5e3, "small": -1.25e-10, "inf": float("-inf"), "flag": True, "note": None,
+             "text": "Счет \u00e9 \"x\"\n" * 5}
+    text = json.dumps(sample_transactions + [extra])
+    result = list(iter_operations_from_stream(io.StringIO(text), chunk_size=chunk_size))
+    assert result == json.loads(text)
+
+
+def test_iter_operations_from_file(tmp_path, sample_transactions):
+    path = tmp_path / "operations.json"
+    path.write_text(json.dumps(sample_transactions, ensure_ascii=False), encoding="utf-8")
+
+    usd = list(filter_by_currency(iter_operations(path, chunk_size=5), "USD"))
+    assert [tx["id"] for tx in usd] == [1]
+    assert list(transaction_descriptions(iter_operations(str(path)))) == ["Payment 1", "Payment 2"]
+
+
+def test_iter_operations_empty_array():
+    assert list(iter_operations(io.StringIO("  [ ]  "))) == []
+
+
+def test_iter_operations_is_lazy():
+    stream = io.StringIO('[{"id": 1}, {"id": 2}, not json')
+    operations = iter_operations(stream, chunk_size=4)
+    assert next(operations) == {"id": 1}
+    assert next(operations) == {"id": 2}
+    with pytest.raises(ValueError):
+        next(operations)
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+def test_iter_operations_fails_fast_on_invalid_item():
+    stream = _CountingStream('[{"id": 1, "state": EXECUTED}, ' + ", ".join(['{"id": 2}'] * 10_000) + "]")
+    with pytest.raises(ValueError, match="Неверный формат"):
+        list(iter_operations(stream, chunk_size=64))
+    assert stream.reads <= 2
+
+
+@pytest.mark.parametrize("text", ["", "{}", '[{"id": 1}', '[{"id": 1} {"id": 2}]', "[,]"])
+def test_iter_operations_invalid(text):
+    with pytest.raises(ValueError):
+        list(iter_operations(io.StringIO(text)))
@@ -0,0 +1,121 @@
+# tests/test_masking_cache.py
+import time
+
+import pytest
+from src.pythonproject.masking_cache import MaskingCache
+from src.pythonproject.widget import mask_account_card
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+@pytest.mark.parametrize("hash_keys", [True, False])
+def test_masking_cache_matches_mask_account_card(sample_account_strings, policy, hash_keys):
+    cache = MaskingCache(maxsize=2, policy=policy, hash_keys=hash_keys)
+    for _ in range(3):
+        for account_info in sample_account_strings:
+            try:
+                expected = mask_account_card(account_info)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    cache(account_info)
+            else:
+                assert cache(account_info) == expected
+    assert len(cache) <= 2
+
+
+def test_masking_cache_counters():
+    cache = MaskingCache(maxsize=10)
+    for _ in range(4):
+        cache("Счет 73654108430135874305")
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (3, 1, 0, 1)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 10, 0)
+
+
+def test_masking_cache_does_not_keep_raw_numbers():
+    cache = MaskingCache()
+    cache("Visa Platinum 7000792289606361")
+    stored = list(cache._store.values.items())
+    assert all("7000792289606361" not in repr(item) for item in stored)
+
+
+def test_lru_eviction():
+    cache = MaskingCache(maxsize=2, policy="lru", hash_keys=False)
+    cache("Счет 11112222")
+    cache("Счет 33334444")
+    cache("Счет 11112222")
+    cache("Счет 55556666")  # вытесняет 33334444
+    assert set(cache._store.values) == {"Счет 11112222", "Счет 55556666"}
+    assert cache.evictions == 1
+
+
+def test_lfu_eviction():
+    cache = MaskingCache(maxsize=2, policy="lfu", hash_keys=False)
+    for _ in range(3):
+        cache("Счет 11112222")
+    cache("Счет 33334444")
+    cache("Счет 55556666")  # вытесняет редко используемый 33334444
+    cache("Счет 77778888")  # вытесняет 55556666, частый 11112222 остается
+    assert set(cache._store.values) == {"Счет 11112222", "Счет 77778888"}
+
+
+def test_masking_cache_invalid_settings():
+    with pytest.raises(ValueError):
+        MaskingCache(maxsize=0)
+    with pytest.raises(ValueError):
+        MaskingCache(policy="fifo")
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_same_last_digits_do_not_share_results(policy):
+    cache = MaskingCache(maxsize=4, policy=policy)
+    inputs = ["Visa 1111222233334444", "MasterCard 5555666677774444", "Счет 99994444", "Счет 11114444"]
+    for _ in range(2):
+        assert [cache(value) for value in inputs] == [mask_account_card(value) for value in inputs]
+    assert cache.cache_info().hits == 4
+
+
+def test_default_keys_are_string_hashes():
+    cache = MaskingCache()
+    cache("Visa Platinum 7000792289606361")
+    assert list(cache._store.values) == [hash("Visa Platinum 7000792289606361")]
+
+
+def test_digest_keys_are_per_instance():
+    first, second = MaskingCache(digest_keys=True), MaskingCache(digest_keys=True)
+    first("Visa Platinum 7000792289606361")
+    second("Visa Platinum 7000792289606361")
+    (first_key,), (second_key,) = first._store.values, second._store.values
+    assert len(first_key) == 16 and first_key != second_key
+    assert first_key != hash("Visa Platinum 7000792289606361")
+    assert first("Visa Platinum 7000792289606361") == mask_account_card("Visa Platinum 7000792289606361")
+    assert first.cache_info().hits == 1
+
+
+def _best_of(func, repeat=7):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_cache_hit_is_cheaper_than_masking(policy):
+    descriptions = [f"Visa Platinum {7000792289600000 + i}" for i in range(2000)]
+    cache = MaskingCache(maxsize=len(descriptions), policy=policy)
+
+    def miss():
+        cache.clear()
+        for description in descriptions:
+            cache(description)
+
+    def hit():
+        for description in descriptions:
+            cache(description)
+
+    miss_time = _best_of(miss)
+    hit_time = _best_of(hit)
+    assert cache.cache_info().hits == 7 * len(descriptions)
+    assert hit_time < miss_time
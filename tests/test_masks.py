@@ -1,5 +1,5 @@
 import pytest
-from src.pythonproject.masks import get_mask_card_number, get_mask_account
+from src.pythonproject.masks import get_mask_card_number, get_mask_account, mask_accounts_bulk, mask_cards_bulk
 
 @pytest.mark.parametrize("card_num,expected", [
     ("1234567890123456", "1234 56** **** 3456"),
@@ -24,3 +24,55 @@ def test_get_mask_account(account_num, expected):
             get_mask_account(account_num)
     else:
         assert get_mask_account(account_num) == expected
+
+
+def test_mask_cards_bulk_matches_scalar(sample_card_numbers):
+    masked, errors = mask_cards_bulk(sample_card_numbers)
+    assert list(errors) == [0, 0, 1, 1]
+    for number, result, error in zip(sample_card_numbers, masked, errors):
+        if error:
+            assert result == ""
+            with pytest.raises(ValueError):
+                get_mask_card_number(number)
+        else:
+            assert result == get_mask_card_number(number)
+
+
+def test_mask_accounts_bulk_matches_scalar(sample_account_numbers):
+    masked, errors = mask_accounts_bulk(sample_account_numbers)
+    assert list(errors) == [0, 0, 1, 1]
+    assert masked[:2] == [get_mask_account(n) for n in sample_account_numbers[:2]]
+
+
+def test_mask_bulk_mixed_types():
+    masked, errors = mask_cards_bulk([7000792289606361, b"1111222233334444", None, -1, "١٢٣"])
+    assert masked[:2] == ["7000 79** **** 6361", "1111 22** **** 4444"]
+    assert list(errors) == [0, 0, 1, 1, 1]
+
+    masked, errors = mask_accounts_bulk([73654108430135874305, b"12\xff4"])
+    assert masked == ["**4305", ""]
+    assert list(errors) == [0, 1]
+
+
+def test_mask_bulk_buffer():
+    masked, errors = mask_cards_bulk(b"1234567890123456abcdefghijklmnop1111222233334444")
+    assert masked == b"1234 56** **** 3456" + b" " * 19 + b"1111 22** **** 4444"
+    assert list(errors) == [0, 1, 0]
+
+    masked, errors = mask_accounts_bulk(bytearray(b"1234567890x234567890"), record_width=10)
+    assert masked == b"**7890" + b" " * 6
+    assert list(errors) == [0, 1]
+
+
+def test_mask_bulk_buffer_invalid_width():
+    with pytest.raises(ValueError):
+        mask_cards_bulk(b"123")
+    with pytest.raises(ValueError):
+        mask_accounts_bulk(b"12345678")
+
+
+def test_mask_bulk_numpy():
+    np = pytest.importorskip("numpy")
+    masked, errors = mask_cards_bulk(np.array(["1234567890123456", "bad"]))
+    assert masked == ["1234 56** **** 3456", ""]
+    assert list(errors) == [0, 1]
@@ -0,0 +1,97 @@
+# tests/test_metrics.py
+import json
+
+import pytest
+from src.pythonproject import generators, masks, metrics, processing, widget
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.disable()
+    metrics.current().reset()
+    yield
+    metrics.disable()
+    metrics.current().reset()
+
+
+def test_functions_are_wrapped_once_at_definition():
+    original = masks.get_mask_card_number
+    metrics.enable()
+    assert metrics.is_enabled()
+    assert masks.get_mask_card_number is original
+    assert widget.mask_account_card is masks.mask_account_card
+    metrics.disable()
+    assert not metrics.is_enabled()
+    assert masks.get_mask_card_number.__wrapped__.__name__ == "get_mask_card_number"
+    assert masks.get_mask_card_number("7000792289606361") == "7000 79** **** 6361"
+    assert masks.get_mask_card_number(card_number="7000792289606361") == "7000 79** **** 6361"
+    with pytest.raises(TypeError):
+        masks.get_mask_card_number()
+    assert metrics.current().functions == {}
+
+
+def test_instrumented_list_matches_wrapped_functions():
+    from src.pythonproject import dates, instrument
+    assert dates.format_date.__wrapped__.__name__ == "format_date"
+    expected = {f"{module}.{name}" for module, names in metrics.INSTRUMENTED.items() for name in names}
+    assert set(instrument.registered) == expected
+
+
+def test_names_imported_before_enable_are_measured(sample_operations, capsys):
+    from src.pythonproject.widget import print_operations
+    with metrics.measure() as measured:
+        print_operations(sample_operations[:2])
+    capsys.readouterr()
+    assert measured.functions["widget.print_operations"].calls == 1
+    assert measured.functions["widget.print_operations"].items == 2
+    # Функции подписаны модулем, в котором определены
+    assert measured.functions["masks.mask_account_card"].calls >= 1
+    assert "widget.mask_account_card" not in measured.functions
+
+
+def test_measure_counts_calls_and_items(sample_operations, sample_transactions):
+    with metrics.measure() as measured:
+        widget.mask_account_card("Visa 1234567890123456")
+        widget.mask_account_card("Счет 1234567890123456")
+        processing.filter_by_state(sample_operations)
+        list(generators.filter_by_currency(sample_transactions, "USD"))
+        with pytest.raises(ValueError):
+            masks.get_mask_account("12")
+
+    functions = measured.functions
+    assert functions["masks.mask_account_card"].calls == 2
+    # Внутренние вызовы из mask_account_card тоже учитываются
+    assert functions["masks.get_mask_card_number"].calls == 1
+    assert functions["masks.get_mask_account"].calls == 2
+    assert functions["processing.filter_by_state"].items == len(sample_operations)
+    assert functions["generators.filter_by_currency"].items == 1
+    assert functions["masks.mask_account_card"].seconds > 0
+    assert not metrics.is_enabled()
+    assert metrics.current().functions == {}
+
+
+def test_quantiles():
+    stats = metrics.FunctionStats()
+    assert stats.quantiles() == {0.5: 0.0, 0.9: 0.0, 0.99: 0.0}
+    for i in range(100):
+        stats.record(i / 1000, 1)
+    assert stats.quantiles() == {0.5: 0.05, 0.9: 0.09, 0.99: 0.099}
+
+
+def test_export(tmp_path):
+    with metrics.measure() as measured:
+        widget.get_date("2019-08-26T10:50:58.294041")
+
+    prometheus_path = tmp_path / "metrics.prom"
+    text = measured.to_prometheus(str(prometheus_path))
+    assert prometheus_path.read_text(encoding="utf-8") == text
+    assert "# TYPE pythonproject_latency_seconds summary" in text
+    assert 'pythonproject_calls_total{function="widget.get_date"} 1' in text
+    assert 'pythonproject_latency_seconds{function="widget.get_date",quantile="0.99"}' in text
+    assert 'pythonproject_latency_seconds_count{function="dates.format_date"} 1' in text
+
+    json_path = tmp_path / "metrics.json"
+    measured.to_json(str(json_path))
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    assert data["widget.get_date"]["calls"] == 1
+    assert set(data["widget.get_date"]["quantiles"]) == {"0.5", "0.9", "0.99"}
@@ -0,0 +1,134 @@
+# tests/test_operation.py
+import pickle
+from types import MappingProxyType
+
+import pytest
+from benchmarks.dataset import operations_list
+from src.pythonproject.aggregate import aggregate_operations
+from src.pythonproject.generators import filter_by_currency, transaction_descriptions
+from src.pythonproject.index import OperationIndex
+from src.pythonproject.operation import Operation, operations_from_dicts
+from src.pythonproject.processing import filter_by_state, latest_operations, sort_by_date
+from src.pythonproject.query import Query
+from src.pythonproject.widget import print_operations
+
+
+@pytest.fixture
+def dict_operations():
+    operations = operations_list(300)
+    operations.append({"id": "x-1", "state": 5, "date": "2023-01-01", "description": None})
+    operations.append({"operationAmount": {"amount": "1.005", "currency": {"code": 840}}})
+    operations.append({})
+    return operations
+
+
+def test_round_trip(dict_operations):
+    for source, record in zip(dict_operations, operations_from_dicts(dict_operations)):
+        assert record.to_dict() == source
+        assert dict(record) == source
+        assert record == source
+
+
+def test_hot_fields_are_decoded():
+    record = Operation.from_dict({
+        "id": 7,
+        "state": "EXECUTED",
+        "date": "2023-01-01",
+        "operationAmount": {"amount": "100.50", "currency": {"name": "USD", "code": "USD"}},
+        "description": "Перевод организации",
+        "from": "Visa 1234567890123456",
+    })
+    assert (record.id, record.state, record.amount, record.currency) == (7, "EXECUTED", 10050, "USD")
+    assert record.date == "2023-01-01" and record.date_key == 1672531200000000
+    assert record["from"] == "Visa 1234567890123456"
+    assert record.get("to", "нет") == "нет"
+    assert "from" in record and "to" not in record
+    assert not hasattr(record, "__dict__")
+
+
+def test_invalid_and_unusual_values_stay_in_source():
+    record = Operation.from_dict({"id": "x-1", "state": 5, "date": "bad"})
+    assert (record.id, record.state, record.date_key, record.date) == (None, None, None, None)
+    assert record["id"] == "x-1" and record["state"] == 5 and record["date"] == "bad"
+    with pytest.raises(KeyError):
+        record["description"]
+
+
+def test_pickle(dict_operations):
+    records = operations_from_dicts(dict_operations)
+    assert pickle.loads(pickle.dumps(records)) == records
+
+
+def test_from_dict_rejects_non_dict():
+    with pytest.raises(TypeError):
+        Operation.from_dict(["not", "a", "dict"])
+
+
+def test_processing_accepts_records(dict_operations):
+    records = operations_from_dicts(dict_operations)
+    assert filter_by_state(records) == filter_by_state(dict_operations)
+    assert filter_by_state(records, "CANCELED") == filter_by_state(dict_operations, "CANCELED")
+    assert sort_by_date(records) == sort_by_date(dict_operations)
+    assert sort_by_date(records, reverse=False) == sort_by_date(dict_operations, reverse=False)
+    assert latest_operations(records, 10, "EXECUTED") == latest_operations(dict_operations, 10, "EXECUTED")
+
+
+def test_filter_by_state_mixed_list(dict_operations):
+    mixed = operations_from_dicts(dict_operations[:100]) + dict_operations[100:]
+    assert filter_by_state(mixed) == filter_by_state(dict_operations)
+    assert filter_by_state(mixed[::-1]) == filter_by_state(dict_operations[::-1])
+
+
+def test_strict_sort_reports_record_id():
+    records = operations_from_dicts([{"id": 1, "date": "2023-01-01"}, {"id": 2, "date": "bad"}, {"id": 3}])
+    with pytest.raises(ValueError, match="операции 2"):
+        sort_by_date(records, errors="strict")
+    with pytest.raises(KeyError, match="Операция 3"):
+        sort_by_date(records[2:], errors="strict")
+
+
+def test_generators_accept_records(dict_operations):
+    records = operations_from_dicts(dict_operations)
+    assert list(filter_by_currency(records, "usd")) == list(filter_by_currency(dict_operations, "usd"))
+    assert list(transaction_descriptions(records)) == list(transaction_descriptions(dict_operations))
+
+
+def test_widget_accepts_records(capsys, dict_operations):
+    valid = [op for op in dict_operations if "description" in op and isinstance(op["description"], str)]
+    print_operations(valid)
+    expected = capsys.readouterr().out
+    print_operations(operations_from_dicts(valid))
+    assert capsys.readouterr().out == expected
+    print_operations(operations_from_dicts(valid), limit=5)
+    assert capsys.readouterr().out == "".join(expected.splitlines(keepends=True)[:5])
+
+
+def test_query_accepts_records(dict_operations):
+    records = operations_from_dicts(dict_operations)
+    expected = Query(dict_operations).where_state("EXECUTED").where_currency("usd").to_list()
+    assert expected
+    assert Query(records).where_state("EXECUTED").where_currency("usd").to_list() == expected
+    proxies = [MappingProxyType(op) for op in dict_operations]
+    assert Query(proxies).where_state("EXECUTED").where_currency("usd").to_list() == expected
+
+
+def test_aggregate_accepts_records(dict_operations):
+    records = operations_from_dicts(dict_operations)
+    for by in ("currency", "state", "month", "description"):
+        assert aggregate_operations(records, by) == aggregate_operations(dict_operations, by)
+    expected = aggregate_operations(filter_by_currency(dict_operations, "USD"))
+    assert expected
+    assert aggregate_operations(filter_by_currency(records, "USD")) == expected
+    proxies = [MappingProxyType(op) for op in dict_operations]
+    assert aggregate_operations(proxies) == aggregate_operations(dict_operations)
+
+
+def test_index_accepts_records(dict_operations):
+    expected = OperationIndex(dict_operations).query("EXECUTED", "usd", "2019-01-01", "2020-01-01")
+    records = OperationIndex(operations_from_dicts(dict_operations))
+    assert records.query("EXECUTED", "usd", "2019-01-01", "2020-01-01") == expected
+    assert records.filter_by_currency("EUR") == OperationIndex(dict_operations).filter_by_currency("EUR")
+    proxies = OperationIndex(MappingProxyType(op) for op in dict_operations)
+    assert proxies.query("EXECUTED", "usd", "2019-01-01", "2020-01-01") == expected
+    with pytest.raises(TypeError):
+        records.add(["not", "a", "mapping"])
@@ -0,0 +1,28 @@
+# tests/test_package.py
+import os
+import subprocess
+import sys
+
+import pytest
+import src.pythonproject as package
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_masking_import_is_lightweight():
+    code = (
+        "import sys; import src.pythonproject as p; p.mask_account_card('Счет 73654108430135874305'); "
+        "print(sorted(m for m in ('typing', 'datetime', 'src.pythonproject.processing') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes():
+    from src.pythonproject import processing, widget
+    assert package.processing is processing
+    assert package.sort_by_date is processing.sort_by_date
+    assert package.print_operations is widget.print_operations
+    assert "filter_by_currency" in dir(package)
+    with pytest.raises(AttributeError):
+        package.no_such_name
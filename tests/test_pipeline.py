@@ -0,0 +1,99 @@
+# tests/test_pipeline.py
+from concurrent.futures import Future
+
+import pytest
+from src.pythonproject import pipeline
+from src.pythonproject.pipeline import print_operations_parallel, render_operations_parallel
+from src.pythonproject.widget import print_operations
+
+
+@pytest.fixture
+def report_operations():
+    states = ["EXECUTED", "CANCELED"]
+    descriptions = ["Visa Platinum 7000792289606361", "Счет 73654108430135874305", "Maestro 1596837868705199"]
+    return [
+        {
+            "id": i,
+            "state": states[i % 2],
+            # Повторяющиеся даты проверяют стабильность слияния
+            "date": f"2019-{i % 12 + 1:02d}-{i % 5 + 1:02d}T10:50:58.294041",
+            "description": descriptions[i % 3],
+        }
+        for i in range(60)
+    ]
+
+
+@pytest.mark.parametrize("workers,chunk_size", [(1, 7), (2, 7), (2, 1000)])
+def test_parallel_output_matches_print_operations(capsys, report_operations, workers, chunk_size):
+    print_operations(report_operations)
+    expected = capsys.readouterr().out
+    print_operations_parallel(report_operations, workers=workers, chunk_size=chunk_size)
+    assert capsys.readouterr().out == expected
+
+
+def test_parallel_state_filter(report_operations):
+    executed = [op for op in report_operations if op["state"] == "EXECUTED"]
+    assert list(render_operations_parallel(report_operations, workers=1, chunk_size=5, state="EXECUTED")) == \
+        list(render_operations_parallel(executed, workers=1, chunk_size=100))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_skips_invalid_operation_like_print_operations(capsys, caplog, sample_operations, workers):
+    operations = sample_operations + [{"id": 5, "date": "2019-01-01"}, ["not", "a", "dict"]]
+    print_operations(operations)
+    expected = capsys.readouterr().out
+    caplog.clear()
+    assert "\n".join(render_operations_parallel(operations, workers=workers, chunk_size=2)) + "\n" == expected
+    if workers == 1:
+        assert "id=4" in caplog.text and "id=5" in caplog.text and "#5" in caplog.text
+
+
+def test_parallel_reads_input_lazily(report_operations):
+    consumed = 0
+
+    def source():
+        nonlocal consumed
+        for op in report_operations * 100:
+            consumed += 1
+            yield op
+
+    lines = render_operations_parallel(source(), workers=1, chunk_size=10)
+    assert consumed == 0
+    assert len(list(lines)) == 6000
+    assert consumed == 6000
+
+
+def test_parallel_window_bounds_in_flight_chunks(monkeypatch, report_operations):
+    submitted = []
+
+    class RecordingExecutor:
+        def __init__(self, max_workers=None):
+            self.pending = 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            self.pending += 1
+            submitted.append(self.pending)
+
+            def result():
+                self.pending -= 1
+                return fn(*args)
+            future.result = result
+            return future
+
+    monkeypatch.setattr(pipeline, "ProcessPoolExecutor", RecordingExecutor)
+    lines = list(render_operations_parallel(report_operations * 10, workers=2, chunk_size=5))
+    assert len(lines) == 600
+    assert max(submitted) == pipeline.CHUNKS_IN_FLIGHT_PER_WORKER * 2
+
+
+@pytest.mark.parametrize("workers,chunk_size", [(0, 10), (1, 0)])
+def test_parallel_invalid_settings(workers, chunk_size):
+    with pytest.raises(ValueError):
+        list(render_operations_parallel([], workers=workers, chunk_size=chunk_size))
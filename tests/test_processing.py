@@ -1,7 +1,7 @@
 # tests/test_processing.py
 import pytest
 from datetime import datetime
-from src.pythonproject.processing import filter_by_state, sort_by_date
+from src.pythonproject.processing import filter_by_state, latest_operations, latest_operations_page, sort_by_date
 
 @pytest.fixture
 def sample_data():
@@ -41,3 +41,59 @@ def test_edge_cases():
         filter_by_state("not a list")
     with pytest.raises(TypeError):
         sort_by_date({"invalid": "data"})
+
+
+@pytest.fixture
+def many_operations():
+    states = ['EXECUTED', 'CANCELED', 'PENDING']
+    ops = [{'id': i, 'state': states[i % 3], 'date': f'2023-01-{i % 28 + 1:02d}'} for i in range(100)]
+    ops += [{'id': 100, 'state': 'EXECUTED', 'date': 'invalid-date'}, {'id': 101, 'state': 'EXECUTED'}]
+    return ops
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 40, 200])
+@pytest.mark.parametrize("state", [None, 'EXECUTED', 'CANCELED'])
+def test_latest_operations_matches_full_sort(many_operations, k, state):
+    filtered = many_operations if state is None else filter_by_state(many_operations, state)
+    assert latest_operations(many_operations, k, state) == sort_by_date(filtered)[:k]
+
+
+def test_latest_operations_accepts_iterator(many_operations):
+    assert latest_operations(iter(many_operations), 3) == sort_by_date(many_operations)[:3]
+
+
+def test_latest_operations_page(many_operations):
+    full = sort_by_date(filter_by_state(many_operations))
+    assert latest_operations_page(many_operations, 10, 5, 'EXECUTED') == full[10:15]
+    assert latest_operations_page(many_operations, 30, 10, 'EXECUTED') == full[30:40]
+    with pytest.raises(ValueError):
+        latest_operations_page(many_operations, -1, 5)
+
+
+def test_sort_by_date_strict_mode(many_operations):
+    valid = many_operations[:100]
+    assert sort_by_date(valid, errors="strict") == sort_by_date(valid)
+    with pytest.raises(ValueError, match="Неверный формат даты в операции 100"):
+        sort_by_date(many_operations, errors="strict")
+    with pytest.raises(KeyError, match="Операция 101 не содержит ключа 'date'"):
+        sort_by_date(valid + many_operations[101:], errors="strict")
+    with pytest.raises(ValueError):
+        sort_by_date(valid, errors="ignore")
+
+
+def test_legacy_module_uses_strict_core(many_operations):
+    from src import processing as legacy
+    assert legacy.sort_by_date(many_operations[:100], reverse=False) == sort_by_date(many_operations[:100], False)
+    assert legacy.filter_by_state(many_operations, 'CANCELED') == filter_by_state(many_operations, 'CANCELED')
+    assert legacy.sort_by_date([]) == [] and legacy.filter_by_state(None) == []
+    with pytest.raises(ValueError):
+        legacy.sort_by_date(many_operations)
+
+
+def test_legacy_module_accepts_any_iterable(many_operations):
+    from src import processing as legacy
+    valid = many_operations[:100]
+    assert legacy.filter_by_state(tuple(many_operations), 'CANCELED') == filter_by_state(many_operations, 'CANCELED')
+    assert legacy.filter_by_state(op for op in many_operations) == filter_by_state(many_operations)
+    assert legacy.sort_by_date(tuple(valid)) == sort_by_date(valid)
+    assert legacy.sort_by_date((op for op in valid), reverse=False) == sort_by_date(valid, False)
@@ -0,0 +1,72 @@
+# tests/test_query.py
+import pytest
+from src.pythonproject.generators import filter_by_currency, transaction_descriptions
+from src.pythonproject.processing import filter_by_state
+from src.pythonproject.query import Query
+
+
+@pytest.fixture
+def query_operations():
+    states = ["EXECUTED", "CANCELED", "PENDING"]
+    currencies = ["USD", "RUB", "EUR"]
+    ops = [
+        {
+            "id": i,
+            "state": states[i % 3],
+            "operationAmount": {"amount": f"{i}.00", "currency": {"code": currencies[i % 5 % 3]}},
+            "description": f"Перевод {i}",
+        }
+        for i in range(50)
+    ]
+    ops.append({"id": 50, "state": "EXECUTED", "operationAmount": {"currency": {"code": "USD"}}})
+    ops.append({"id": 51, "state": "EXECUTED", "operationAmount": None, "description": "Без суммы"})
+    return ops
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED"])
+@pytest.mark.parametrize("currency", ["USD", "rub"])
+def test_query_matches_chained_functions(query_operations, state, currency):
+    expected = list(transaction_descriptions(filter_by_currency(filter_by_state(query_operations, state), currency)))
+    query = Query(query_operations).where_state(state).where_currency(currency).select("description")
+    assert list(query) == expected
+    assert Query(query_operations).where_state(state).to_list() == filter_by_state(query_operations, state)
+
+
+def test_query_limit_short_circuits(query_operations):
+    seen = []
+
+    def source():
+        for op in query_operations:
+            seen.append(op["id"])
+            yield op
+
+    result = Query(source()).where_currency("USD").select("id").limit(2).to_list()
+    assert result == [0, 3]
+    assert seen == [0, 1, 2, 3]
+
+
+def test_query_is_immutable_and_reusable(query_operations):
+    base = Query(query_operations).where_state("EXECUTED")
+    usd = base.where_currency("USD")
+    assert base.count() == len(filter_by_state(query_operations))
+    assert usd.count() == usd.count() == len(list(filter_by_currency(filter_by_state(query_operations), "USD")))
+
+
+def test_query_conflicting_conditions(query_operations):
+    assert Query(query_operations).where_state("EXECUTED").where_state("CANCELED").to_list() == []
+    assert Query(query_operations).where_currency("USD").where_currency("EUR").count() == 0
+    assert Query(query_operations).where_state("EXECUTED").where_state("EXECUTED").count() == \
+        len(filter_by_state(query_operations))
+
+
+def test_query_where_and_multiple_fields(query_operations):
+    query = Query(query_operations + [None]).where(lambda op: op["id"] % 10 == 0).select("id", "description")
+    assert query.limit(3).limit(10).to_list() == [(0, "Перевод 0"), (10, "Перевод 10"), (20, "Перевод 20")]
+    assert Query(query_operations).limit(0).to_list() == []
+
+
+def test_query_invalid_arguments(query_operations):
+    with pytest.raises(ValueError):
+        Query(query_operations).select()
+    with pytest.raises(ValueError):
+        Query(query_operations).limit(-1)
@@ -0,0 +1,57 @@
+# tests/test_regression.py
+from benchmarks.dataset import generate_operations, operations_list
+from benchmarks import regression
+from benchmarks.regression import CALIBRATION, CASES, STREAM_CASES, compare, run
+from src.pythonproject.widget import mask_account_card
+
+
+def test_dataset_is_deterministic():
+    assert operations_list(200, seed=7) == operations_list(200, seed=7)
+    assert operations_list(200, seed=7) != operations_list(200, seed=8)
+
+
+def test_dataset_is_realistic():
+    ops = list(generate_operations(2000))
+    assert {op["state"] for op in ops} == {"EXECUTED", "CANCELED", "PENDING"}
+    assert {op["operationAmount"]["currency"]["code"] for op in ops} == {"RUB", "USD", "EUR"}
+    assert any(op["description"].startswith("Счет") for op in ops)
+    assert any(not op["description"].startswith("Счет") for op in ops)
+    assert any("from" not in op for op in ops)
+    assert 0 < sum(op["date"] == "invalid-date" for op in ops) < 100
+    for op in ops[:100]:
+        mask_account_card(op["description"])
+
+
+def test_compare_reports_only_slowdowns_over_threshold():
+    baseline = {"10": {"a": 1.0, "b": 1.0, "c": 1.0}}
+    current = {"10": {"a": 1.2, "b": 1.5, "c": 0.5, "new": 9.0}, "20": {"a": 5.0}}
+    assert compare(current, baseline, threshold=0.25) == [("10", "b", 1.0, 1.5)]
+
+
+def test_run_covers_every_case(capsys, monkeypatch):
+    monkeypatch.setattr(regression, "MIN_DURATION", 0.001)
+    results = run([50], repeat=1)
+    assert set(results["50"]) == set(CASES) | {CALIBRATION}
+    assert all(seconds >= 0 for seconds in results["50"].values())
+
+
+def test_run_streams_large_sizes(capsys, monkeypatch):
+    monkeypatch.setattr(regression, "MIN_DURATION", 0.001)
+    monkeypatch.setattr(regression, "LIST_LIMIT", 20)
+    monkeypatch.setattr(regression, "operations_list", None)
+    results = run([50], repeat=1)
+    assert set(results["50"]) == set(STREAM_CASES) | {CALIBRATION}
+
+
+def test_best_time_repeats_fast_calls(monkeypatch):
+    monkeypatch.setattr(regression, "MIN_DURATION", 0.01)
+    calls = []
+    seconds = regression._best_time(calls.append, None, repeat=2)
+    assert len(calls) > 100
+    assert 0 < seconds < 0.01
+
+
+def test_compare_scales_by_calibration():
+    baseline = {"10": {"a": 1.0, "_calibration": 1.0}}
+    assert compare({"10": {"a": 1.8, "_calibration": 2.0}}, baseline) == []
+    assert compare({"10": {"a": 1.4, "_calibration": 0.5}}, baseline) == [("10", "a", 0.5, 1.4)]
@@ -0,0 +1,105 @@
+# tests/test_report.py
+import contextlib
+import csv
+import io
+import json
+import logging
+
+import pytest
+from src.pythonproject.report import CSV_FIELDS, ReportStats, render_operations
+from src.pythonproject.widget import print_operations
+
+
+@pytest.fixture
+def report_operations():
+    return [
+        {
+            "id": 1,
+            "date": "2019-08-26T10:50:58.294041",
+            "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+            "description": "Счет 64686473678894779589",
+        },
+        {"id": 2, "date": "invalid-date", "description": "Visa 1234567890123456"},
+        {"id": 3, "date": "2018-06-30", "description": "Maestro 1596837868705199", "operationAmount": None},
+        {"id": 4, "date": "2018-06-30", "description": "Перевод организации"},
+        {"date": "2018-06-30"},
+        None,
+    ]
+
+
+class _CountingStream(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def test_text_format_skips_malformed(report_operations, caplog):
+    out = io.BytesIO()
+    with caplog.at_level(logging.WARNING, logger="src.pythonproject.report"):
+        stats = render_operations(report_operations, out)
+    assert stats == ReportStats(written=2, errors=4)
+    assert out.getvalue().decode().splitlines() == [
+        "26.08.2019 Счет **9589",
+        "30.06.2018 Maestro 1596 83** **** 5199",
+    ]
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 4
+    assert messages[0].startswith("Операция id=2 пропущена")
+    assert messages[-1].startswith("Операция #5 пропущена")
+
+
+def test_csv_format(report_operations):
+    out = io.BytesIO()
+    assert render_operations(report_operations, out, "csv") == ReportStats(2, 4)
+    rows = list(csv.reader(io.StringIO(out.getvalue().decode())))
+    assert rows == [
+        list(CSV_FIELDS),
+        ["1", "26.08.2019", "Счет **9589", "31957.58", "RUB"],
+        ["3", "30.06.2018", "Maestro 1596 83** **** 5199", "", ""],
+    ]
+
+
+def test_jsonl_format(report_operations):
+    out = io.BytesIO()
+    render_operations(report_operations, out, "jsonl")
+    records = [json.loads(line) for line in out.getvalue().decode().splitlines()]
+    assert records == [
+        {"id": 1, "date": "26.08.2019", "description": "Счет **9589", "amount": "31957.58", "currency": "RUB"},
+        {"id": 3, "date": "30.06.2018", "description": "Maestro 1596 83** **** 5199", "amount": None,
+         "currency": None},
+    ]
+
+
+def test_output_is_buffered():
+    operations = [{"date": "2019-08-26T10:50:58.294041", "description": "Счет 64686473678894779589"}] * 1000
+    out = _CountingStream()
+    assert render_operations(iter(operations), out).written == 1000
+    assert out.writes == 1
+    out = _CountingStream()
+    render_operations(operations, out, buffer_size=2300)
+    assert out.writes == 10
+    assert out.getvalue() == "26.08.2019 Счет **9589\n".encode() * 1000
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        render_operations([], io.BytesIO(), "xml")
+    with pytest.raises(ValueError):
+        render_operations([], io.BytesIO(), buffer_size=0)
+
+
+def test_print_operations_keeps_going(capsys, sample_operations):
+    stats = print_operations(sample_operations)
+    assert stats == ReportStats(written=3, errors=1)
+    assert capsys.readouterr().out.splitlines()[0].endswith("Visa 1234 56** **** 3456")
+
+
+def test_print_operations_to_text_stream(report_operations):
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        print_operations(report_operations, output_format="csv")
+    assert stream.getvalue().splitlines()[1] == "1,26.08.2019,Счет **9589,31957.58,RUB"
@@ -0,0 +1,82 @@
+# tests/test_sorted_log.py
+import random
+from datetime import datetime
+
+import pytest
+from src.pythonproject.processing import sort_by_date
+from src.pythonproject.sorted_log import MERGE_THRESHOLD, SortedOperationLog
+
+
+def _operations(count, seed=1):
+    rng = random.Random(seed)
+    operations = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            operation = {"id": i, "date": "invalid-date"}
+        elif roll < 0.08:
+            operation = {"id": i}
+        else:
+            # Малый разброс дат дает много совпадающих ключей
+            operation = {"id": i, "date": f"2023-01-{rng.randint(1, 9):02d}T10:00:00.00000{rng.randint(0, 2)}"}
+        operations.append(operation)
+    return operations
+
+
+@pytest.mark.parametrize("batch_size", [1, 5, MERGE_THRESHOLD, 500])
+def test_matches_sort_by_date(batch_size):
+    operations = _operations(1500)
+    log = SortedOperationLog()
+    added = []
+    for start in range(0, len(operations), batch_size):
+        batch = operations[start:start + batch_size]
+        log.extend(iter(batch))
+        added.extend(batch)
+        assert len(log) == len(added)
+    assert list(log) == sort_by_date(added)
+    assert log.to_list() == sort_by_date(added)
+    assert log.to_list(reverse=False) == sort_by_date(added, reverse=False)
+    assert list(log.oldest_first()) == sort_by_date(added, reverse=False)
+
+
+def test_append_matches_sort_by_date():
+    operations = _operations(300, seed=2)
+    log = SortedOperationLog()
+    for operation in operations:
+        log.append(operation)
+    assert log.to_list() == sort_by_date(operations)
+
+
+def test_latest():
+    operations = _operations(200, seed=3)
+    log = SortedOperationLog(operations)
+    assert log.latest(10) == sort_by_date(operations)[:10]
+    assert log.latest(1000) == sort_by_date(operations)
+    assert log.latest(0) == []
+
+
+def test_range():
+    operations = _operations(500, seed=4)
+    log = SortedOperationLog(operations)
+    expected = [op for op in sort_by_date(operations) if "2023-01-03" <= op.get("date", "") < "2023-01-05"]
+    assert log.range("2023-01-03", "2023-01-05") == expected
+    assert log.range(datetime(2023, 1, 3), "2023-01-05", reverse=False) == sort_by_date(expected, reverse=False)
+    assert log.range("2023-01-05", "2023-01-03") == []
+    dated = [op for op in sort_by_date(operations) if op.get("date", "invalid-date") != "invalid-date"]
+    assert log.range() == dated
+    with pytest.raises(ValueError):
+        log.range("not-a-date")
+
+
+def test_empty_log():
+    log = SortedOperationLog()
+    assert len(log) == 0
+    assert list(log) == [] and log.range() == [] and log.latest(3) == []
+
+
+def test_fresh_batches_extend_the_tail():
+    operations = sort_by_date(_operations(1000, seed=5), reverse=False)
+    log = SortedOperationLog()
+    for start in range(0, len(operations), 100):
+        log.extend(operations[start:start + 100])
+    assert log.to_list() == sort_by_date(operations)
@@ -0,0 +1,150 @@
+# tests/test_store.py
+import os
+import time
+
+import pytest
+from src.pythonproject import store as store_module
+from src.pythonproject.batch import MISSING
+from src.pythonproject.generators import filter_by_currency, transaction_descriptions
+from src.pythonproject.processing import filter_by_state, sort_by_date
+from src.pythonproject.store import OperationStore, write_store
+
+
+@pytest.fixture
+def bank_operations():
+    return [
+        {
+            "id": 441945886,
+            "state": "EXECUTED",
+            "date": "2019-08-26T10:50:58.294041",
+            "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+            "description": "Перевод организации",
+            "from": "Maestro 1596837868705199",
+            "to": "Счет 64686473678894779589"
+        },
+        {
+            "id": 41428829,
+            "state": "CANCELED",
+            "date": "2019-07-03T18:35:29.512364",
+            "operationAmount": {"amount": "8221.37", "currency": {"name": "USD", "code": "USD"}},
+            "description": "Перевод с карты на карту"
+        },
+        {"id": 3, "state": "EXECUTED", "date": "2023-01-01", "operationAmount": {"amount": "10", "currency": {}}},
+        {"id": "x-4", "state": "PENDING", "date": "invalid-date", "operationAmount": None, "description": ""},
+        {"state": "EXECUTED", "operationAmount": {"amount": "-0.05", "currency": {"code": "USD"}}},
+        {"id": 6, "date": "2018-06-30T02:08:58+03:00", "description": None},
+        {},
+    ]
+
+
+@pytest.fixture
+def store(bank_operations, tmp_path):
+    path = str(tmp_path / "ops.bin")
+    assert write_store(iter(bank_operations), path) == len(bank_operations)
+    with OperationStore(path) as opened:
+        yield opened
+
+
+def test_round_trip(store, bank_operations):
+    assert len(store) == len(bank_operations)
+    assert store.to_dicts() == bank_operations
+    assert list(store) == bank_operations
+    assert store.to_dict(-1) == {}
+    with pytest.raises(IndexError):
+        store.to_dict(len(bank_operations))
+
+
+def test_columns_are_views(store):
+    assert isinstance(store.dates, memoryview)
+    assert store.ids[0] == 441945886
+    assert store.ids[3] == MISSING
+    assert store.amounts[4] == -5
+    assert store.state_values[store.states[1]] == "CANCELED"
+    assert store.currency_values[store.currencies[0]] == "RUB"
+
+
+def test_descriptions(store):
+    assert store.description(0) == "Перевод организации"
+    assert store.description(3) == ""
+    assert store.description(5) is None
+    assert list(transaction_descriptions(store)) == ["Перевод организации", "Перевод с карты на карту", ""]
+    assert list(store.descriptions([1, 5])) == ["Перевод с карты на карту"]
+
+
+def test_processing_and_generators_accept_store(store, bank_operations):
+    assert store.to_dicts(filter_by_state(store)) == filter_by_state(bank_operations)
+    assert store.to_dicts(filter_by_state(store, "UNKNOWN")) == []
+    assert store.to_dicts(sort_by_date(store)) == sort_by_date(bank_operations)
+    assert store.to_dicts(sort_by_date(store, reverse=False)) == sort_by_date(bank_operations, reverse=False)
+    assert store.to_dicts(filter_by_currency(store, "usd")) == list(filter_by_currency(bank_operations, "usd"))
+
+
+def test_empty_store(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    assert write_store([], path) == 0
+    with OperationStore(path) as store:
+        assert len(store) == 0
+        assert store.to_dicts() == []
+        assert list(sort_by_date(store)) == []
+
+
+def test_close_is_idempotent(store):
+    dates = store.dates
+    store.close()
+    store.close()
+    with pytest.raises(ValueError):
+        dates[0]
+
+
+def test_close_with_held_slices(store):
+    dates = store.dates[0:2]
+    ids = store.ids
+    expected = list(dates)
+    store.close()
+    assert list(dates) == expected
+    with pytest.raises(ValueError):
+        store.dates[0]
+    del dates, ids
+    store.close()
+
+
+def test_columns_are_little_endian_on_any_host(monkeypatch, bank_operations, tmp_path):
+    path = str(tmp_path / "swapped.bin")
+    monkeypatch.setattr(store_module, "_BYTESWAP", True)
+    write_store(bank_operations, path)
+    with OperationStore(path) as swapped:
+        assert swapped.to_dicts() == bank_operations
+    monkeypatch.setattr(store_module, "_BYTESWAP", False)
+    with OperationStore(path) as native:
+        assert native.ids[0] != bank_operations[0]["id"]
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "ops.json"
+    path.write_bytes(b"[]" * 200)
+    with pytest.raises(ValueError):
+        OperationStore(str(path))
+
+
+def test_rejects_non_dict(tmp_path):
+    with pytest.raises(TypeError):
+        write_store(["not an operation"], str(tmp_path / "ops.bin"))
+
+
+def test_open_time_does_not_depend_on_size(tmp_path):
+    operation = {"id": 1, "state": "EXECUTED", "date": "2019-08-26T10:50:58.294041", "description": "Перевод"}
+    small, large = str(tmp_path / "small.bin"), str(tmp_path / "large.bin")
+    write_store([operation], small)
+    write_store([operation] * 200_000, large)
+    assert os.path.getsize(large) > 1000 * os.path.getsize(small)
+
+    def open_time(path):
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            OperationStore(path).close()
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    assert open_time(large) < 0.01
+    assert open_time(large) < open_time(small) * 20 + 0.001
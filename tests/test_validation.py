@@ -0,0 +1,80 @@
+# tests/test_validation.py
+import random
+
+import pytest
+from src.pythonproject.validation import (ACCOUNT, BAD_LENGTH, CARD, LUHN_FAILED, MALFORMED, NON_DIGIT,
+                                          RESULT_NAMES, mask_descriptions_bulk, validate_descriptions)
+from src.pythonproject.widget import mask_account_card
+
+
+def _luhn_ok(number):
+    total = 0
+    for position, digit in enumerate(reversed(number)):
+        value = int(digit) * (2 if position % 2 else 1)
+        total += value - 9 if value > 9 else value
+    return total % 10 == 0
+
+
+@pytest.mark.parametrize("text, code", [
+    ("Visa Platinum 4111111111111111", CARD),
+    ("Visa Platinum 4111111111111112", LUHN_FAILED),
+    ("Maestro 159683786870519", BAD_LENGTH),
+    ("МИР 1234x67890123456", NON_DIGIT),
+    ("Visa ４１１１１１１１１１１１１１１１", NON_DIGIT),
+    ("Счет 64686473678894779589", ACCOUNT),
+    ("СЧЕТ 1234", ACCOUNT),
+    ("Счет 123", BAD_LENGTH),
+    ("Счет 12ab", NON_DIGIT),
+    ("Перевод организации", NON_DIGIT),
+    ("Invalid", MALFORMED),
+    ("Счет ", MALFORMED),
+    ("", MALFORMED),
+    (None, MALFORMED),
+    (1234567890123456, MALFORMED),
+])
+def test_result_codes(text, code):
+    report = validate_descriptions([text])
+    assert list(report.codes) == [code]
+    assert report.counts()[RESULT_NAMES[code]] == 1
+
+
+def test_luhn_matches_reference():
+    rng = random.Random(5)
+    numbers = [f"{rng.randrange(10 ** 16):016d}" for _ in range(3000)]
+    report = validate_descriptions(f"Visa {number}" for number in numbers)
+    assert [code == CARD for code in report.codes] == [_luhn_ok(number) for number in numbers]
+    assert report.counts()["card"] + report.counts()["luhn_failed"] == len(numbers)
+
+
+def test_luhn_can_be_disabled():
+    assert list(validate_descriptions(["Visa 4111111111111112"], luhn=False).codes) == [CARD]
+
+
+def test_mask_matches_mask_account_card(sample_account_strings):
+    rng = random.Random(7)
+    descriptions = list(sample_account_strings) + [None, "", "Счет ", "Visa 1234x67890123456"]
+    for _ in range(500):
+        prefix = rng.choice(["Visa Platinum", "Maestro", "Счет", "счет списания", "МИР"])
+        descriptions.append(f"{prefix} {rng.randrange(10 ** rng.randint(1, 20))}")
+    masked, codes = mask_descriptions_bulk(descriptions)
+    assert len(masked) == len(codes) == len(descriptions)
+    for text, result in zip(descriptions, masked):
+        try:
+            expected = mask_account_card(text)
+        except (ValueError, TypeError):
+            expected = ""
+        assert result == expected
+
+
+def test_report_rows_and_mask_skip_errors():
+    report = validate_descriptions(["Visa 4111111111111112", "Счет 73654108430135874305", "bad", "Счет 1"])
+    assert list(report.rows(ACCOUNT)) == [1]
+    assert list(report.rows(BAD_LENGTH)) == [3]
+    assert list(report.rows(CARD)) == []
+    assert report.mask() == ["", "Счет **4305", "", ""]
+    assert len(report) == 4
+
+
+def test_empty_input():
+    report = validate_descriptions([])
+    assert len(report) == 0 and report.mask() == [] and set(report.counts().values()) == {0}
@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-from src.pythonproject.widget import mask_account_card, get_date
+from src.pythonproject.widget import mask_account_card, get_date, print_operations
 
 @pytest.fixture
 def sample_account_strings():
@@ -67,3 +67,15 @@ def test_mask_account_card_error_message():
     with pytest.raises(ValueError, match="Неверный формат входных данных"):
         mask_account_card("Invalid")
 
+
+def test_print_operations_limit(capsys):
+    operations = [
+        {"date": "2019-07-03T18:35:29.512364", "description": "Visa 1234567890123456"},
+        {"date": "2019-08-26T10:50:58.294041", "description": "Счет 64686473678894779589"},
+        {"date": "2018-06-30T02:08:58.425572", "description": "Maestro 1596837868705199"},
+    ]
+    print_operations(operations, limit=2)
+    assert capsys.readouterr().out.splitlines() == [
+        "26.08.2019 Счет **9589",
+        "03.07.2019 Visa 1234 56** **** 3456",
+    ]